@@ -6,22 +6,29 @@
 接口说明：
 - 路由: GET /audio/{filename}
 - 功能: 提供音频文件的直接访问
-- 支持: WAV格式音频文件流式返回
+- 支持: WAV格式音频文件流式返回，支持 Range 请求（206 Partial Content）
+- 支持: ETag/Last-Modified 条件请求（304 Not Modified）
 
 依赖说明：
 - 支持音频文件的流式传输
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+import re
+from fastapi import APIRouter, HTTPException, Depends, Request
 from app.dependencies import get_audio_service
 from app.application.audio_service import AudioService
 
 router = APIRouter()
 
+# 文件名只允许字母、数字、点、下划线和连字符，排除路径分隔符与 NUL
+_INVALID_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
 
 @router.get("/audio/{filename}", summary="获取音频文件", tags=["Audio"])
 async def get_audio_file(
-    filename: str, audio_service: AudioService = Depends(get_audio_service)
+    filename: str,
+    request: Request,
+    audio_service: AudioService = Depends(get_audio_service),
 ):
     """
     获取音频文件
@@ -31,12 +38,18 @@ async def get_audio_file(
     if not filename:
         raise HTTPException(status_code=400, detail="Filename is required")
 
+    # 在任何文件 I/O 之前拒绝非法字符
+    if _INVALID_FILENAME_CHARS.search(filename):
+        raise HTTPException(status_code=400, detail="Invalid filename")
+
     # 检查文件扩展名
     if not filename.endswith(".wav"):
         # 对于不支持的格式，抛出HTTP异常
         raise HTTPException(status_code=400, detail="Only WAV files are supported")
     # 委托给Audio应用服务获取音频文件
-    file_response = await audio_service.get_audio_file(filename)
+    file_response = await audio_service.get_audio_file(
+        filename, request_headers=request.headers
+    )
     if not file_response:
         raise HTTPException(status_code=404, detail="Audio file not found")
 
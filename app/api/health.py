@@ -13,11 +13,13 @@
 - 无外部依赖，仅返回静态响应
 """
 
-from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Response, status
 
 router = APIRouter()
 
+# 健康检查响应体为静态内容，导入时预先序列化，探针请求无需重复 json.dumps
+_OK = b'{"code":200,"message":"OK"}'
+
 
 @router.get(
     "/health", summary="健康检查", tags=["Health"], status_code=status.HTTP_200_OK
@@ -28,5 +30,4 @@ async def health_check():
     - 返回 HealthResponse 格式，包含 code 和 message 字段
     - 目前仅返回静态 OK 状态
     """
-    resp = {"code": 200, "message": "OK"}
-    return JSONResponse(status_code=200, content=resp)
+    return Response(content=_OK, media_type="application/json", status_code=200)
@@ -17,16 +17,26 @@
 - 依赖 get_db_conn 进行数据库连接注入
 """
 
-from fastapi import APIRouter, status, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Response, status, HTTPException, Depends
 from typing import Optional
 from app.models import oc8r
 from app.dependencies import get_tts_service
-from app.application.tts_service import TtsService
+from app.application.tts_service import TtsService, QueueFullError
+from app.config import QUEUE_RETRY_AFTER_SECONDS
+from app.util.cursor import encode_cursor
 
 router = APIRouter()
 
 
+def _queue_full_exception() -> HTTPException:
+    """队列已满时返回 503，并通过 Retry-After 提示重试间隔"""
+    return HTTPException(
+        status_code=503,
+        detail="Task queue is full, please retry later",
+        headers={"Retry-After": str(QUEUE_RETRY_AFTER_SECONDS)},
+    )
+
+
 @router.post(
     "/tts/jobs",
     summary="提交 TTS 任务（入队）",
@@ -48,8 +58,11 @@ async def create_tts_job(
 
         # 构建响应
         resp = oc8r.TtsJobResponse(code=202, message="Job queued", job=job)
-        return JSONResponse(status_code=202, content=resp.model_dump(mode="json"))
+        return resp
 
+    except QueueFullError as e:
+        # 队列已满，提示客户端稍后重试
+        raise _queue_full_exception() from e
     except ValueError as e:
         # 业务逻辑错误，如音色不存在
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -62,7 +75,8 @@ async def create_tts_job(
     "/tts/jobs/{job_id}",
     summary="查询 TTS 任务（占位）",
     tags=["TTS Jobs"],
-    response_model=oc8r.TtsJobResponse,
+    response_model=None,
+    responses={200: {"model": oc8r.TtsJobResponse}},
     status_code=status.HTTP_200_OK,
 )
 async def get_tts_job(job_id: str, tts_service: TtsService = Depends(get_tts_service)):
@@ -76,31 +90,47 @@ async def get_tts_job(job_id: str, tts_service: TtsService = Depends(get_tts_ser
         raise HTTPException(status_code=404, detail="Job not found")
 
     resp = oc8r.TtsJobResponse(code=200, message="Job found", job=job)
-    return JSONResponse(status_code=200, content=resp.model_dump(mode="json"))
+    return Response(content=resp.model_dump_json(), media_type="application/json")
 
 
 @router.get(
     "/tts/jobs",
     summary="查询 TTS 任务",
     tags=["TTS Jobs"],
-    response_model=oc8r.TtsJobListResponse,
+    response_model=None,
+    responses={200: {"model": oc8r.TtsJobListResponse}},
     status_code=status.HTTP_200_OK,
 )
 async def list_tts_jobs(
     job_status: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
+    cursor: Optional[str] = None,
     tts_service: TtsService = Depends(get_tts_service),
 ):
     """
     查询 TTS 任务
     - 委托给TTS应用服务处理业务逻辑
+    - 支持 cursor 键集分页，响应中的 nextCursor 用于获取下一页
     """
-    # 委托给TTS应用服务获取任务列表
-    jobs = await tts_service.list_jobs(status=job_status, limit=limit, offset=offset)
+    try:
+        # 委托给TTS应用服务获取任务列表
+        jobs = await tts_service.list_jobs(
+            status=job_status, limit=limit, offset=offset, cursor=cursor
+        )
+    except ValueError as e:
+        # 游标无效
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    next_cursor = None
+    if jobs and len(jobs) == limit:
+        next_cursor = encode_cursor(jobs[-1].createdAt, jobs[-1].id)
 
-    resp = oc8r.TtsJobListResponse(code=200, message="Jobs found", jobs=jobs)
-    return JSONResponse(status_code=200, content=resp.model_dump(mode="json"))
+    # 任务对象已由仓储层校验，直接构造响应避免逐项重复校验
+    resp = oc8r.TtsJobListResponse.model_construct(
+        code=200, message="Jobs found", jobs=jobs, nextCursor=next_cursor
+    )
+    return Response(content=resp.model_dump_json(), media_type="application/json")
 
 
 @router.post(
@@ -126,7 +156,7 @@ async def cancel_tts_job(
         resp = oc8r.TtsJobResponse(
             code=200, message="Job cancelled successfully", job=job
         )
-        return JSONResponse(status_code=200, content=resp.model_dump(mode="json"))
+        return resp
 
     except HTTPException as e:
         raise e
@@ -161,10 +191,13 @@ async def retry_tts_job(
         resp = oc8r.TtsJobResponse(
             code=201, message="Job retry created successfully", job=job
         )
-        return JSONResponse(status_code=201, content=resp.model_dump(mode="json"))
+        return resp
 
     except HTTPException as e:
         raise e
+    except QueueFullError as e:
+        # 队列已满，提示客户端稍后重试
+        raise _queue_full_exception() from e
     except ValueError as e:
         # 业务逻辑错误，如任务状态不允许重试
         raise HTTPException(status_code=400, detail=str(e)) from e
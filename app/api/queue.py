@@ -1,31 +1,35 @@
 """
 文件级注释：
 本模块负责实现 /queue/status 队列状态查询接口，属于接口层（Interface Layer）。
-当前为静态占位实现，返回固定的队列状态信息，后续可对接实际队列管理逻辑。
+队列状态由应用层短时缓存，接口层按状态对象缓存序列化后的响应体，高频轮询时无需重复序列化。
 
 接口说明：
 - 路由: GET /queue/status
 - 响应: QueueStatusResponse（见 app/models/oc8r.py）
-- 当前返回 maxConcurrency=1，queueLength=0，runningJobId=None，averageWaitSeconds=None
+- maxConcurrency 为工作器数量（QUEUE_CONCURRENCY），runningJobId 为最早开始的运行中任务
 
 依赖说明：
 - 依赖 oc8r.QueueStatusResponse/QueueStatus 组装响应体
 """
 
-from fastapi import APIRouter, status, Depends
-from fastapi.responses import JSONResponse
+from typing import Optional, Tuple
+from fastapi import APIRouter, Response, status, Depends
 from app.models import oc8r
 from app.dependencies import get_queue_service
 from app.application.queue_service import QueueService
 
 router = APIRouter()
 
+# (队列状态对象, 序列化后的响应体)
+_body_cache: Optional[Tuple[oc8r.QueueStatus, bytes]] = None
+
 
 @router.get(
     "/queue/status",
     summary="查询队列状态",
     tags=["Queue"],
-    response_model=oc8r.QueueStatusResponse,
+    response_model=None,
+    responses={200: {"model": oc8r.QueueStatusResponse}},
     status_code=status.HTTP_200_OK,
 )
 async def get_queue_status(
@@ -35,8 +39,15 @@ async def get_queue_status(
     查询队列状态接口
     - 委托给Queue应用服务处理业务逻辑
     """
+    global _body_cache
     # 委托给Queue应用服务获取队列状态
     status_obj = await queue_service.get_status()
 
-    resp = oc8r.QueueStatusResponse(code=200, message="OK", status=status_obj)
-    return JSONResponse(status_code=200, content=resp.model_dump())
+    cached = _body_cache
+    if cached is not None and cached[0] is status_obj:
+        body = cached[1]
+    else:
+        resp = oc8r.QueueStatusResponse(code=200, message="OK", status=status_obj)
+        body = resp.model_dump_json().encode()
+        _body_cache = (status_obj, body)
+    return Response(content=body, media_type="application/json")
@@ -14,7 +14,6 @@
 """
 
 from fastapi import APIRouter, UploadFile, File, status, Depends, HTTPException
-from fastapi.responses import JSONResponse
 from app.models import oc8r
 from app.dependencies import get_upload_service
 from app.application.upload_service import UploadService
@@ -43,15 +42,13 @@ async def upload_file(
                 status_code=415, detail="Only audio files are supported"
             )
 
-        if file.size is not None and file.size > 20 * 1024 * 1024:
-            raise HTTPException(status_code=413, detail="File too large")
-
+        # 大小上限由存储层在流式写盘时校验，超限返回 413
         # 委托给Upload应用服务上传文件
         upload = await upload_service.upload_file(file)
 
         # 构建响应
         resp = oc8r.UploadResponse(code=201, message="Upload succeeded", upload=upload)
-        return JSONResponse(status_code=201, content=resp.model_dump())
+        return resp
 
     except HTTPException as e:
         raise e
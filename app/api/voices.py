@@ -6,7 +6,8 @@
 
 接口说明：
 - POST   /voices           ：创建 Voice，校验 uploadId 存在、名称去重
-- GET    /voices           ：分页查询 Voice（占位实现）
+- POST   /voices:batch     ：批量创建 Voice，整批校验后在同一事务中写入
+- GET    /voices           ：分页查询 Voice（支持 offset 与 cursor 键集分页）
 - GET    /voices/{id}      ：查询单个 Voice
 - DELETE /voices/{id}      ：删除 Voice
 
@@ -17,11 +18,12 @@
 - 依赖 get_db_conn 进行数据库连接注入
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends, Query
-from fastapi.responses import JSONResponse
+from typing import List, Optional
+from fastapi import APIRouter, Response, HTTPException, status, Depends, Query
 from app.models import oc8r
 from app.dependencies import get_voice_service
 from app.application.voice_service import VoiceService
+from app.util.cursor import encode_cursor
 
 router = APIRouter()
 
@@ -47,7 +49,34 @@ async def create_voice(
 
         # 构建响应
         resp = oc8r.VoiceResponse(code=201, message="Voice created", voice=voice)
-        return JSONResponse(status_code=201, content=resp.model_dump())
+        return resp
+
+    except ValueError as e:
+        # 业务逻辑错误，如音色名称重复或uploadId不存在
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception:
+        # 其他系统错误
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post(
+    "/voices:batch",
+    summary="批量创建 Voice",
+    tags=["Voices"],
+    response_model=oc8r.VoiceListResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_voices_batch(
+    body: List[oc8r.CreateVoiceRequest],
+    voice_service: VoiceService = Depends(get_voice_service),
+):
+    """
+    批量创建 Voice
+    - 委托给Voice应用服务处理业务逻辑，任一音色校验失败则整批不创建
+    """
+    try:
+        voices = await voice_service.create_voices_bulk(body)
+        return oc8r.VoiceListResponse(code=201, message="Voices created", voices=voices)
 
     except ValueError as e:
         # 业务逻辑错误，如音色名称重复或uploadId不存在
@@ -61,29 +90,46 @@ async def create_voice(
     "/voices",
     summary="分页查询 Voice",
     tags=["Voices"],
-    response_model=oc8r.VoiceListResponse,
+    response_model=None,
+    responses={200: {"model": oc8r.VoiceListResponse}},
 )
 async def list_voices(
     limit: int = Query(100, ge=0),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     voice_service: VoiceService = Depends(get_voice_service),
 ):
     """
     分页查询 Voice
     - 委托给Voice应用服务处理业务逻辑
+    - 支持 cursor 键集分页，响应中的 nextCursor 用于获取下一页
     """
-    # 委托给Voice应用服务获取音色列表
-    voices = await voice_service.list_voices(offset=offset, limit=limit)
+    try:
+        # 委托给Voice应用服务获取音色列表
+        voices = await voice_service.list_voices(
+            offset=offset, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        # 游标无效
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    next_cursor = None
+    if voices and len(voices) == limit:
+        next_cursor = encode_cursor(voices[-1].createdAt, voices[-1].id)
 
-    resp = oc8r.VoiceListResponse(code=200, message="Success", voices=voices)
-    return resp
+    # 音色对象已由仓储层校验，直接构造响应避免逐项重复校验
+    resp = oc8r.VoiceListResponse.model_construct(
+        code=200, message="Success", voices=voices, nextCursor=next_cursor
+    )
+    return Response(content=resp.model_dump_json(), media_type="application/json")
 
 
 @router.get(
     "/voices/{voice_id}",
     summary="查询单个 Voice",
     tags=["Voices"],
-    response_model=oc8r.VoiceResponse,
+    response_model=None,
+    responses={200: {"model": oc8r.VoiceResponse}},
 )
 async def get_voice(
     voice_id: str, voice_service: VoiceService = Depends(get_voice_service)
@@ -98,7 +144,7 @@ async def get_voice(
         raise HTTPException(status_code=404, detail="Voice not found")
 
     resp = oc8r.VoiceResponse(code=200, message="Success", voice=voice)
-    return resp
+    return Response(content=resp.model_dump_json(), media_type="application/json")
 
 
 @router.delete(
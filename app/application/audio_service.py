@@ -3,6 +3,7 @@ Audio应用服务
 
 处理音频文件访问相关的业务协调，包括：
 - 获取音频文件
+- 缓存文件元数据（大小、修改时间），生成 ETag/Last-Modified 并处理条件请求
 
 职责：
 - 协调领域对象和基础设施层
@@ -10,9 +11,20 @@ Audio应用服务
 - 不包含具体的业务逻辑
 """
 
-from typing import Optional
-from fastapi.responses import FileResponse
+import os
+import time
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Mapping, Optional, Tuple
+
+from fastapi import Response
 from app.application.file_service import FileService
+from app.infra.io_pool import run_io
+from app.infra.responses import AudioFileResponse
+
+# 文件元数据缓存的有效期（秒）与最大条目数
+STAT_CACHE_TTL = 2.0
+STAT_CACHE_MAX_ENTRIES = 1024
 
 
 class AudioService:
@@ -31,25 +43,96 @@ class AudioService:
             file_service: 文件处理服务
         """
         self.file_service = file_service
+        # filename -> (过期时间, 文件路径, stat 结果)，按访问顺序淘汰
+        # 只在事件循环线程中访问，字典操作无需额外加锁
+        self._stat_cache: "OrderedDict[str, Tuple[float, str, os.stat_result]]" = (
+            OrderedDict()
+        )
 
-    async def get_audio_file(self, filename: str) -> Optional[FileResponse]:
+    async def get_audio_file(
+        self, filename: str, request_headers: Optional[Mapping[str, str]] = None
+    ) -> Optional[Response]:
         """
         获取音频文件
 
         Args:
             filename: 音频文件名
+            request_headers: 请求头，用于处理 If-None-Match/If-Modified-Since
 
         Returns:
-            FileResponse: 音频文件响应，如果文件不存在则返回None
+            音频文件响应（200/206/304），如果文件不存在则返回None
+        """
+        cached = await self._get_file_stat(filename)
+        if cached is None:
+            return None
+        file_path, st = cached
+        headers = request_headers or {}
+
+        etag = f'W/"{st.st_size:x}-{st.st_mtime_ns:x}"'
+        validators = {
+            "ETag": etag,
+            "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+            "Cache-Control": "public, max-age=3600",
+        }
+        if self._is_not_modified(headers, etag, st):
+            return Response(status_code=304, headers=validators)
+
+        # 返回文件响应：Range/If-Range 由 FileResponse 按上面的校验器处理（206/416），
+        # 整文件请求在服务器支持时走零拷贝 sendfile
+        return AudioFileResponse(
+            path=file_path,
+            media_type="audio/wav",
+            filename=filename,
+            stat_result=st,
+            headers=validators,
+        )
+
+    async def _get_file_stat(
+        self, filename: str
+    ) -> Optional[Tuple[str, os.stat_result]]:
         """
+        获取文件路径与元数据，TTL 内复用缓存，避免每次请求都执行 stat
+
+        Returns:
+            (文件路径, stat 结果)，文件不存在时返回None
+        """
+        now = time.monotonic()
+        entry = self._stat_cache.get(filename)
+        if entry is not None and entry[0] > now:
+            self._stat_cache.move_to_end(filename)
+            return entry[1], entry[2]
+
         try:
             # 委托给文件服务获取文件路径
             file_path = await self.file_service.get_audio_file_path(filename)
-
-            # 返回文件响应
-            return FileResponse(
-                path=file_path, media_type="audio/wav", filename=filename
-            )
+            st = await run_io(os.stat, file_path)
         except FileNotFoundError:
             # 文件不存在，返回None
+            self._stat_cache.pop(filename, None)
             return None
+
+        self._stat_cache[filename] = (now + STAT_CACHE_TTL, file_path, st)
+        self._stat_cache.move_to_end(filename)
+        if len(self._stat_cache) > STAT_CACHE_MAX_ENTRIES:
+            self._stat_cache.popitem(last=False)
+        return file_path, st
+
+    @staticmethod
+    def _is_not_modified(
+        headers: Mapping[str, str], etag: str, st: os.stat_result
+    ) -> bool:
+        """根据 If-None-Match / If-Modified-Since 判断是否可以返回 304"""
+        if_none_match = headers.get("if-none-match")
+        if if_none_match is not None:
+            # 弱比较：忽略 W/ 前缀
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or etag.removeprefix("W/") in tags
+
+        if_modified_since = headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(st.st_mtime) <= since
+        return False
@@ -2,7 +2,7 @@
 文件处理应用服务
 
 负责处理文件相关的业务逻辑，包括：
-- 音频文件保存
+- 音频文件流式保存
 - 文件路径生成
 - 文件访问控制
 
@@ -14,7 +14,7 @@
 
 import uuid
 import logging
-from typing import Dict, Any, Optional
+from typing import AsyncIterable, Dict, Any, Optional
 from app.infra.storage import LocalFileStorage
 
 logger = logging.getLogger(__name__)
@@ -41,42 +41,45 @@ class FileService:
         self.storage = storage
         self.base_url = base_url.rstrip("/")
 
-    async def save_audio_result(
-        self, audio_data: bytes, job_id: Optional[str] = None
+    async def save_audio_result_stream(
+        self, chunks: AsyncIterable[bytes], job_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        保存音频结果 - 业务逻辑
+        流式保存音频结果 - 业务逻辑
+
+        音频数据边接收边写盘，不在内存中拼接完整文件。
 
         Args:
-            audio_data: 音频数据
-            job_id: 任务ID，如果为None则生成新的UUID
+            chunks: 音频数据块的异步迭代器
+            job_id: 任务ID，用作文件名；为None时生成随机文件名
 
         Returns:
             Dict[str, Any]: 保存结果，包含audioUrl等信息
         """
-        try:
-            # 生成文件名 - 业务逻辑
-            if job_id:
-                output_filename = f"{job_id}.wav"
-            else:
-                output_filename = f"{uuid.uuid4()}.wav"
+        output_filename = self._output_filename(job_id)
 
-            # 委托给存储服务保存文件
-            file_path = await self.storage.save_audio_file(audio_data, output_filename)
+        # 委托给存储服务流式保存文件
+        file_path = await self.storage.save_audio_stream(chunks, output_filename)
 
-            # 构建返回结果 - 业务逻辑
-            result = {
-                "audioUrl": f"{self.base_url}/api/v1/audio/{output_filename}",
-                "durationSeconds": None,  # 规范中没有duration字段
-                "format": "wav",
-            }
+        logger.info("Audio file saved: %s", file_path)
+        return self._build_result(output_filename)
 
-            logger.info("Audio file saved: %s", file_path)
-            return result
+    @staticmethod
+    def _output_filename(job_id: Optional[str]) -> str:
+        """
+        生成输出文件名 - 业务逻辑
+        """
+        return f"{job_id or uuid.uuid4().hex}.wav"
 
-        except Exception as e:
-            logger.error("Failed to save audio file: %s", str(e))
-            raise
+    def _build_result(self, output_filename: str) -> Dict[str, Any]:
+        """
+        构建返回结果 - 业务逻辑
+        """
+        return {
+            "audioUrl": f"{self.base_url}/api/v1/audio/{output_filename}",
+            "durationSeconds": None,  # 规范中没有duration字段
+            "format": "wav",
+        }
 
     async def get_audio_file_path(self, filename: str) -> str:
         """
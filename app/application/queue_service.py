@@ -3,7 +3,8 @@ Queue应用服务
 
 处理队列相关的业务协调，包括：
 - 查询队列状态
-- 启动和停止队列处理
+- 启动和停止队列处理（多个工作器共享同一队列并发消费）
+- 取消运行中的任务时中断其执行，不回写成功/失败状态
 - 协调队列和业务处理器
 
 职责：
@@ -15,12 +16,17 @@ Queue应用服务
 
 import asyncio
 import logging
-from typing import Optional, Any, Callable
+import time
+from typing import List, Optional, Any, Callable, Tuple
 from app.models.oc8r import QueueStatus, JobStatus
 from app.infra.queue import QueueManager
+from app.config import QUEUE_CONCURRENCY
 
 logger = logging.getLogger(__name__)
 
+# 队列状态缓存有效期（秒），轮询方在该时间窗口内共享同一个状态对象
+STATUS_CACHE_TTL = 0.2
+
 
 class QueueWorker:
     """
@@ -52,23 +58,50 @@ class QueueWorker:
             task_id = task["id"]
             payload = task["payload"]
             try:
-                if (
-                    self.queue_manager.status(task_id).get("status")
-                    == JobStatus.cancelled
-                ):
+                if self.queue_manager.is_cancelled(task_id):
+                    # 任务已出队，之后不会再更新，移除其内存状态
+                    self.queue_manager.forget(task_id)
                     continue
-                self.queue_manager.current_task_id = task_id
+                self.queue_manager.mark_running(task_id)
                 await self.queue_manager.set_status(task_id, JobStatus.running)
-                result = await self.handler(payload)
+                # 在独立任务中执行，取消运行中的任务时只中断该任务，不影响工作器
+                job = asyncio.ensure_future(self.handler(payload))
+                self.queue_manager.mark_running(task_id, job)
+                try:
+                    result = await job
+                except asyncio.CancelledError:
+                    # 工作器本身被取消（停止处理）时向上传播
+                    if asyncio.current_task().cancelling():
+                        raise
+                    logger.info("Task %s cancelled while running", task_id)
+                    self.queue_manager.forget(task_id)
+                    continue
+                if self.queue_manager.is_cancelled(task_id):
+                    # 合成完成前已被取消，保留已持久化的取消状态，移除内存状态
+                    self.queue_manager.forget(task_id)
+                    continue
                 await self.queue_manager.set_status(
                     task_id, JobStatus.succeeded, result
                 )
 
             except Exception as e:
                 logger.error("Task processing failed: %s", str(e))
-                await self.queue_manager.set_status(task_id, JobStatus.failed, str(e))
+                if self.queue_manager.is_cancelled(task_id):
+                    self.queue_manager.forget(task_id)
+                else:
+                    try:
+                        await self.queue_manager.set_status(
+                            task_id, JobStatus.failed, str(e)
+                        )
+                    except Exception as persist_error:
+                        # 状态写库失败（如数据库异常）时保持工作器继续消费
+                        logger.error(
+                            "Failed to persist failed status for task %s: %s",
+                            task_id,
+                            persist_error,
+                        )
             finally:
-                self.queue_manager.current_task_id = None
+                self.queue_manager.mark_finished(task_id)
                 self.queue_manager.queue.task_done()
 
     def stop(self):
@@ -86,33 +119,52 @@ class QueueService:
     作为接口层和领域层之间的桥梁，只做业务协调，不包含具体业务逻辑。
     """
 
-    def __init__(self, queue_manager: QueueManager, tts_processor):
+    def __init__(
+        self,
+        queue_manager: QueueManager,
+        tts_processor,
+        concurrency: int = QUEUE_CONCURRENCY,
+    ):
         """
         初始化Queue服务
 
         Args:
             queue_manager: 队列管理器
             tts_processor: TTS处理器，用于处理队列中的任务
+            concurrency: 并发消费队列的工作器数量
         """
         self.queue_manager = queue_manager
         self.tts_processor = tts_processor
-        self.worker: Optional[QueueWorker] = None
-        self._worker_task: Optional[asyncio.Task] = None
+        self.concurrency = max(1, concurrency)
+        self.workers: List[QueueWorker] = []
+        self._worker_tasks: List[asyncio.Task] = []
+        # 存活的Worker数量，由任务完成回调递减，is_processing 直接读取
+        self._live_workers = 0
+        # (生成时间, 队列状态)
+        self._status_cache: Optional[Tuple[float, QueueStatus]] = None
 
     async def get_status(self) -> QueueStatus:
         """
         获取队列状态
 
+        STATUS_CACHE_TTL 内重复查询直接返回同一个状态对象。
+
         Returns:
             QueueStatus: 队列状态对象
         """
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is not None and now - cached[0] < STATUS_CACHE_TTL:
+            return cached[1]
+
         # 构建队列状态对象
         queue_status = QueueStatus(
-            maxConcurrency=1,
+            maxConcurrency=self.concurrency,
             runningJobId=self.queue_manager.running_job_id(),
             queueLength=self.queue_manager.queue_length(),
             averageWaitSeconds=None,
         )
+        self._status_cache = (now, queue_status)
 
         return queue_status
 
@@ -120,36 +172,44 @@ class QueueService:
         """
         启动队列处理
 
-        创建Worker实例并启动后台任务处理队列中的任务
+        创建 concurrency 个Worker实例共享同一队列，启动后台任务处理队列中的任务。
+        某个任务等待远程合成时，其余Worker继续消费，避免队头阻塞。
         """
-        if self._worker_task is not None:
+        if self._worker_tasks:
             return  # 已经在运行
 
         # 创建Worker实例，注入TTS处理器
-        self.worker = QueueWorker(
-            self.queue_manager, self.tts_processor.process_tts_task
-        )
-        self._worker_task = asyncio.create_task(self.worker.run())
+        for _ in range(self.concurrency):
+            worker = QueueWorker(
+                self.queue_manager, self.tts_processor.process_tts_task
+            )
+            self.workers.append(worker)
+            task = asyncio.create_task(worker.run())
+            task.add_done_callback(self._on_worker_done)
+            self._worker_tasks.append(task)
+        self._live_workers = len(self._worker_tasks)
+
+    def _on_worker_done(self, _: asyncio.Task):
+        """Worker任务结束（正常退出、异常或被取消）时递减存活计数"""
+        self._live_workers = max(0, self._live_workers - 1)
 
     async def stop_processing(self):
         """
         停止队列处理
 
-        停止Worker并清理相关资源
+        停止所有Worker并清理相关资源
         """
-        if self.worker is not None:
-            self.worker.stop()
+        for worker in self.workers:
+            worker.stop()
 
-        if self._worker_task is not None:
-            self._worker_task.cancel()
-            try:
-                await self._worker_task
-            except asyncio.CancelledError:
-                # 忽略取消异常
-                pass
+        for task in self._worker_tasks:
+            task.cancel()
+        # 等待所有Worker退出，忽略取消异常
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
 
-        self.worker = None
-        self._worker_task = None
+        self.workers = []
+        self._worker_tasks = []
+        self._live_workers = 0
 
     def is_processing(self) -> bool:
         """
@@ -158,4 +218,4 @@ class QueueService:
         Returns:
             bool: 是否正在处理
         """
-        return self._worker_task is not None and not self._worker_task.done()
+        return self._live_workers > 0
@@ -13,18 +13,22 @@ TTS任务业务处理器
 """
 
 import logging
-from typing import Any, Dict
+import random
+from typing import Any, Dict, Optional
 from app.models import oc8r
 from app.application.tts_strategies import TtsStrategyFactory
-from app.infra.indextts_client import IndexTtsClient, IndexTtsBusyError
-from app.infra.repositories import VoiceRepository, UploadRepository
-from app.infra.storage import LocalFileStorage
-from app.application.file_service import FileService
+from app.infra.indextts_client import IndexTtsBusyError
 import asyncio
 from fastapi import HTTPException
 
 logger = logging.getLogger(__name__)
 
+# 服务繁忙时的最大重试次数
+MAX_BUSY_RETRIES = 10
+# 指数退避的基数与上限（秒）：第 n 次重试在 [0, min(上限, 基数 * 2**n)] 内随机等待
+BUSY_RETRY_BASE_SECONDS = 2.0
+BUSY_RETRY_CAP_SECONDS = 60.0
+
 
 class TtsTaskProcessor:
     """
@@ -34,29 +38,16 @@ class TtsTaskProcessor:
     作为应用层的业务处理器，只包含业务逻辑，不包含技术实现细节。
     """
 
-    def __init__(
-        self,
-        voice_repo: VoiceRepository,
-        upload_repo: UploadRepository,
-        storage: LocalFileStorage,
-        client: IndexTtsClient,
-        file_service: FileService,
-    ):
+    def __init__(self, strategy_factory: TtsStrategyFactory):
         """
         初始化TTS任务处理器
 
         Args:
-            voice_repo: 音色仓储
-            upload_repo: 上传文件仓储
-            storage: 文件存储服务
-            client: IndexTTS客户端
-            file_service: 文件处理服务
+            strategy_factory: 策略工厂，持有各模式复用的策略实例
         """
-        self.voice_repo = voice_repo
-        self.upload_repo = upload_repo
-        self.storage = storage
-        self.client = client
-        self.file_service = file_service
+        self.strategy_factory = strategy_factory
+        # 任一工作器合成成功时置位，唤醒仍在退避等待的其他工作器
+        self._service_available = asyncio.Event()
 
     async def process_tts_task(self, payload: Any) -> Dict[str, Any]:
         """
@@ -72,25 +63,21 @@ class TtsTaskProcessor:
             Exception: 当处理失败时
         """
         try:
-            # 1. 解析请求数据 - 业务逻辑
-            request_data = payload.get("request", {})
-            request = oc8r.CreateTtsJobRequest(**request_data)
-
-            # 2. 根据模式创建策略 - 业务逻辑
-            strategy = TtsStrategyFactory.create_strategy(
-                request.mode,
-                self.client,
-                self.voice_repo,
-                self.upload_repo,
-                self.storage,
-                self.file_service,
-            )
+            # 1. 解析请求数据 - 业务逻辑（已校验的请求对象直接使用，兼容字典载荷）
+            request = payload.get("request")
+            if not isinstance(request, oc8r.CreateTtsJobRequest):
+                request = oc8r.CreateTtsJobRequest(**(request or {}))
+
+            # 2. 根据模式获取策略 - 业务逻辑
+            strategy = self.strategy_factory.create_strategy(request.mode)
 
             # 3. 验证请求参数 - 业务逻辑
             await strategy.validate_request(request)
 
-            # 4. 执行TTS合成 - 业务逻辑
-            result = await self._synthesize_with_retry(strategy, request)
+            # 4. 执行TTS合成 - 业务逻辑（任务ID用作输出文件名）
+            result = await self._synthesize_with_retry(
+                strategy, request, payload.get("jobId")
+            )
 
             return result
 
@@ -102,41 +89,68 @@ class TtsTaskProcessor:
             raise
 
     async def _synthesize_with_retry(
-        self, strategy, request: oc8r.CreateTtsJobRequest
+        self,
+        strategy,
+        request: oc8r.CreateTtsJobRequest,
+        job_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         执行TTS合成，支持busy重试
 
+        服务繁忙时按指数退避 + 全抖动等待，避免多个工作器同步重试；
+        服务端返回 Retry-After 时至少等待该时长。等待期间若其他工作器合成成功则提前重试。
+
         Args:
             strategy: TTS策略
             request: TTS请求
+            job_id: 任务ID
 
         Returns:
             Dict[str, Any]: 合成结果
         """
-        max_retries = 10
         retry_count = 0
 
-        while retry_count < max_retries:
+        while True:
             try:
-                result = await strategy.synthesize(request)
+                result = await strategy.synthesize(request, job_id)
+                self._service_available.set()
                 return result
             except IndexTtsBusyError as e:
                 retry_count += 1
-                if retry_count >= max_retries:
+                if retry_count >= MAX_BUSY_RETRIES:
                     logger.error(
                         "IndexTTS service busy after %d retries in synthesis",
-                        max_retries,
+                        MAX_BUSY_RETRIES,
                     )
                     raise e
 
+                delay = self._busy_retry_delay(retry_count, e.retry_after)
                 logger.warning(
-                    "IndexTTS service is busy, will retry in 60 seconds (%d/%d)",
+                    "IndexTTS service is busy, will retry in %.1f seconds (%d/%d)",
+                    delay,
                     retry_count,
-                    max_retries,
+                    MAX_BUSY_RETRIES,
                 )
-                await asyncio.sleep(60)
-                continue
-            except Exception as e:
-                raise e
-        raise RuntimeError("Unexpected end of retry loop")
+                self._service_available.clear()
+                try:
+                    await asyncio.wait_for(self._service_available.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    @staticmethod
+    def _busy_retry_delay(retry_count: int, retry_after: Optional[float]) -> float:
+        """
+        计算第 retry_count 次重试前的等待时间（秒）
+
+        Args:
+            retry_count: 已重试次数（从1开始）
+            retry_after: 服务端建议的重试间隔
+
+        Returns:
+            float: 等待时间
+        """
+        ceiling = min(BUSY_RETRY_CAP_SECONDS, BUSY_RETRY_BASE_SECONDS * 2**retry_count)
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
@@ -14,8 +14,7 @@ TTS应用服务
 - 不包含具体的业务逻辑
 """
 
-from typing import List, Optional, Any
-from datetime import datetime
+from typing import List, Optional, Any, Tuple
 from app.models.oc8r import (
     TtsJob,
     CreateTtsJobRequest,
@@ -25,7 +24,12 @@ from app.models.oc8r import (
     ErrorResponse,
 )
 from app.infra.repositories import TtsJobRepository, VoiceRepository
-from app.infra.queue import QueueManager
+from app.infra.queue import QueueManager, QueueFullError
+from app.infra.batched_repo import BatchedJobRepo
+from app.util.cursor import decode_cursor
+from app.util.ids import new_id
+from app.util.time import now_iso
+from app.db_conn import run_db, run_db_read
 import logging
 
 logger = logging.getLogger(__name__)
@@ -56,6 +60,8 @@ class TtsService:
         self.job_repo = job_repo
         self.voice_repo = voice_repo
         self.queue_manager = queue_manager
+        # 状态变更由批量写入器聚批落库
+        self.status_writer = BatchedJobRepo(job_repo)
         self.queue_manager.set_callback(self.handle_status_change)
 
     async def create_job(self, request: CreateTtsJobRequest) -> TtsJob:
@@ -70,29 +76,28 @@ class TtsService:
 
         Raises:
             ValueError: 当音色不存在时
+            QueueFullError: 当任务队列已满时（任务不会保留）
         """
         # 1. 验证音色存在
-        voice = self.voice_repo.get(request.voiceId)
+        voice = await run_db_read(self.voice_repo.get, request.voiceId)
         if not voice:
             raise ValueError("Voice not found")
 
-        # 2. 入队
-        job_id = await self.queue_manager.enqueue(
-            {"request": request.model_dump(), "createdAt": datetime.now().isoformat()}
-        )
-
-        # 3. 保存到数据库
-        job = TtsJob(
-            id=job_id,
+        # 2. 先保存到数据库，再入队（入队前进程退出时由启动恢复重新投递）
+        now = now_iso()
+        # 字段均已是校验过的值，直接构造，避免重复校验
+        job = TtsJob.model_construct(
+            id=new_id(),
             type=Type.tts,  # TTS任务默认为tts类型
             status=JobStatus.queued,
-            createdAt=datetime.now().isoformat(),
-            updatedAt=datetime.now().isoformat(),
+            createdAt=now,
+            updatedAt=now,
             request=request,
             result=None,
             error=None,
         )
-        self.job_repo.add(job)
+        await run_db(self.job_repo.add, job)
+        await self._publish_nowait(job)
 
         return job
 
@@ -106,10 +111,14 @@ class TtsService:
         Returns:
             TtsJob: TTS任务对象，如果不存在则返回None
         """
-        return self.job_repo.get(job_id)
+        return await run_db_read(self.job_repo.get, job_id)
 
     async def list_jobs(
-        self, status: Optional[str] = None, limit: int = 100, offset: int = 0
+        self,
+        status: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> List[TtsJob]:
         """
         列举TTS任务
@@ -117,12 +126,19 @@ class TtsService:
         Args:
             status: 任务状态过滤
             limit: 每页大小
-            offset: 偏移量
+            offset: 偏移量（旧分页方式，提供 cursor 时忽略）
+            cursor: 上一页返回的分页游标
 
         Returns:
             List[TtsJob]: TTS任务列表
+
+        Raises:
+            ValueError: 游标格式无效
         """
-        return self.job_repo.list(status=status, limit=limit, offset=offset)
+        key = decode_cursor(cursor) if cursor else None
+        return await run_db_read(
+            self.job_repo.list, status=status, limit=limit, offset=offset, cursor=key
+        )
 
     async def cancel_job(self, job_id: str) -> Optional[TtsJob]:
         """
@@ -134,19 +150,16 @@ class TtsService:
         Returns:
             TtsJob: 取消后的TTS任务对象，如果不存在则返回None
         """
-        job = self.job_repo.get(job_id)
-        if not job:
-            return None
-
-        if job.status not in [JobStatus.queued, JobStatus.running]:
-            raise ValueError(f"Cannot cancel job with status: {job.status}")
-
-        await self.queue_manager.cancel(job_id)
-        job.status = JobStatus.cancelled
-        job.updatedAt = datetime.now().isoformat()
-        self.job_repo.update(
-            job_id, status=JobStatus.cancelled, updatedAt=job.updatedAt
-        )
+        # 条件更新与读取合并为一条 UPDATE ... RETURNING
+        job = await run_db(self.job_repo.cancel_atomic, job_id, now_iso())
+        if job is None:
+            # 区分任务不存在（404）与状态不允许取消（400）
+            if not await run_db_read(self.job_repo.exists, job_id):
+                return None
+            raise ValueError("Job cannot be cancelled in its current status")
+
+        # 取消状态已由上面的 UPDATE 持久化，只通知队列跳过该任务，不再触发状态回写
+        await self.queue_manager.cancel(job_id, notify=False)
         return job
 
     async def retry_job(self, job_id: str) -> Optional[TtsJob]:
@@ -158,8 +171,11 @@ class TtsService:
 
         Returns:
             TtsJob: 重试后的TTS任务对象，如果不存在则返回None
+
+        Raises:
+            QueueFullError: 当任务队列已满时
         """
-        job = self.job_repo.get(job_id)
+        job = await run_db_read(self.job_repo.get, job_id)
         if not job:
             return None
 
@@ -169,28 +185,77 @@ class TtsService:
         # 创建新的任务（重试）
         if job.request is None:
             raise ValueError("Cannot retry job without request data")
-        new_job_id = await self.queue_manager.enqueue(
-            {
-                "request": job.request.model_dump(),
-                "createdAt": datetime.now().isoformat(),
-            }
-        )
-
-        new_job = TtsJob(
-            id=new_job_id,
+        now = now_iso()
+        # 字段均已是校验过的值，直接构造，避免重复校验
+        new_job = TtsJob.model_construct(
+            id=new_id(),
             type=job.type,
             status=JobStatus.queued,
-            createdAt=datetime.now().isoformat(),
-            updatedAt=datetime.now().isoformat(),
+            createdAt=now,
+            updatedAt=now,
             request=job.request,
             result=None,
             error=None,
         )
 
-        # 保存新任务到数据库
-        self.job_repo.add(new_job)
+        # 先保存新任务到数据库，再入队
+        await run_db(self.job_repo.add, new_job)
+        await self._publish_nowait(new_job)
         return new_job
 
+    async def recover_jobs(self) -> Tuple[int, int]:
+        """
+        恢复上次运行遗留的任务
+
+        应用启动时（队列处理启动之后）调用。队列只存在于进程内存中，启动时必然为空：
+        - queued 的任务（包括上次关闭或崩溃时仍在队列中的任务）按创建时间全部重新投递，
+          队列满时等待工作器消费，不丢弃任务；
+        - running 的任务合成已被中断，标记为 failed，可通过重试接口重新提交。
+          不自动重新执行，避免导致进程崩溃的任务在每次重启后反复执行。
+
+        Returns:
+            Tuple[int, int]: (重新投递的任务数量, 标记为失败的任务数量)
+        """
+        failed = await run_db(
+            self.job_repo.fail_running,
+            ErrorResponse(
+                code="INTERRUPTED", message="Job interrupted by service restart"
+            ),
+            now_iso(),
+        )
+        jobs = await run_db_read(self.job_repo.list_queued)
+        for job in jobs:
+            await self._publish(job)
+        return len(jobs), failed
+
+    async def _publish(self, job: TtsJob, block: bool = True) -> None:
+        """
+        将已落库的任务投递到队列
+
+        Args:
+            job: 已保存的TTS任务
+            block: 队列满时是否等待
+        """
+        # 内存队列不跨进程，直接传递已校验的请求对象，避免序列化后再重新校验
+        await self.queue_manager.enqueue(
+            {"jobId": job.id, "request": job.request, "createdAt": job.createdAt},
+            task_id=job.id,
+            block=block,
+        )
+
+    async def _publish_nowait(self, job: TtsJob) -> None:
+        """
+        非阻塞投递新提交的任务，队列满时删除已落库的任务记录并向上抛出
+
+        Raises:
+            QueueFullError: 任务队列已满
+        """
+        try:
+            await self._publish(job, block=False)
+        except QueueFullError:
+            await run_db(self.job_repo.delete, job.id)
+            raise
+
     async def handle_status_change(
         self, job_id: str, status: JobStatus, result: Optional[Any] = None
     ) -> None:
@@ -198,7 +263,8 @@ class TtsService:
         处理任务状态变更的持久化回调
 
         这个方法会被QueueManager的状态变更回调调用，负责将状态变更持久化到数据库。
-        作为应用层的业务协调，确保数据一致性。
+        作为应用层的业务协调，确保数据一致性。写入器运行时更新按批落库，
+        同一任务在一个刷写窗口内的多次变更合并为一次写入；任务不存在时更新不生效。
 
         Args:
             job_id: 任务ID
@@ -206,14 +272,6 @@ class TtsService:
             result: 任务结果（可选）
         """
         try:
-            # 获取当前任务信息
-            job = self.job_repo.get(job_id)
-            if not job:
-                logger.warning(
-                    "Job %s not found in database, skipping status update", job_id
-                )
-                return
-
             # 准备更新数据
             update_result: Optional[Result] = None
             update_error: Optional[ErrorResponse] = None
@@ -225,14 +283,26 @@ class TtsService:
             elif status == JobStatus.failed and result:
                 update_error = ErrorResponse(code="TTS_ERROR", message=str(result))
 
-            # 执行数据库更新
-            self.job_repo.update(
+            # 交给批量写入器，立即返回
+            await self.status_writer.update_async(
                 job_id,
                 status=status,
                 result=update_result,
                 error=update_error,
-                updatedAt=datetime.now().isoformat(),
+                updatedAt=now_iso(),
             )
 
         except (ValueError, TypeError, KeyError) as e:
             logger.error("Failed to update job %s status to %s: %s", job_id, status, e)
+
+    def start_status_writer(self) -> None:
+        """
+        启动状态变更的批量写入
+        """
+        self.status_writer.start()
+
+    async def stop_status_writer(self) -> None:
+        """
+        停止批量写入并刷写剩余的状态变更
+        """
+        await self.status_writer.stop()
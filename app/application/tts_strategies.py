@@ -15,14 +15,19 @@ TTS策略模式实现
 - 依赖app.infra.indextts_client.IndexTtsClient
 - 依赖app.infra.repositories中的仓储
 - 依赖app.infra.storage中的存储服务
+- 依赖app.infra.cache.AudioBlobCache缓存参考音频，按upload id复用已读取的音频字节
 """
 
+import os
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Type
+from typing import Dict, Any, Optional, Type
 from app.models import oc8r
 from app.infra.indextts_client import IndexTtsClient
 from app.infra.repositories import VoiceRepository, UploadRepository
 from app.infra.storage import LocalFileStorage
+from app.infra.cache import AudioBlobCache
+from app.infra.io_pool import run_io
+from app.db_conn import run_db_read
 from app.application.file_service import FileService
 import logging
 
@@ -42,6 +47,7 @@ class TtsStrategy(ABC):
         upload_repo: UploadRepository,
         storage: LocalFileStorage,
         file_service: FileService,
+        audio_cache: Optional[AudioBlobCache] = None,
     ):
         """
         初始化策略
@@ -50,12 +56,14 @@ class TtsStrategy(ABC):
         :param upload_repo: Upload仓库实例
         :param storage: 文件存储实例
         :param file_service: 文件处理服务实例
+        :param audio_cache: 参考音频缓存，为None时每次读取文件
         """
         self.client = client
         self.voice_repo = voice_repo
         self.upload_repo = upload_repo
         self.storage = storage
         self.file_service = file_service
+        self.audio_cache = audio_cache
 
     @abstractmethod
     async def validate_request(self, request: oc8r.CreateTtsJobRequest) -> None:
@@ -67,10 +75,13 @@ class TtsStrategy(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def synthesize(self, request: oc8r.CreateTtsJobRequest) -> Dict[str, Any]:
+    async def synthesize(
+        self, request: oc8r.CreateTtsJobRequest, job_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         执行TTS合成
         :param request: TTS任务请求
+        :param job_id: 任务ID，用作输出文件名
         :return: 合成结果
         """
         raise NotImplementedError
@@ -81,25 +92,20 @@ class TtsStrategy(ABC):
         :param voice_id: 音色ID
         :return: 音频文件字节数据
         """
-        # 获取Voice记录
-        voice = self.voice_repo.get(voice_id)
-        if not voice:
+        # 一次 JOIN 查询Voice及其关联的Upload记录
+        voice_upload = await run_db_read(self.voice_repo.get_voice_upload, voice_id)
+        if not voice_upload:
             raise ValueError(f"Voice {voice_id} not found")
-
-        # 获取关联的Upload记录
-        upload = self.upload_repo.get(voice.uploadId)
-        if not upload:
+        upload_id, file_name = voice_upload
+        if file_name is None:
             raise ValueError(f"Upload record for voice {voice_id} not found")
 
-        # 获取音频文件路径
-        file_path = self.storage.get_file_path(upload.id)
-        if not file_path:
-            raise ValueError(f"Audio file for voice {voice_id} not found")
+        # 由上传记录推导音频文件路径
+        file_path = self.storage.upload_path(upload_id, file_name)
 
-        # 读取音频文件
+        # 读取音频文件（优先使用缓存）
         try:
-            with open(file_path, "rb") as f:
-                return f.read()
+            return await self._read_upload_audio(upload_id, file_path)
         except Exception as e:
             raise ValueError(
                 f"Failed to read audio file for voice {voice_id}: {str(e)}"
@@ -112,24 +118,63 @@ class TtsStrategy(ABC):
         :return: 音频文件字节数据
         """
         # 获取Upload记录
-        upload = self.upload_repo.get(emotion_audio_id)
+        upload = await run_db_read(self.upload_repo.get, emotion_audio_id)
         if not upload:
             raise ValueError(f"Emotion audio {emotion_audio_id} not found")
 
-        # 获取音频文件路径
-        file_path = self.storage.get_file_path(upload.id)
-        if not file_path:
-            raise ValueError(f"Emotion audio file {emotion_audio_id} not found")
+        # 由上传记录推导音频文件路径
+        file_path = self.storage.upload_path(upload.id, upload.fileName)
 
-        # 读取音频文件
+        # 读取音频文件（优先使用缓存）
         try:
-            with open(file_path, "rb") as f:
-                return f.read()
+            return await self._read_upload_audio(upload.id, file_path)
         except Exception as e:
             raise ValueError(
                 f"Failed to read emotion audio file {emotion_audio_id}: {str(e)}"
             ) from e
 
+    async def _read_upload_audio(self, upload_id: str, file_path: str) -> bytes:
+        """
+        读取上传音频文件，配置了缓存时按upload id缓存，读取在专用IO线程池中执行
+        :param upload_id: 上传记录ID
+        :param file_path: 音频文件路径
+        :return: 音频文件字节数据
+        """
+
+        async def load() -> bytes:
+            return await run_io(_read_file, file_path)
+
+        if self.audio_cache is None:
+            return await load()
+        return await self.audio_cache.get_or_load(upload_id, load)
+
+
+def _read_file(file_path: str) -> bytes:
+    """
+    读取整个文件，按 fstat 得到的大小一次性读取，避免缓冲文件对象的逐块扩容
+    :param file_path: 文件路径
+    :return: 文件字节数据
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        if len(data) == size:
+            return data
+        # 短读：读入按文件大小预分配的缓冲区
+        buf = bytearray(size)
+        view = memoryview(buf)
+        view[: len(data)] = data
+        offset = len(data)
+        while offset < size:
+            n = os.readv(fd, [view[offset:]])
+            if n == 0:
+                break
+            offset += n
+        return bytes(view[:offset])
+    finally:
+        os.close(fd)
+
 
 class SpeakerStrategy(TtsStrategy):
     """
@@ -152,23 +197,24 @@ class SpeakerStrategy(TtsStrategy):
         if request.emotionText:
             raise ValueError("emotionText should not be provided for speaker mode")
 
-    async def synthesize(self, request: oc8r.CreateTtsJobRequest) -> Dict[str, Any]:
+    async def synthesize(
+        self, request: oc8r.CreateTtsJobRequest, job_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         使用音色克隆模式进行TTS合成
         """
         # 获取音色音频数据
         prompt_audio = await self._get_voice_audio_data(request.voiceId)
 
-        generation_args = request.generationArgs or oc8r.GenerationArgs()
-        # 调用IndexTTS客户端，获取音频数据字节
-        audio_data = await self.client.synthesize_speaker(
+        # 调用IndexTTS客户端，流式获取音频数据
+        chunks = self.client.stream_synthesize_speaker(
             text=request.text,
             prompt_audio=prompt_audio,
-            generation_args=generation_args,
+            generation_args=request.generationArgs,
         )
 
-        # 使用文件处理服务保存音频文件
-        result = await self.file_service.save_audio_result(audio_data)
+        # 使用文件处理服务边接收边保存音频文件
+        result = await self.file_service.save_audio_result_stream(chunks, job_id)
         return result
 
 
@@ -193,7 +239,9 @@ class ReferenceStrategy(TtsStrategy):
         if request.emotionText:
             raise ValueError("emotionText should not be provided for reference mode")
 
-    async def synthesize(self, request: oc8r.CreateTtsJobRequest) -> Dict[str, Any]:
+    async def synthesize(
+        self, request: oc8r.CreateTtsJobRequest, job_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         使用参考音频情感模式进行TTS合成
         """
@@ -204,18 +252,17 @@ class ReferenceStrategy(TtsStrategy):
             raise ValueError("emotionAudioId is required for reference mode")
         emotion_audio = await self._get_emotion_audio_data(request.emotionAudioId)
 
-        generation_args = request.generationArgs or oc8r.GenerationArgs()
-        # 调用IndexTTS客户端，获取音频数据字节
-        audio_data = await self.client.synthesize_reference(
+        # 调用IndexTTS客户端，流式获取音频数据
+        chunks = self.client.stream_synthesize_reference(
             text=request.text,
             prompt_audio=prompt_audio,
             emotion_audio=emotion_audio,
             emotion_weight=request.emotionWeight or 0.8,
-            generation_args=generation_args,
+            generation_args=request.generationArgs,
         )
 
-        # 使用文件处理服务保存音频文件
-        result = await self.file_service.save_audio_result(audio_data)
+        # 使用文件处理服务边接收边保存音频文件
+        result = await self.file_service.save_audio_result_stream(chunks, job_id)
         return result
 
 
@@ -240,27 +287,28 @@ class VectorStrategy(TtsStrategy):
         if request.emotionText:
             raise ValueError("emotionText should not be provided for vector mode")
 
-    async def synthesize(self, request: oc8r.CreateTtsJobRequest) -> Dict[str, Any]:
+    async def synthesize(
+        self, request: oc8r.CreateTtsJobRequest, job_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         使用情感向量模式进行TTS合成
         """
         # 获取音色音频数据
         prompt_audio = await self._get_voice_audio_data(request.voiceId)
 
-        generation_args = request.generationArgs or oc8r.GenerationArgs()
-        # 调用IndexTTS客户端，获取音频数据字节
+        # 调用IndexTTS客户端，流式获取音频数据
         if request.emotionFactors is None:
             raise ValueError("emotionFactors is required for vector mode")
-        audio_data = await self.client.synthesize_vector(
+        chunks = self.client.stream_synthesize_vector(
             text=request.text,
             prompt_audio=prompt_audio,
             emotion_factors=request.emotionFactors,
             emotion_random=request.emotionRandom or False,
-            generation_args=generation_args,
+            generation_args=request.generationArgs,
         )
 
-        # 使用文件处理服务保存音频文件
-        result = await self.file_service.save_audio_result(audio_data)
+        # 使用文件处理服务边接收边保存音频文件
+        result = await self.file_service.save_audio_result_stream(chunks, job_id)
         return result
 
 
@@ -285,64 +333,84 @@ class TextStrategy(TtsStrategy):
         if request.emotionFactors:
             raise ValueError("emotionFactors should not be provided for text mode")
 
-    async def synthesize(self, request: oc8r.CreateTtsJobRequest) -> Dict[str, Any]:
+    async def synthesize(
+        self, request: oc8r.CreateTtsJobRequest, job_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         使用情感文本模式进行TTS合成
         """
         # 获取音色音频数据
         prompt_audio = await self._get_voice_audio_data(request.voiceId)
 
-        generation_args = request.generationArgs or oc8r.GenerationArgs()
-        # 调用IndexTTS客户端，获取音频数据字节
+        # 调用IndexTTS客户端，流式获取音频数据
         if request.emotionText is None:
             raise ValueError("emotionText is required for text mode")
-        audio_data = await self.client.synthesize_text(
+        chunks = self.client.stream_synthesize_text(
             text=request.text,
             prompt_audio=prompt_audio,
             emotion_text=request.emotionText,
             emotion_random=request.emotionRandom or False,
-            generation_args=generation_args,
+            generation_args=request.generationArgs,
         )
 
-        # 使用文件处理服务保存音频文件
-        result = await self.file_service.save_audio_result(audio_data)
+        # 使用文件处理服务边接收边保存音频文件
+        result = await self.file_service.save_audio_result_stream(chunks, job_id)
         return result
 
 
 class TtsStrategyFactory:
     """
     TTS策略工厂类
-    根据TTS模式创建对应的策略实例
+    根据TTS模式返回对应的策略实例
+
+    策略对象无状态，构造时为每种模式创建一个实例并复用，避免每个任务重复构造。
     """
 
-    @staticmethod
-    def create_strategy(
-        mode: oc8r.TtsMode,
+    STRATEGY_CLASSES: Dict[oc8r.TtsMode, Type[TtsStrategy]] = {
+        oc8r.TtsMode.speaker: SpeakerStrategy,
+        oc8r.TtsMode.reference: ReferenceStrategy,
+        oc8r.TtsMode.vector: VectorStrategy,
+        oc8r.TtsMode.text: TextStrategy,
+    }
+
+    def __init__(
+        self,
         client: IndexTtsClient,
         voice_repo: VoiceRepository,
         upload_repo: UploadRepository,
         storage: LocalFileStorage,
         file_service: FileService,
-    ) -> TtsStrategy:
+        audio_cache: Optional[AudioBlobCache] = None,
+    ):
         """
-        根据TTS模式创建策略实例
-        :param mode: TTS模式
+        初始化策略工厂并创建全部策略实例
         :param client: IndexTTS客户端
         :param voice_repo: Voice仓库
         :param upload_repo: Upload仓库
         :param storage: 文件存储
         :param file_service: 文件处理服务
-        :return: 策略实例
+        :param audio_cache: 各策略共享的参考音频缓存，为None时创建默认缓存
         """
-        strategies: Dict[oc8r.TtsMode, Type[TtsStrategy]] = {
-            oc8r.TtsMode.speaker: SpeakerStrategy,
-            oc8r.TtsMode.reference: ReferenceStrategy,
-            oc8r.TtsMode.vector: VectorStrategy,
-            oc8r.TtsMode.text: TextStrategy,
+        self.audio_cache = audio_cache or AudioBlobCache()
+        self._strategies: Dict[oc8r.TtsMode, TtsStrategy] = {
+            mode: strategy_class(
+                client,
+                voice_repo,
+                upload_repo,
+                storage,
+                file_service,
+                self.audio_cache,
+            )
+            for mode, strategy_class in self.STRATEGY_CLASSES.items()
         }
 
-        strategy_class = strategies.get(mode)
-        if not strategy_class:
-            raise ValueError(f"Unsupported TTS mode: {mode}")
-
-        return strategy_class(client, voice_repo, upload_repo, storage, file_service)
+    def create_strategy(self, mode: oc8r.TtsMode) -> TtsStrategy:
+        """
+        根据TTS模式获取策略实例
+        :param mode: TTS模式
+        :return: 策略实例
+        """
+        try:
+            return self._strategies[mode]
+        except KeyError:
+            raise ValueError(f"Unsupported TTS mode: {mode}") from None
@@ -2,7 +2,7 @@
 Upload应用服务
 
 处理文件上传相关的业务协调，包括：
-- 上传音频文件
+- 上传音频文件（单个与批量）
 
 职责：
 - 协调领域对象和基础设施层
@@ -10,12 +10,14 @@ Upload应用服务
 - 不包含具体的业务逻辑
 """
 
-from datetime import datetime
 from fastapi import UploadFile
-from typing import Optional
+from typing import List, Optional
 from app.models.oc8r import Upload
 from app.infra.storage import LocalFileStorage
 from app.infra.repositories import UploadRepository
+from app.util.time import now_iso
+from app.db_conn import run_db
+from app.infra.io_pool import run_io
 
 
 class UploadService:
@@ -50,24 +52,59 @@ class UploadService:
             Upload: 上传结果对象
         """
 
+        upload = await self._save_file(file)
+
+        # 保存到数据库（如果有仓储）
+        if self.upload_repo:
+            await run_db(self.upload_repo.add, upload)
+
+        return upload
+
+    async def upload_files(self, files: List[UploadFile]) -> List[Upload]:
+        """
+        批量上传音频文件
+
+        逐个校验并保存文件，全部成功后在同一事务中写入上传记录；
+        任一文件被拒绝时删除本批已保存的文件并抛出原异常。
+
+        Args:
+            files: 上传的文件对象列表
+
+        Returns:
+            List[Upload]: 上传结果对象列表，顺序与输入一致
+        """
+        uploads: List[Upload] = []
+        try:
+            for file in files:
+                uploads.append(await self._save_file(file))
+        except Exception:
+            for upload in uploads:
+                await run_io(self.storage.delete_file, upload.id, upload.fileName)
+            raise
+
+        if self.upload_repo and uploads:
+            await run_db(self.upload_repo.add_many, uploads)
+
+        return uploads
+
+    async def _save_file(self, file: UploadFile) -> Upload:
+        """
+        保存文件并构建上传记录
+
+        字段均来自存储层的返回值，类型已确定，直接构造模型跳过校验。
+        """
         # 使用原始文件名
         filename = file.filename
 
         # 保存文件
-        file_id, file_path, content_type, size = self.storage.save_upload(file)
+        file_id, file_path, content_type, size = await self.storage.save_upload(file)
 
         # 创建上传记录
-        upload = Upload(
+        return Upload.model_construct(
             id=file_id,
             fileName=filename or "unknown",
             contentType=content_type,
             sizeBytes=size,
             durationSeconds=None,
-            createdAt=datetime.now().isoformat(),
+            createdAt=now_iso(),
         )
-
-        # 保存到数据库（如果有仓储）
-        if self.upload_repo:
-            self.upload_repo.add(upload)
-
-        return upload
@@ -2,10 +2,11 @@
 Voice应用服务
 
 处理音色管理相关的业务协调，包括：
-- 创建音色
+- 创建音色（单个与批量）
 - 获取音色详情
 - 列举音色
-- 删除音色
+- 删除音色（单个与批量）
+- 缓存音色详情与列表查询结果，创建、删除音色时失效
 
 职责：
 - 协调领域对象和基础设施层
@@ -13,12 +14,24 @@ Voice应用服务
 - 不包含具体的业务逻辑
 """
 
+import asyncio
 from typing import List, Optional
-from datetime import datetime
-import uuid
 from app.models.oc8r import Voice, CreateVoiceRequest
 from app.infra.repositories import VoiceRepository, UploadRepository
 from app.infra.storage import LocalFileStorage
+from app.util.cursor import decode_cursor
+from app.util.ids import new_id
+from app.util.time import now_iso
+from app.db_conn import run_db, run_db_read
+from app.infra.io_pool import run_io
+from app.infra.cache import TtlCache
+from app.config import VOICE_CACHE_MAX_ENTRIES, VOICE_CACHE_TTL_SECONDS
+
+# 批量创建音色的单次最大数量，避免 IN (...) 参数过多
+MAX_BULK_VOICES = 100
+
+# 批量删除音色时同时进行的文件删除数量上限，避免占满IO线程池
+DELETE_FILE_CONCURRENCY = 16
 
 
 class VoiceService:
@@ -46,6 +59,9 @@ class VoiceService:
         self.voice_repo = voice_repo
         self.storage = storage
         self.upload_repo = upload_repo
+        # 查询结果缓存：("voice", id) 与 ("list", offset, limit, cursor) 共用一个缓存，
+        # 任何写操作后整体清空；只在事件循环线程中访问
+        self._cache = TtlCache(VOICE_CACHE_MAX_ENTRIES, VOICE_CACHE_TTL_SECONDS)
 
     async def create_voice(self, request: CreateVoiceRequest) -> Voice:
         """
@@ -60,30 +76,83 @@ class VoiceService:
         Raises:
             ValueError: 当音色名称重复或uploadId不存在时
         """
-        # 1. 检查音色名称是否重复
-        existing_voices = self.voice_repo.list(limit=1000)  # 获取所有音色
-        for voice in existing_voices:
-            if voice.name == request.name:
-                raise ValueError("Voice name already exists")
-
-        # 2. 检查uploadId是否存在（如果有upload_repo）
-        if self.upload_repo:
-            upload = self.upload_repo.get(request.uploadId)
-            if not upload:
-                raise ValueError("Upload ID not found")
-
-        voice_id = str(uuid.uuid4())
+        voice_id = new_id()
+        now = now_iso()
         voice = Voice(
             id=voice_id,
             name=request.name,
             description=request.description,
             uploadId=request.uploadId,
-            createdAt=datetime.now().isoformat(),
-            updatedAt=datetime.now().isoformat(),
+            createdAt=now,
+            updatedAt=now,
         )
-        self.voice_repo.add(voice)
+
+        if not self.upload_repo:
+            # 无上传仓储时不校验uploadId，名称重复由数据库唯一约束检测
+            await run_db(self.voice_repo.add, voice)
+            self._cache.clear()
+            return voice
+
+        # 校验uploadId存在与名称唯一，并在同一条语句中写入
+        if await run_db(self.voice_repo.insert_if_valid, voice) == 0:
+            if await run_db_read(self.voice_repo.name_exists, request.name):
+                raise ValueError("Voice name already exists")
+            raise ValueError("Upload ID not found")
+        self._cache.clear()
         return voice
 
+    async def create_voices_bulk(
+        self, requests: List[CreateVoiceRequest]
+    ) -> List[Voice]:
+        """
+        批量创建音色
+
+        一次 IN (...) 查询校验全部 uploadId，一次查询校验名称，再在同一事务中批量写入。
+
+        Args:
+            requests: 创建音色请求列表
+
+        Returns:
+            List[Voice]: 创建的音色列表，顺序与请求一致
+
+        Raises:
+            ValueError: 请求为空或超过上限、名称重复、uploadId不存在时（整批不写入）
+        """
+        if not requests:
+            raise ValueError("No voices to create")
+        if len(requests) > MAX_BULK_VOICES:
+            raise ValueError(f"Too many voices, at most {MAX_BULK_VOICES} per batch")
+
+        names = [request.name for request in requests]
+        if len(set(names)) != len(names):
+            raise ValueError("Duplicate voice names in batch")
+
+        if self.upload_repo:
+            upload_ids = {request.uploadId for request in requests}
+            found = await run_db_read(self.upload_repo.existing_ids, upload_ids)
+            if found != upload_ids:
+                raise ValueError("Upload ID not found")
+
+        if await run_db_read(self.voice_repo.existing_names, names):
+            raise ValueError("Voice name already exists")
+
+        now = now_iso()
+        voices = [
+            Voice(
+                id=new_id(),
+                name=request.name,
+                description=request.description,
+                uploadId=request.uploadId,
+                createdAt=now,
+                updatedAt=now,
+            )
+            for request in requests
+        ]
+        # 名称并发冲突由唯一约束兜底，整批回滚
+        await run_db(self.voice_repo.add_many, voices)
+        self._cache.clear()
+        return voices
+
     async def get_voice(self, voice_id: str) -> Optional[Voice]:
         """
         获取音色详情
@@ -94,20 +163,42 @@ class VoiceService:
         Returns:
             Voice: 音色对象，如果不存在则返回None
         """
-        return self.voice_repo.get(voice_id)
+        key = ("voice", voice_id)
+        voice = self._cache.get(key)
+        if voice is None:
+            generation = self._cache.generation
+            voice = await run_db_read(self.voice_repo.get, voice_id)
+            if voice is not None:
+                self._cache.put(key, voice, generation)
+        return voice
 
-    async def list_voices(self, offset: int = 0, limit: int = 100) -> List[Voice]:
+    async def list_voices(
+        self, offset: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[Voice]:
         """
         列举音色
 
         Args:
-            page: 页码
-            page_size: 每页大小
+            offset: 偏移量（旧分页方式，提供 cursor 时忽略）
+            limit: 每页大小
+            cursor: 上一页返回的分页游标
 
         Returns:
             List[Voice]: 音色列表
+
+        Raises:
+            ValueError: 游标格式无效
         """
-        return self.voice_repo.list(offset=offset, limit=limit)
+        key = decode_cursor(cursor) if cursor else None
+        cache_key = ("list", offset, limit, key)
+        voices = self._cache.get(cache_key)
+        if voices is None:
+            generation = self._cache.generation
+            voices = await run_db_read(
+                self.voice_repo.list, offset=offset, limit=limit, cursor=key
+            )
+            self._cache.put(cache_key, voices, generation)
+        return list(voices)
 
     async def delete_voice(self, voice_id: str) -> bool:
         """
@@ -119,11 +210,52 @@ class VoiceService:
         Returns:
             bool: 删除是否成功
         """
-        voice = self.voice_repo.get(voice_id)
-        if voice:
-            # 删除关联的音频文件
-            if voice.uploadId:
-                self.storage.delete_file(voice.uploadId)
-            self.voice_repo.delete(voice_id)
+        voice_upload = await run_db_read(self.voice_repo.get_voice_upload, voice_id)
+        if voice_upload:
+            # 删除关联的音频文件与数据库记录，两者互不依赖，并发执行
+            await asyncio.gather(
+                self._delete_upload_file(*voice_upload),
+                run_db(self.voice_repo.delete, voice_id),
+            )
+            self._cache.clear()
             return True
         return False
+
+    async def delete_voices(self, voice_ids: List[str]) -> List[str]:
+        """
+        批量删除音色
+
+        数据库记录在同一事务中删除，关联文件在IO线程池中并发删除。
+
+        Args:
+            voice_ids: 音色ID列表
+
+        Returns:
+            List[str]: 实际删除的音色ID（不存在的ID被忽略）
+        """
+        upload_files = await run_db_read(self.voice_repo.upload_files, voice_ids)
+        if not upload_files:
+            return []
+        semaphore = asyncio.Semaphore(DELETE_FILE_CONCURRENCY)
+
+        async def delete_file(upload_id: str, file_name: Optional[str]) -> None:
+            async with semaphore:
+                await self._delete_upload_file(upload_id, file_name)
+
+        await asyncio.gather(
+            *(delete_file(*upload) for upload in upload_files.values()),
+            run_db(self.voice_repo.delete_many, list(upload_files)),
+        )
+        self._cache.clear()
+        return [
+            voice_id
+            for voice_id in dict.fromkeys(voice_ids)
+            if voice_id in upload_files
+        ]
+
+    async def _delete_upload_file(
+        self, upload_id: Optional[str], file_name: Optional[str] = None
+    ) -> None:
+        """删除音色关联的音频文件，已知上传文件名时直接推导路径"""
+        if upload_id:
+            await run_io(self.storage.delete_file, upload_id, file_name)
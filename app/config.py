@@ -4,9 +4,18 @@
 
 主要配置项说明：
 - UPLOAD_DIR: 上传文件的统一存储目录
+- OUTPUT_DIR: 合成音频的输出目录
 - MAX_UPLOAD_BYTES: 单个上传文件允许的最大大小（单位：字节）
 - ALLOWED_MIME_TYPES: 允许上传的音频 MIME 类型集合
 - ALLOWED_EXTENSIONS: 允许上传的音频扩展名集合
+- QUEUE_MAXSIZE: 任务队列的最大长度（背压缓冲区大小）
+- QUEUE_CONCURRENCY: 并发消费队列的工作器数量
+- INDEX_TTS_MAX_CONCURRENCY: 同时发往 IndexTTS 服务的合成请求上限
+- AUDIO_CACHE_MAX_BYTES: 参考音频内存缓存的字节预算
+- VOICE_CACHE_MAX_ENTRIES / VOICE_CACHE_TTL_SECONDS: 音色查询结果缓存的条目上限与有效期
+- IO_MAX_WORKERS: 执行阻塞文件操作的专用线程池大小
+- DB_PATH: SQLite 数据库文件路径
+- DB_READ_POOL_SIZE: 只读数据库连接池大小
 """
 
 import os
@@ -14,17 +23,55 @@ import os
 # 上传文件存储目录
 UPLOAD_DIR = os.getenv("UPLOAD_DIR", "data/uploads")
 
+# 合成音频输出目录
+OUTPUT_DIR = os.getenv("OUTPUT_DIR", "data/outputs")
+
 # 允许上传的音频 MIME 类型集合
-ALLOWED_MIME_TYPES = {"audio/wav", "audio/mpeg", "audio/mp4"}
+ALLOWED_MIME_TYPES = frozenset({"audio/wav", "audio/mpeg", "audio/mp4"})
 
 # 允许上传的音频扩展名集合
-ALLOWED_EXTENSIONS = {"wav", "mp3", "mp4"}
+ALLOWED_EXTENSIONS = frozenset({"wav", "mp3", "mp4"})
 
 # 单个上传文件最大允许大小（字节）
 MAX_UPLOAD_BYTES = 20 * 1024 * 1024
 
+# 任务队列最大长度。队列满时新提交的任务直接返回 503，由客户端稍后重试。
+# 缓冲区越大越能吸收突发流量，但排队任务占用的内存与尾部等待时间也随之增长；
+# 单个排队任务只保存请求参数（KB 级），合成耗时在秒级，64 足以覆盖常见突发。
+QUEUE_MAXSIZE = int(os.getenv("QUEUE_MAXSIZE", "64"))
+
+# 并发消费队列的工作器数量。IndexTTS 为单卡推理服务时保持 1；
+# 后端可并行推理时调大，使读取音频、保存结果与远程合成相互重叠。
+QUEUE_CONCURRENCY = int(os.getenv("QUEUE_CONCURRENCY", "1"))
+
+# 参考音频（音色/情感音频）内存缓存的字节预算，默认 256MB；设为 0 关闭缓存
+AUDIO_CACHE_MAX_BYTES = int(os.getenv("AUDIO_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# SQLite 数据库文件路径
+DB_PATH = os.getenv("DB_PATH", "data/tts.db")
+
+# 只读连接池大小。WAL 模式下读连接与唯一的写连接并发执行；设为 0 时所有查询走写连接
+DB_READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", "4"))
+
+# 执行阻塞文件操作（读取参考音频、stat、删除文件）的专用线程池大小
+IO_MAX_WORKERS = int(
+    os.getenv("IO_MAX_WORKERS", str(min(32, (os.cpu_count() or 1) * 4)))
+)
+
+# 音色详情与列表查询结果的进程内缓存：条目上限与有效期（秒）。
+# 创建、删除音色时立即失效；多进程部署时其他进程最多在有效期内读到旧数据
+VOICE_CACHE_MAX_ENTRIES = int(os.getenv("VOICE_CACHE_MAX_ENTRIES", "1024"))
+VOICE_CACHE_TTL_SECONDS = float(os.getenv("VOICE_CACHE_TTL_SECONDS", "30"))
+
+# 队列满时建议客户端重试的间隔（秒），通过 Retry-After 响应头返回
+QUEUE_RETRY_AFTER_SECONDS = int(os.getenv("QUEUE_RETRY_AFTER_SECONDS", "5"))
+
 
 # IndexTTS服务端点，默认为10.0.10.42:8000
 INDEX_TTS_BASE_URL = os.getenv("INDEX_TTS_BASE_URL", "http://10.0.10.42:8000")
 # 超时时间，默认30分钟
 INDEX_TTS_TIMEOUT = float(os.getenv("INDEX_TTS_TIMEOUT", "1800.0"))
+# 同时进行的合成请求上限，默认与工作器数量一致
+INDEX_TTS_MAX_CONCURRENCY = int(
+    os.getenv("INDEX_TTS_MAX_CONCURRENCY", str(QUEUE_CONCURRENCY))
+)
@@ -6,6 +6,21 @@
 
 架构说明：
 - 使用容器模式管理所有应用服务
+- 与数据库连接无关的组件（文件存储、IndexTTS 客户端、文件服务、音频服务）为进程级单例，
+  首次获取时创建并保存在容器属性上，之后直接返回
+- 依赖数据库连接的服务按连接对象缓存，同一连接始终复用同一个服务实例；
+  仓储同样按连接缓存并在服务之间共享，每个连接只执行一次建表检查；
+  服务内的仓储强引用连接，弱引用字典无法在连接关闭后回收条目，
+  因此关闭连接前调用 release_connection 显式移除该连接的全部服务
+- warm_up 在数据库线程中预创建全部服务：服务构造的主要开销是首次导入模块，
+  仓储构造还会在写连接上执行建表语句，放到线程中执行不阻塞事件循环；
+  构造共用同一个连接与导入锁，并行构建没有收益，因此按顺序创建
+- preload 在 IO 线程池中预先导入服务模块并创建与数据库无关的单例，不需要数据库连接，
+  可以与数据库 startup 并行执行；随后的 warm_up 只剩仓储建表与服务对象组装
+- 全局容器 app_container 在模块导入时创建一次；依赖提供函数运行在线程池中，
+  缓存未命中时在锁内再检查一次后创建，命中路径不加锁
+- 服务类在首次获取时才导入，导入 app_container 本身不会加载 httpx 等依赖，
+  缩短进程冷启动时间；类型注解所需的导入放在 TYPE_CHECKING 块中
 - 支持依赖注入，便于测试和扩展
 - 统一管理服务实例的生命周期
 - 提供清晰的服务获取接口
@@ -17,48 +32,151 @@
 - 支持服务替换和扩展
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 import sqlite3
-from app.infra.repositories import TtsJobRepository, VoiceRepository, UploadRepository
-from app.infra.queue import get_queue_manager
-from app.infra.storage import LocalFileStorage
-from app.application.tts_service import TtsService
-from app.application.voice_service import VoiceService
-from app.application.upload_service import UploadService
-from app.application.queue_service import QueueService
-from app.application.audio_service import AudioService
-from app.application.tts_processor import TtsTaskProcessor
-from app.application.file_service import FileService
-from app.infra.indextts_client import IndexTtsClient
-from app.db_conn import get_db_conn
+import threading
+from app.db_conn import get_db_conn, run_db
+from app.infra.io_pool import run_io
+import importlib
 import os
 
+if TYPE_CHECKING:
+    from app.infra.storage import LocalFileStorage
+    from app.application.tts_service import TtsService
+    from app.application.voice_service import VoiceService
+    from app.application.upload_service import UploadService
+    from app.application.queue_service import QueueService
+    from app.application.audio_service import AudioService
+    from app.application.tts_processor import TtsTaskProcessor
+    from app.application.file_service import FileService
+    from app.infra.indextts_client import IndexTtsClient
+
+
+# 按连接构建的服务所在模块，preload 时预先导入
+_SERVICE_MODULES = (
+    "app.infra.repositories",
+    "app.infra.queue",
+    "app.application.tts_service",
+    "app.application.voice_service",
+    "app.application.upload_service",
+    "app.application.queue_service",
+    "app.application.tts_processor",
+    "app.application.tts_strategies",
+)
+
 
 class ApplicationContainer:
     """
     应用服务容器
 
     负责管理所有应用服务的初始化、依赖注入和生命周期管理。
-    使用单例模式，确保全局只有一个容器实例。
+    应用通过模块级的 app_container 共享同一个实例。
     """
 
-    _instance: Optional["ApplicationContainer"] = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
     def __init__(self):
         """初始化应用服务容器"""
-        if hasattr(self, "_initialized"):
-            return
+        # 保护缓存未命中时的创建过程；构建服务时会嵌套获取其他服务，使用可重入锁
+        self._lock = threading.RLock()
+        # 数据库连接 -> {服务名: 服务实例}；以连接对象本身为键，连接存活期间键不会被复用
+        self._services: Dict[sqlite3.Connection, Dict[str, Any]] = {}
+        self._reset_singletons()
+
+    def _reset_singletons(self):
+        """重置与数据库连接无关的单例组件"""
+        self._storage: Optional["LocalFileStorage"] = None
+        self._indextts_client: Optional["IndexTtsClient"] = None
+        self._file_service: Optional["FileService"] = None
+        self._audio_service: Optional["AudioService"] = None
+
+    def _get_or_create(
+        self,
+        name: str,
+        db: Optional[sqlite3.Connection],
+        factory: Callable[[sqlite3.Connection], Any],
+    ) -> Any:
+        """
+        获取按数据库连接缓存的服务实例，不存在时调用 factory 创建
+
+        Args:
+            name: 服务名
+            db: 数据库连接，如果为None则使用默认连接
+            factory: 以数据库连接为参数的服务构造函数
+        """
+        if db is None:
+            db = get_db_conn()
+        service = self._services.get(db, {}).get(name)
+        if service is None:
+            with self._lock:
+                services = self._services.setdefault(db, {})
+                service = services.get(name)
+                if service is None:
+                    service = services[name] = factory(db)
+        return service
+
+    def release_connection(self, db: sqlite3.Connection):
+        """
+        移除绑定到指定数据库连接的全部服务实例，在关闭连接前调用
+
+        Args:
+            db: 即将关闭的数据库连接
+        """
+        with self._lock:
+            self._services.pop(db, None)
+
+    def _repository(
+        self, repo_cls: Callable[[sqlite3.Connection], Any], db: sqlite3.Connection
+    ) -> Any:
+        """
+        获取按数据库连接缓存的仓储实例，同一连接上的服务共享同一个仓储
+
+        Args:
+            repo_cls: 仓储类
+            db: 数据库连接
+        """
+        return self._get_or_create(repo_cls.__name__, db, repo_cls)
 
-        self._initialized = True
-        self._services = {}
-        self._initialized_services = set()
+    def _get_singleton(self, attr: str, factory: Callable[[], Any]) -> Any:
+        """
+        获取保存在容器属性上的单例组件，不存在时调用 factory 创建
 
-    def get_tts_service(self, db: Optional[sqlite3.Connection] = None) -> TtsService:
+        Args:
+            attr: 保存单例的属性名
+            factory: 无参构造函数
+        """
+        instance = getattr(self, attr)
+        if instance is None:
+            with self._lock:
+                instance = getattr(self, attr)
+                if instance is None:
+                    instance = factory()
+                    setattr(self, attr, instance)
+        return instance
+
+    def get_storage(self) -> "LocalFileStorage":
+        """
+        获取文件存储单例
+        """
+        return self._get_singleton("_storage", self._build_storage)
+
+    @staticmethod
+    def _build_storage() -> "LocalFileStorage":
+        from app.infra.storage import LocalFileStorage
+
+        return LocalFileStorage()
+
+    def get_indextts_client(self) -> "IndexTtsClient":
+        """
+        获取IndexTTS客户端单例，复用同一个 httpx 连接池
+        """
+        return self._get_singleton("_indextts_client", self._build_indextts_client)
+
+    @staticmethod
+    def _build_indextts_client() -> "IndexTtsClient":
+        from app.infra.indextts_client import IndexTtsClient
+
+        return IndexTtsClient()
+
+    def get_tts_service(self, db: Optional[sqlite3.Connection] = None) -> "TtsService":
         """
         获取TTS服务实例
 
@@ -68,25 +186,23 @@ class ApplicationContainer:
         Returns:
             TtsService: TTS服务实例
         """
-        if db is None:
-            db = get_db_conn()
+        return self._get_or_create("tts_service", db, self._build_tts_service)
 
-        service_key = f"tts_service_{id(db)}"
-        if service_key not in self._services:
-            job_repo = TtsJobRepository(db)
-            voice_repo = VoiceRepository(db)
-            queue_manager = get_queue_manager()
+    def _build_tts_service(self, db: sqlite3.Connection) -> "TtsService":
+        """构建TTS服务"""
+        from app.application.tts_service import TtsService
+        from app.infra.queue import get_queue_manager
+        from app.infra.repositories import TtsJobRepository, VoiceRepository
 
-            self._services[service_key] = TtsService(
-                job_repo, voice_repo, queue_manager
-            )
-            self._initialized_services.add(service_key)
-
-        return self._services[service_key]
+        return TtsService(
+            self._repository(TtsJobRepository, db),
+            self._repository(VoiceRepository, db),
+            get_queue_manager(),
+        )
 
     def get_voice_service(
         self, db: Optional[sqlite3.Connection] = None
-    ) -> VoiceService:
+    ) -> "VoiceService":
         """
         获取Voice服务实例
 
@@ -96,23 +212,22 @@ class ApplicationContainer:
         Returns:
             VoiceService: Voice服务实例
         """
-        if db is None:
-            db = get_db_conn()
+        return self._get_or_create("voice_service", db, self._build_voice_service)
 
-        service_key = f"voice_service_{id(db)}"
-        if service_key not in self._services:
-            voice_repo = VoiceRepository(db)
-            upload_repo = UploadRepository(db)
-            storage = LocalFileStorage()
+    def _build_voice_service(self, db: sqlite3.Connection) -> "VoiceService":
+        """构建Voice服务"""
+        from app.application.voice_service import VoiceService
+        from app.infra.repositories import UploadRepository, VoiceRepository
 
-            self._services[service_key] = VoiceService(voice_repo, storage, upload_repo)
-            self._initialized_services.add(service_key)
-
-        return self._services[service_key]
+        return VoiceService(
+            self._repository(VoiceRepository, db),
+            self.get_storage(),
+            self._repository(UploadRepository, db),
+        )
 
     def get_upload_service(
         self, db: Optional[sqlite3.Connection] = None
-    ) -> UploadService:
+    ) -> "UploadService":
         """
         获取Upload服务实例
 
@@ -122,22 +237,18 @@ class ApplicationContainer:
         Returns:
             UploadService: Upload服务实例
         """
-        if db is None:
-            db = get_db_conn()
-
-        service_key = f"upload_service_{id(db)}"
-        if service_key not in self._services:
-            storage = LocalFileStorage()
-            upload_repo = UploadRepository(db)
+        return self._get_or_create("upload_service", db, self._build_upload_service)
 
-            self._services[service_key] = UploadService(storage, upload_repo)
-            self._initialized_services.add(service_key)
+    def _build_upload_service(self, db: sqlite3.Connection) -> "UploadService":
+        """构建Upload服务"""
+        from app.application.upload_service import UploadService
+        from app.infra.repositories import UploadRepository
 
-        return self._services[service_key]
+        return UploadService(self.get_storage(), self._repository(UploadRepository, db))
 
     def get_queue_service(
         self, db: Optional[sqlite3.Connection] = None
-    ) -> QueueService:
+    ) -> "QueueService":
         """
         获取Queue服务实例
 
@@ -147,93 +258,80 @@ class ApplicationContainer:
         Returns:
             QueueService: Queue服务实例
         """
-        if db is None:
-            db = get_db_conn()
+        return self._get_or_create("queue_service", db, self._build_queue_service)
 
-        service_key = f"queue_service_{id(db)}"
-        if service_key not in self._services:
-            queue_manager = get_queue_manager()
-            # 通过容器获取TTS处理器依赖
-            tts_processor = self.get_tts_processor(db)
+    def _build_queue_service(self, db: sqlite3.Connection) -> "QueueService":
+        """构建Queue服务，通过容器获取TTS处理器依赖"""
+        from app.application.queue_service import QueueService
+        from app.infra.queue import get_queue_manager
 
-            self._services[service_key] = QueueService(queue_manager, tts_processor)
-            self._initialized_services.add(service_key)
-
-        return self._services[service_key]
+        return QueueService(get_queue_manager(), self.get_tts_processor(db))
 
     def get_audio_service(
         self, db: Optional[sqlite3.Connection] = None
-    ) -> AudioService:
+    ) -> "AudioService":
         """
         获取Audio服务实例
 
         Args:
-            db: 数据库连接，如果为None则使用默认连接
+            db: 保留参数，音频服务不依赖数据库连接
 
         Returns:
             AudioService: Audio服务实例
         """
-        if db is None:
-            db = get_db_conn()
+        return self._get_singleton("_audio_service", self._build_audio_service)
 
-        service_key = f"audio_service_{id(db)}"
-        if service_key not in self._services:
-            # 音频服务依赖文件服务
-            file_service = self.get_file_service(db)
-            self._services[service_key] = AudioService(file_service)
-            self._initialized_services.add(service_key)
+    def _build_audio_service(self) -> "AudioService":
+        from app.application.audio_service import AudioService
 
-        return self._services[service_key]
+        # 音频服务依赖文件服务
+        return AudioService(self.get_file_service())
 
     def get_tts_processor(
         self, db: Optional[sqlite3.Connection] = None
-    ) -> TtsTaskProcessor:
+    ) -> "TtsTaskProcessor":
         """通过容器获取TTS处理器，统一依赖管理"""
-        if db is None:
-            db = get_db_conn()
+        return self._get_or_create("tts_processor", db, self._build_tts_processor)
 
-        service_key = f"tts_processor_{id(db)}"
-        if service_key not in self._services:
-            # 通过容器获取所有依赖
-            voice_repo = VoiceRepository(db)
-            upload_repo = UploadRepository(db)
-            storage = LocalFileStorage()
-            client = IndexTtsClient()
-            file_service = self.get_file_service(db)
+    def _build_tts_processor(self, db: sqlite3.Connection) -> "TtsTaskProcessor":
+        """构建TTS处理器，无状态组件使用容器单例"""
+        from app.application.tts_processor import TtsTaskProcessor
+        from app.application.tts_strategies import TtsStrategyFactory
+        from app.infra.repositories import UploadRepository, VoiceRepository
 
-            self._services[service_key] = TtsTaskProcessor(
-                voice_repo=voice_repo,
-                upload_repo=upload_repo,
-                storage=storage,
-                client=client,
-                file_service=file_service,
-            )
+        voice_repo = self._repository(VoiceRepository, db)
+        upload_repo = self._repository(UploadRepository, db)
+        storage = self.get_storage()
+        client = self.get_indextts_client()
+        file_service = self.get_file_service()
 
-        return self._services[service_key]
+        # 策略对象无状态，由工厂按模式创建一次后复用
+        strategy_factory = TtsStrategyFactory(
+            client, voice_repo, upload_repo, storage, file_service
+        )
 
-    def get_file_service(self, db: Optional[sqlite3.Connection] = None) -> FileService:
+        return TtsTaskProcessor(strategy_factory)
+
+    def get_file_service(
+        self, db: Optional[sqlite3.Connection] = None
+    ) -> "FileService":
         """
         获取文件处理服务实例
 
         Args:
-            db: 数据库连接，如果为None则使用默认连接
+            db: 保留参数，文件服务不依赖数据库连接
 
         Returns:
             FileService: 文件处理服务实例
         """
-        if db is None:
-            db = get_db_conn()
+        return self._get_singleton("_file_service", self._build_file_service)
 
-        service_key = f"file_service_{id(db)}"
-        if service_key not in self._services:
-            storage = LocalFileStorage()
-            # 从环境变量获取基础URL，默认为localhost:8000
-            base_url = os.getenv("TTS_BASE_URL", "http://localhost:8000")
+    def _build_file_service(self) -> "FileService":
+        from app.application.file_service import FileService
 
-            self._services[service_key] = FileService(storage, base_url)
-            self._initialized_services.add(service_key)
-
-        return self._services[service_key]
+        # 从环境变量获取基础URL，默认为localhost:8000
+        base_url = os.getenv("TTS_BASE_URL", "http://localhost:8000")
+        return FileService(self.get_storage(), base_url)
 
     def get_all_services(self, db: Optional[sqlite3.Connection] = None) -> dict:
         """
@@ -251,16 +349,42 @@ class ApplicationContainer:
             "upload_service": self.get_upload_service(db),
             "queue_service": self.get_queue_service(db),
             "audio_service": self.get_audio_service(db),
-            "tts_processor": self.get_tts_processor(),
+            "tts_processor": self.get_tts_processor(db),
             "file_service": self.get_file_service(db),
         }
 
+    def _preload(self):
+        """导入全部服务模块并创建与数据库无关的单例"""
+        for module in _SERVICE_MODULES:
+            importlib.import_module(module)
+        self.get_indextts_client()
+        self.get_audio_service()
+
+    async def preload(self):
+        """
+        在IO线程池中执行不依赖数据库连接的初始化，可与数据库 startup 并行
+        """
+        await run_io(self._preload)
+
+    async def warm_up(self, db: Optional[sqlite3.Connection] = None) -> dict:
+        """
+        在数据库线程中预创建所有应用服务，不阻塞事件循环
+
+        Args:
+            db: 数据库连接，如果为None则使用默认连接
+
+        Returns:
+            dict: 包含所有应用服务的字典
+        """
+        return await run_db(self.get_all_services, db)
+
     def clear_services(self):
         """
         清理所有服务实例（主要用于测试）
         """
-        self._services.clear()
-        self._initialized_services.clear()
+        with self._lock:
+            self._services.clear()
+            self._reset_singletons()
 
 
 # 全局应用服务容器实例
@@ -10,16 +10,124 @@
 架构说明：
 - 提供 startup/shutdown 钩子，确保连接生命周期管理
 - get_db_conn 函数支持 FastAPI Depends 注入
+- run_db 将同步仓储调用交给专用的单线程写执行器，写操作天然串行；排队的写操作
+  不再占用 anyio 默认线程池中的线程（FastAPI 的同步依赖、文件响应共用该线程池）
+- run_db_read 将只读查询交给只读连接池：WAL 模式下多个读连接可与写连接并发执行，
+  读请求不再排队等待全局连接锁；写操作仍经由唯一的写连接串行执行
+- 写连接与只读连接都使用更大的预编译语句缓存：批量查询的 IN (...) 按参数个数
+  生成不同的 SQL 文本，默认 128 条的缓存容易把常用语句挤出，导致重复解析
 - 所有模块统一使用此连接，保证数据一致性
 """
 
+import asyncio
+import functools
+import queue
 import sqlite3
 import os
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, TypeVar
+
+import anyio
+
+from app.config import DB_PATH, DB_READ_POOL_SIZE
+
+T = TypeVar("T")
 
 # 全局数据库连接
 db_conn: Optional[sqlite3.Connection] = None
 
+# 全局连接可能被写执行器以外的线程使用（如启动阶段），用锁保证同一时刻只有一个线程使用
+_db_lock = threading.Lock()
+
+# 单线程写执行器，首次使用时创建，shutdown 时回收
+_write_executor: Optional[ThreadPoolExecutor] = None
+
+# 每个连接缓存的预编译语句数量（sqlite3 默认 128）
+STATEMENT_CACHE_SIZE = 256
+
+# 建立连接后执行的 PRAGMA
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA journal_size_limit=67108864",
+)
+
+# 只读连接的 PRAGMA（journal_mode 为数据库级设置，由写连接设置一次即可）
+_READ_CONNECTION_PRAGMAS = (
+    "PRAGMA query_only=ON",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+class ReadConnectionPool:
+    """
+    只读连接池
+
+    连接在首次借用时创建并在池中复用，页缓存在请求之间保持热状态；
+    同时借出的连接数不超过 size，超出时借用线程阻塞等待归还。
+    """
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self._slots = threading.BoundedSemaphore(max(1, size))
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._created: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> sqlite3.Connection:
+        """借用一个只读连接，池中没有空闲连接时新建"""
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            conn = sqlite3.connect(
+                self.path,
+                check_same_thread=False,
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
+            for pragma in _READ_CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._created.append(conn)
+        return conn
+
+    def release(self, conn: sqlite3.Connection):
+        """归还只读连接"""
+        self._idle.put(conn)
+        self._slots.release()
+
+    def close(self):
+        """关闭池中创建过的全部连接"""
+        with self._lock:
+            for conn in self._created:
+                conn.close()
+            self._created.clear()
+
+
+# 全局只读连接池，startup 时创建
+read_pool: Optional[ReadConnectionPool] = None
+
+# 当前线程借用的只读连接，仓储的 conn 属性据此切换连接
+_read_local = threading.local()
+
+
+def current_read_conn() -> Optional[sqlite3.Connection]:
+    """
+    获取当前线程在 run_db_read 中借用的只读连接，不在只读上下文中时返回 None
+    """
+    return getattr(_read_local, "conn", None)
+
 
 def get_db_conn() -> sqlite3.Connection:
     """
@@ -36,85 +144,194 @@ def get_db_conn() -> sqlite3.Connection:
     return db_conn
 
 
+async def run_db(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    在线程池中执行同步数据库操作，避免 sqlite3 调用阻塞事件循环
+
+    Args:
+        func: 同步仓储方法
+        *args: 位置参数
+        **kwargs: 关键字参数
+
+    Returns:
+        func 的返回值
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_write_executor(), functools.partial(_call_locked, func, *args, **kwargs)
+    )
+
+
+def _get_write_executor() -> ThreadPoolExecutor:
+    """
+    获取单线程写执行器，不存在时创建
+    """
+    global _write_executor
+    if _write_executor is None:
+        _write_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tts-db-writer"
+        )
+    return _write_executor
+
+
+def _call_locked(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    with _db_lock:
+        return func(*args, **kwargs)
+
+
+async def run_db_read(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    在线程池中执行只读仓储查询
+
+    仓储绑定的是全局连接且只读连接池已启用时，查询在借用的只读连接上执行，
+    不占用全局连接锁；否则（如测试中注入的连接）退化为 run_db。
+
+    Args:
+        func: 同步仓储的只读方法
+        *args: 位置参数
+        **kwargs: 关键字参数
+
+    Returns:
+        func 的返回值
+    """
+    pool = read_pool
+    repo_conn = getattr(getattr(func, "__self__", None), "_conn", None)
+    if pool is None or repo_conn is None or repo_conn is not db_conn:
+        return await run_db(func, *args, **kwargs)
+    return await anyio.to_thread.run_sync(
+        functools.partial(_call_with_reader, pool, func, *args, **kwargs)
+    )
+
+
+def _call_with_reader(
+    pool: ReadConnectionPool, func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    conn = pool.acquire()
+    _read_local.conn = conn
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _read_local.conn = None
+        pool.release(conn)
+
+
 async def startup():
     """
     应用启动时初始化数据库连接
     - 创建数据库目录（如果不存在）
-    - 建立全局连接
+    - 建立全局连接并设置 PRAGMA
     - 初始化数据库表结构
+    - 创建只读连接池
     """
-    global db_conn
+    global db_conn, read_pool
 
     # 确保数据库目录存在
-    os.makedirs("data", exist_ok=True)
+    os.makedirs(os.path.dirname(DB_PATH) or ".", exist_ok=True)
 
     # 建立全局连接
-    db_conn = sqlite3.connect("data/tts.db", check_same_thread=False)
+    db_conn = sqlite3.connect(
+        DB_PATH, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+    )
+    _configure_connection(db_conn)
 
     # 初始化数据库表结构
     _init_database()
 
+    # 表结构就绪后再创建只读连接池（连接在首次借用时建立）
+    if DB_READ_POOL_SIZE > 0:
+        read_pool = ReadConnectionPool(DB_PATH, DB_READ_POOL_SIZE)
+
+
+def _configure_connection(conn: sqlite3.Connection):
+    """
+    设置连接级 PRAGMA
+    - WAL 日志模式：读操作不再被写事务阻塞
+    - synchronous=NORMAL：WAL 模式下仅在检查点时 fsync
+    - mmap_size：通过内存映射读取数据页，减少 pread 拷贝
+    - cache_size/temp_store：增大页缓存（64MB），临时表放在内存中
+    - journal_size_limit：检查点后把 WAL 文件截断到 64MB 以内，写入高峰过后不再长期占用磁盘
+    """
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
 
 async def shutdown():
     """
     应用关闭时清理数据库连接
     """
-    global db_conn
+    global db_conn, read_pool, _write_executor
+    if read_pool is not None:
+        read_pool.close()
+        read_pool = None
+    if _write_executor is not None:
+        # 等待已提交的写操作完成后再关闭连接
+        _write_executor.shutdown(wait=True)
+        _write_executor = None
     if db_conn:
         db_conn.close()
         db_conn = None
 
 
+# 表结构版本，记录在 PRAGMA user_version 中；修改 _SCHEMA_SQL 时递增
+SCHEMA_VERSION = 1
+
+# 建表与索引脚本，由 executescript 一次执行
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS uploads (
+    id TEXT PRIMARY KEY,
+    fileName TEXT NOT NULL,
+    contentType TEXT NOT NULL,
+    sizeBytes INTEGER NOT NULL,
+    durationSeconds REAL,
+    createdAt TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS voices (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT,
+    uploadId TEXT NOT NULL,
+    createdAt TEXT NOT NULL,
+    updatedAt TEXT NOT NULL,
+    FOREIGN KEY (uploadId) REFERENCES uploads (id)
+);
+
+CREATE TABLE IF NOT EXISTS tts_jobs (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    createdAt TEXT NOT NULL,
+    updatedAt TEXT NOT NULL,
+    request TEXT NOT NULL,
+    result TEXT,
+    error TEXT
+);
+
+-- 列表接口键集分页使用的排序索引
+CREATE INDEX IF NOT EXISTS ix_voices_created_id
+    ON voices(createdAt DESC, id DESC);
+CREATE INDEX IF NOT EXISTS ix_tts_jobs_created_id
+    ON tts_jobs(createdAt DESC, id DESC);
+CREATE INDEX IF NOT EXISTS ix_tts_jobs_status_created
+    ON tts_jobs(status, createdAt DESC, id DESC);
+"""
+
+
 def _init_database():
     """
     初始化数据库表结构
+
+    user_version 已达到 SCHEMA_VERSION 时直接返回；否则在一次 executescript 中
+    建表、建索引并写入版本号。语句均为 IF NOT EXISTS，已存在的表不做列迁移；
+    各仓储的 _ensure_table 同样只创建缺失的表与索引。
     """
     if db_conn is None:
         return
 
-    # 创建上传记录表
-    db_conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS uploads (
-            id TEXT PRIMARY KEY,
-            fileName TEXT NOT NULL,
-            contentType TEXT NOT NULL,
-            sizeBytes INTEGER NOT NULL,
-            durationSeconds REAL,
-            createdAt TEXT NOT NULL
-        )
-    """
-    )
-
-    # 创建语音记录表
-    db_conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS voices (
-            id TEXT PRIMARY KEY,
-            name TEXT NOT NULL UNIQUE,
-            description TEXT,
-            uploadId TEXT NOT NULL,
-            createdAt TEXT NOT NULL,
-            updatedAt TEXT NOT NULL,
-            FOREIGN KEY (uploadId) REFERENCES uploads (id)
-        )
-    """
-    )
+    (version,) = db_conn.execute("PRAGMA user_version").fetchone()
+    if version >= SCHEMA_VERSION:
+        return
 
-    # 创建 TTS 任务表
-    db_conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS tts_jobs (
-            id TEXT PRIMARY KEY,
-            type TEXT NOT NULL,
-            status TEXT NOT NULL,
-            createdAt TEXT NOT NULL,
-            updatedAt TEXT NOT NULL,
-            request TEXT NOT NULL,
-            result TEXT,
-            error TEXT
-        )
-    """
+    db_conn.executescript(
+        f"BEGIN;{_SCHEMA_SQL}PRAGMA user_version = {SCHEMA_VERSION};COMMIT;"
     )
-
-    db_conn.commit()
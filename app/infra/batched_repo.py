@@ -0,0 +1,179 @@
+"""
+文件级注释：
+本模块实现 TtsJob 状态更新的批量写入器，属于基础设施层（Infrastructure Layer）。
+
+背景说明：
+- 每个任务经历 queued → running → succeeded/failed 多次状态变更，逐条 UPDATE 在高吞吐下
+  变成大量小事务，每次都要获取连接锁并提交。
+- BatchedJobRepo 将更新放入有界队列，由后台协程按"数量或时间窗口"聚批：
+  攒满 MAX_BATCH_SIZE 条或距本批第一条超过 FLUSH_INTERVAL 秒即刷写。
+- 同一批内对同一任务的多次更新合并为一次，后写入的字段覆盖先写入的字段，
+  整批在一个事务中执行。
+- 终态更新（succeeded/failed/cancelled）不再等待时间窗口：立即与已排队的更新一起刷写，
+  且 update_async 等到该批提交后才返回，保证任务结束前终态已落库；
+  该批写入失败时 update_async 抛出写入异常，非终态更新的失败只记录日志。
+
+注意事项：
+- 写入器未启动时 update_async 直接写库，便于测试与脚本场景。
+- stop 会刷写队列中剩余的全部更新，应在数据库连接关闭前调用。
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.db_conn import run_db
+from app.infra.repositories import TtsJobRepository
+from app.models import oc8r
+
+logger = logging.getLogger(__name__)
+
+# 单批最多合并的更新条数
+MAX_BATCH_SIZE = 128
+# 单批最长等待时间（秒）
+FLUSH_INTERVAL = 0.02
+# 待写入更新队列的最大长度，队列满时调用方等待（背压）
+MAX_PENDING_UPDATES = 1024
+
+# 需要同步刷写的终态
+TERMINAL_STATUSES = frozenset(
+    {oc8r.JobStatus.succeeded, oc8r.JobStatus.failed, oc8r.JobStatus.cancelled}
+)
+
+# 停止标记
+_STOP = object()
+
+# 队列元素：(任务ID, 更新字段, 等待提交的 Future)
+_Update = Tuple[str, Dict[str, Any], Optional["asyncio.Future[None]"]]
+
+
+class BatchedJobRepo:
+    """
+    TtsJob 状态更新批量写入器
+    """
+
+    def __init__(
+        self,
+        job_repo: TtsJobRepository,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+    ):
+        """
+        :param job_repo: TtsJob 仓储
+        :param max_batch_size: 单批最多合并的更新条数
+        :param flush_interval: 单批最长等待时间（秒）
+        """
+        self.job_repo = job_repo
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        # 队列在 start 时创建，绑定到当前运行的事件循环
+        self._queue: Optional["asyncio.Queue[Any]"] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def update_async(self, tts_job_id: str, **fields: Any) -> None:
+        """
+        提交一次部分更新（status/result/error/updatedAt），未提供的字段保持不变
+
+        终态更新会触发立即刷写，并等待所在批次提交后返回，提交失败时抛出写入异常。
+        :param tts_job_id: 任务ID
+        :param fields: 需要更新的字段
+        """
+        if self._queue is None:
+            await run_db(self.job_repo.update_many, [(tts_job_id, fields)])
+            return
+        if fields.get("status") not in TERMINAL_STATUSES:
+            await self._queue.put((tts_job_id, fields, None))
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        await self._queue.put((tts_job_id, fields, waiter))
+        await waiter
+
+    def start(self) -> None:
+        """
+        启动后台刷写协程
+        """
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=MAX_PENDING_UPDATES)
+            self._task = asyncio.create_task(self._run(self._queue))
+
+    async def stop(self) -> None:
+        """
+        停止后台刷写协程，并刷写剩余的全部更新
+        """
+        if self._task is None or self._queue is None:
+            return
+        # 发送停止标记，刷写协程处理完其之前的全部更新后退出
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        self._queue = None
+
+    async def _run(self, queue: "asyncio.Queue[Any]") -> None:
+        """
+        持续聚批并刷写，收到停止标记时刷写当前批次后退出
+        """
+        while True:
+            item = await queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.max_batch_size:
+                if batch[-1][2] is not None:
+                    # 终态更新：带上已排队的更新立即刷写
+                    stopping = self._drain_ready(queue, batch)
+                    break
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+            if stopping:
+                return
+
+    def _drain_ready(self, queue: "asyncio.Queue[Any]", batch: List[_Update]) -> bool:
+        """
+        不等待地取出队列中已有的更新，直到批次满
+
+        :return: 是否取到了停止标记
+        """
+        while len(batch) < self.max_batch_size:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return False
+            if item is _STOP:
+                return True
+            batch.append(item)
+        return False
+
+    async def _flush(self, batch: List[_Update]) -> None:
+        """
+        合并同一任务的更新后在一个事务中写入，完成或失败后唤醒等待提交的调用方
+        """
+        merged: Dict[str, Dict[str, Any]] = {}
+        for tts_job_id, fields, _ in batch:
+            merged.setdefault(tts_job_id, {}).update(
+                {key: value for key, value in fields.items() if value is not None}
+            )
+        try:
+            await run_db(self.job_repo.update_many, list(merged.items()))
+        except Exception as e:
+            logger.error("Failed to flush %d job status updates: %s", len(merged), e)
+            # 终态更新未落库，把异常交给等待的调用方
+            for _, _, waiter in batch:
+                if waiter is not None and not waiter.done():
+                    waiter.set_exception(e)
+            return
+        for _, _, waiter in batch:
+            if waiter is not None and not waiter.done():
+                waiter.set_result(None)
@@ -0,0 +1,141 @@
+"""
+文件级注释：
+本模块提供进程内的内存缓存，属于基础设施层（Infrastructure Layer）。
+- AudioBlobCache：按字节预算淘汰的音频字节 LRU 缓存
+- TtlCache：按条目数淘汰、带过期时间的 LRU 缓存，用于缓存读多写少的查询结果
+
+背景说明：
+- 每个 TTS 任务都要读取音色参考音频（以及情感参考音频），批量合成时同一音色会被读取成百上千次。
+- AudioBlobCache 以 upload id 为键缓存音频字节，总大小超过预算时淘汰最久未使用的条目，
+  把磁盘读取次数从"任务数"降到"不同音色数"。
+
+架构说明：
+- 只在事件循环线程中访问，字典操作之间没有 await，无需额外加锁。
+- 同一个键的并发未命中共享同一次加载，避免重复读取同一文件。
+- 单个条目超过预算时直接返回数据，不写入缓存。
+- TtlCache 维护一个失效代数：clear 时递增，读取方在查询前记下代数、写回时校验，
+  查询期间发生的失效不会被旧结果覆盖。
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.config import AUDIO_CACHE_MAX_BYTES
+
+
+class AudioBlobCache:
+    """
+    音频字节 LRU 缓存
+    """
+
+    def __init__(self, max_bytes: int = AUDIO_CACHE_MAX_BYTES):
+        """
+        :param max_bytes: 缓存总字节数上限，0 表示不缓存
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        # 正在加载的键 -> 加载任务
+        self._loading: Dict[str, "asyncio.Future[bytes]"] = {}
+
+    @property
+    def size(self) -> int:
+        """当前缓存的总字节数"""
+        return self._size
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[bytes]]
+    ) -> bytes:
+        """
+        获取缓存的数据，未命中时调用 loader 加载并写入缓存
+        :param key: 缓存键
+        :param loader: 加载数据的协程函数
+        :return: 数据
+        """
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+            return data
+
+        pending = self._loading.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.ensure_future(loader())
+        self._loading[key] = future
+        try:
+            data = await asyncio.shield(future)
+        finally:
+            self._loading.pop(key, None)
+        self._put(key, data)
+        return data
+
+    def invalidate(self, key: str) -> None:
+        """
+        移除指定键的缓存
+        :param key: 缓存键
+        """
+        data = self._entries.pop(key, None)
+        if data is not None:
+            self._size -= len(data)
+
+    def _put(self, key: str, data: bytes) -> None:
+        """写入缓存并按 LRU 淘汰超出预算的条目"""
+        if len(data) > self.max_bytes:
+            return
+        self.invalidate(key)
+        self._entries[key] = data
+        self._size += len(data)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+
+class TtlCache:
+    """
+    带过期时间的 LRU 缓存
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        """
+        :param max_entries: 最大条目数，超出时淘汰最久未使用的条目
+        :param ttl: 条目有效期（秒）
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # 键 -> (过期时间, 值)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.generation = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        获取未过期的缓存值，不存在或已过期时返回None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any, generation: int) -> None:
+        """
+        写入缓存；generation 为查询前读取的失效代数，期间发生过失效时丢弃本次写入
+        """
+        if generation != self.generation or self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        清空缓存并使进行中的查询结果失效
+        """
+        self._entries.clear()
+        self.generation += 1
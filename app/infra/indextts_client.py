@@ -8,6 +8,17 @@
 - 支持四种TTS模式：speaker、reference、vector、text
 - 处理音频文件上传、TTS合成等操作
 - 统一错误处理和重试机制
+- 通过信号量限制同时进行的合成请求数，多个工作器共享同一客户端时不会压垮后端
+- 进程内共享同一个客户端实例（由应用容器管理），底层 httpx 连接池保持长连接，
+  连续的合成请求复用已建立的 TCP 连接；建连失败时由传输层自动重试
+- 未指定生成参数时复用模块加载时序列化好的默认参数字典，热路径上不再构造与序列化模型
+- 载荷构建只收集字段，音频保持原始字节；Base64 编码与 JSON 序列化在专用 IO 线程池中
+  一次完成，大段音频的编码不阻塞事件循环
+- 合成请求通过 Accept 头优先请求二进制音频（audio/wav）；后端按 Content-Type 返回
+  audio/* 或 application/octet-stream 时直接使用响应字节，省去 JSON 解析与 Base64 解码，
+  仍返回 JSON Base64 字符串的后端走原有解码路径
+- stream_synthesize_* 流式读取响应：二进制响应按块直接产出，Base64 响应增量解码，
+  内存占用与分块大小同阶，不随音频时长增长
 
 依赖说明：
 - 依赖httpx进行HTTP请求
@@ -15,15 +26,34 @@
 - 依赖app.config中的配置项
 """
 
+import asyncio
+import json
 import httpx
-from typing import Optional, Dict, Any
+from typing import AsyncIterator, Optional, Dict, Any
 from app.models import oc8r
-from app.config import INDEX_TTS_BASE_URL, INDEX_TTS_TIMEOUT
+from app.config import (
+    INDEX_TTS_BASE_URL,
+    INDEX_TTS_MAX_CONCURRENCY,
+    INDEX_TTS_TIMEOUT,
+)
+from app.infra.io_pool import run_io
 import logging
 import base64
 
 logger = logging.getLogger(__name__)
 
+# 空闲长连接的保留时间（秒）。合成请求间隔通常为数秒，默认的 5 秒会使连接在两次任务之间被关闭
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+# 每段文本的最大 token 数，规范中的默认值
+MAX_TEXT_TOKENS_PER_SEGMENT = 120
+
+# 默认生成参数的序列化结果，所有未指定生成参数的请求共享，只读不可修改
+_DEFAULT_GENERATION_ARGS = oc8r.GenerationArgs().model_dump()
+
+# 建立连接失败（连接被拒绝、超时）时传输层的重试次数；已发出的请求不会重放
+CONNECT_RETRIES = 2
+
 
 class IndexTtsBusyError(Exception):
     """
@@ -31,7 +61,117 @@ class IndexTtsBusyError(Exception):
     当服务返回busy状态时抛出此异常，用于触发重试机制
     """
 
-    pass
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        """
+        :param message: 错误信息
+        :param retry_after: 服务端通过 Retry-After 建议的重试间隔（秒），未提供时为None
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _Base64StringDecoder:
+    """
+    增量解码 JSON 字符串形式的 Base64 响应体（形如 "UklGR..."）
+
+    按 4 字符对齐解码，未对齐的尾部留到下一块；JSON 中的转义反斜杠（\\/）直接丢弃，
+    Base64 字母表不包含反斜杠。
+    """
+
+    def __init__(self):
+        self._started = False
+        self._finished = False
+        self._pending = b""
+
+    def feed(self, chunk: bytes) -> bytes:
+        """
+        输入一块响应体，返回可解码的音频数据（可能为空）
+        """
+        if self._finished:
+            if chunk.strip():
+                raise ValueError("Unexpected data after Base64 string response")
+            return b""
+        if not self._started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                return b""
+            if chunk[:1] != b'"':
+                raise ValueError("Expected Base64 string response")
+            chunk = chunk[1:]
+            self._started = True
+        end = chunk.find(b'"')
+        if end != -1:
+            if chunk[end + 1 :].strip():
+                raise ValueError("Unexpected data after Base64 string response")
+            chunk = chunk[:end]
+            self._finished = True
+        data = self._pending + chunk.replace(b"\\", b"")
+        aligned = len(data) - len(data) % 4
+        self._pending = data[aligned:]
+        return base64.b64decode(data[:aligned]) if aligned else b""
+
+    def close(self) -> None:
+        """
+        校验响应体完整结束
+        """
+        if not self._finished or self._pending:
+            raise ValueError("Truncated Base64 string response")
+
+
+def _encode_request_body(payload: Dict[str, Any]) -> bytes:
+    """
+    将请求载荷编码为 JSON 请求体，bytes 字段（音频）编码为 Base64 字符串
+    """
+    body = {
+        key: (
+            base64.b64encode(value).decode("ascii")
+            if isinstance(value, (bytes, bytearray))
+            else value
+        )
+        for key, value in payload.items()
+    }
+    return json.dumps(
+        body, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
+
+
+# 合成请求的请求头：JSON 请求体，优先接收二进制音频，兼容 JSON Base64 响应
+_SYNTHESIZE_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "audio/wav, application/octet-stream, application/json;q=0.5",
+}
+
+
+def _is_binary_audio(response: httpx.Response) -> bool:
+    """
+    判断响应体是否为原始音频字节（而非 JSON Base64 字符串）
+    """
+    content_type = response.headers.get("Content-Type", "")
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith("audio/") or media_type == "application/octet-stream"
+
+
+def _dump_generation_args(
+    generation_args: Optional[oc8r.GenerationArgs],
+) -> Dict[str, Any]:
+    """
+    序列化生成参数，未指定时返回共享的默认参数字典
+    """
+    if generation_args is None:
+        return _DEFAULT_GENERATION_ARGS
+    return generation_args.model_dump()
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    解析秒数形式的 Retry-After 响应头，无法解析时返回None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
 
 
 class IndexTtsClient:
@@ -40,22 +180,60 @@ class IndexTtsClient:
     负责与底层IndexTTS服务进行通信，提供统一的TTS合成接口
     """
 
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_concurrency: int = INDEX_TTS_MAX_CONCURRENCY,
+    ):
         """
         初始化IndexTTS客户端
         :param base_url: IndexTTS服务的基础URL，如果为None则使用配置文件中的默认值
+        :param max_concurrency: 同时进行的合成请求上限
         """
         self.base_url = (base_url or INDEX_TTS_BASE_URL).rstrip("/")
-        self.client = httpx.AsyncClient(timeout=INDEX_TTS_TIMEOUT)
+        self._max_concurrency = max(1, max_concurrency)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
         logger.info(
             "IndexTTS client initialized with base_url: %s, timeout: %ds",
             self.base_url,
             INDEX_TTS_TIMEOUT,
         )
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        底层 httpx 客户端，首次使用时创建；关闭后再次使用会重新创建
+        """
+        if self._client is None:
+            self._client = self._build_http_client()
+        return self._client
+
+    @client.setter
+    def client(self, value: httpx.AsyncClient):
+        self._client = value
+
+    def _build_http_client(self) -> httpx.AsyncClient:
+        """
+        创建带长连接池的 httpx 客户端
+
+        并发请求数已由信号量限制，连接池只需容纳同样数量的连接并在请求之间保持空闲连接。
+        """
+        limits = httpx.Limits(
+            max_connections=self._max_concurrency,
+            max_keepalive_connections=self._max_concurrency,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        )
+        return httpx.AsyncClient(
+            timeout=INDEX_TTS_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(limits=limits, retries=CONNECT_RETRIES),
+        )
+
     async def close(self):
-        """关闭HTTP客户端"""
-        await self.client.aclose()
+        """关闭HTTP客户端，释放连接池中的长连接"""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
 
     async def synthesize_speaker(
         self,
@@ -70,13 +248,7 @@ class IndexTtsClient:
         :param generation_args: 生成参数
         :return: 合成结果
         """
-        payload = {
-            "text": text,
-            "prompt_audio": base64.b64encode(prompt_audio).decode("utf-8"),
-            "max_text_tokens_per_segment": 120,  # 规范中的默认值
-            "generation_args": (generation_args or oc8r.GenerationArgs()).model_dump(),
-        }
-
+        payload = self._speaker_payload(text, prompt_audio, generation_args)
         return await self._synthesize_speaker(payload)
 
     async def synthesize_reference(
@@ -96,15 +268,9 @@ class IndexTtsClient:
         :param generation_args: 生成参数
         :return: 合成结果
         """
-        payload = {
-            "text": text,
-            "prompt_audio": base64.b64encode(prompt_audio).decode("utf-8"),
-            "max_text_tokens_per_segment": 120,  # 规范中的默认值
-            "emotion_audio": base64.b64encode(emotion_audio).decode("utf-8"),
-            "emotion_weight": emotion_weight,
-            "generation_args": (generation_args or oc8r.GenerationArgs()).model_dump(),
-        }
-
+        payload = self._reference_payload(
+            text, prompt_audio, emotion_audio, emotion_weight, generation_args
+        )
         return await self._synthesize_reference(payload)
 
     async def synthesize_vector(
@@ -124,15 +290,9 @@ class IndexTtsClient:
         :param generation_args: 生成参数
         :return: 合成结果
         """
-        payload = {
-            "text": text,
-            "prompt_audio": base64.b64encode(prompt_audio).decode("utf-8"),
-            "max_text_tokens_per_segment": 120,  # 规范中的默认值
-            "emotion_factors": emotion_factors.model_dump(),
-            "emotion_random": emotion_random,
-            "generation_args": (generation_args or oc8r.GenerationArgs()).model_dump(),
-        }
-
+        payload = self._vector_payload(
+            text, prompt_audio, emotion_factors, emotion_random, generation_args
+        )
         return await self._synthesize_vector(payload)
 
     async def synthesize_text(
@@ -152,16 +312,142 @@ class IndexTtsClient:
         :param generation_args: 生成参数
         :return: 合成结果
         """
-        payload = {
+        payload = self._text_payload(
+            text, prompt_audio, emotion_text, emotion_random, generation_args
+        )
+        return await self._synthesize_text(payload)
+
+    def stream_synthesize_speaker(
+        self,
+        text: str,
+        prompt_audio: bytes,
+        generation_args: Optional[oc8r.GenerationArgs] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        使用音色克隆模式进行TTS合成，按块返回解码后的音频数据
+        参数同 synthesize_speaker
+        """
+        payload = self._speaker_payload(text, prompt_audio, generation_args)
+        return self._stream_synthesize_endpoint("/synthesize/speaker", payload)
+
+    def stream_synthesize_reference(
+        self,
+        text: str,
+        prompt_audio: bytes,
+        emotion_audio: bytes,
+        emotion_weight: float = 0.8,
+        generation_args: Optional[oc8r.GenerationArgs] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        使用参考音频情感模式进行TTS合成，按块返回解码后的音频数据
+        参数同 synthesize_reference
+        """
+        payload = self._reference_payload(
+            text, prompt_audio, emotion_audio, emotion_weight, generation_args
+        )
+        return self._stream_synthesize_endpoint("/synthesize/reference", payload)
+
+    def stream_synthesize_vector(
+        self,
+        text: str,
+        prompt_audio: bytes,
+        emotion_factors: oc8r.EmotionFactors,
+        emotion_random: bool = False,
+        generation_args: Optional[oc8r.GenerationArgs] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        使用情感向量模式进行TTS合成，按块返回解码后的音频数据
+        参数同 synthesize_vector
+        """
+        payload = self._vector_payload(
+            text, prompt_audio, emotion_factors, emotion_random, generation_args
+        )
+        return self._stream_synthesize_endpoint("/synthesize/vector", payload)
+
+    def stream_synthesize_text(
+        self,
+        text: str,
+        prompt_audio: bytes,
+        emotion_text: str,
+        emotion_random: bool = False,
+        generation_args: Optional[oc8r.GenerationArgs] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        使用情感文本模式进行TTS合成，按块返回解码后的音频数据
+        参数同 synthesize_text
+        """
+        payload = self._text_payload(
+            text, prompt_audio, emotion_text, emotion_random, generation_args
+        )
+        return self._stream_synthesize_endpoint("/synthesize/text", payload)
+
+    @staticmethod
+    def _speaker_payload(
+        text: str,
+        prompt_audio: bytes,
+        generation_args: Optional[oc8r.GenerationArgs],
+    ) -> Dict[str, Any]:
+        """构建speaker端点请求载荷"""
+        return {
             "text": text,
-            "prompt_audio": base64.b64encode(prompt_audio).decode("utf-8"),
-            "max_text_tokens_per_segment": 120,  # 规范中的默认值
-            "emotion_text": emotion_text,
+            "prompt_audio": prompt_audio,
+            "max_text_tokens_per_segment": MAX_TEXT_TOKENS_PER_SEGMENT,
+            "generation_args": _dump_generation_args(generation_args),
+        }
+
+    @staticmethod
+    def _reference_payload(
+        text: str,
+        prompt_audio: bytes,
+        emotion_audio: bytes,
+        emotion_weight: float,
+        generation_args: Optional[oc8r.GenerationArgs],
+    ) -> Dict[str, Any]:
+        """构建reference端点请求载荷"""
+        return {
+            "text": text,
+            "prompt_audio": prompt_audio,
+            "max_text_tokens_per_segment": MAX_TEXT_TOKENS_PER_SEGMENT,
+            "emotion_audio": emotion_audio,
+            "emotion_weight": emotion_weight,
+            "generation_args": _dump_generation_args(generation_args),
+        }
+
+    @staticmethod
+    def _vector_payload(
+        text: str,
+        prompt_audio: bytes,
+        emotion_factors: oc8r.EmotionFactors,
+        emotion_random: bool,
+        generation_args: Optional[oc8r.GenerationArgs],
+    ) -> Dict[str, Any]:
+        """构建vector端点请求载荷"""
+        return {
+            "text": text,
+            "prompt_audio": prompt_audio,
+            "max_text_tokens_per_segment": MAX_TEXT_TOKENS_PER_SEGMENT,
+            "emotion_factors": emotion_factors.model_dump(),
             "emotion_random": emotion_random,
-            "generation_args": (generation_args or oc8r.GenerationArgs()).model_dump(),
+            "generation_args": _dump_generation_args(generation_args),
         }
 
-        return await self._synthesize_text(payload)
+    @staticmethod
+    def _text_payload(
+        text: str,
+        prompt_audio: bytes,
+        emotion_text: str,
+        emotion_random: bool,
+        generation_args: Optional[oc8r.GenerationArgs],
+    ) -> Dict[str, Any]:
+        """构建text端点请求载荷"""
+        return {
+            "text": text,
+            "prompt_audio": prompt_audio,
+            "max_text_tokens_per_segment": MAX_TEXT_TOKENS_PER_SEGMENT,
+            "emotion_text": emotion_text,
+            "emotion_random": emotion_random,
+            "generation_args": _dump_generation_args(generation_args),
+        }
 
     async def _synthesize_speaker(self, payload: Dict[str, Any]) -> bytes:
         """
@@ -197,10 +483,17 @@ class IndexTtsClient:
         :return: 音频数据字节
         """
         try:
-            response = await self.client.post(
-                f"{self.base_url}{endpoint}", json=payload
-            )
+            body = await run_io(_encode_request_body, payload)
+            # 只在请求期间占用并发名额，busy 重试的等待不占用
+            async with self._semaphore:
+                response = await self.client.post(
+                    f"{self.base_url}{endpoint}",
+                    content=body,
+                    headers=_SYNTHESIZE_HEADERS,
+                )
             response.raise_for_status()
+            if _is_binary_audio(response):
+                return response.content
             result = response.json()
 
             # IndexTTS规范：直接返回Base64编码的WAV音频字符串
@@ -218,7 +511,10 @@ class IndexTtsClient:
             if e.response.status_code in [429]:
                 logger.warning("IndexTTS service is busy, will retry later")
                 raise IndexTtsBusyError(
-                    f"IndexTTS service busy: {e.response.status_code}"
+                    f"IndexTTS service busy: {e.response.status_code}",
+                    retry_after=_parse_retry_after(
+                        e.response.headers.get("Retry-After")
+                    ),
                 )
             raise RuntimeError(
                 f"IndexTTS service error: {e.response.status_code}"
@@ -226,3 +522,44 @@ class IndexTtsClient:
         except Exception as e:
             logger.error("IndexTTS synthesis failed: %s", str(e))
             raise
+
+    async def _stream_synthesize_endpoint(
+        self, endpoint: str, payload: Dict[str, Any]
+    ) -> AsyncIterator[bytes]:
+        """
+        流式调用IndexTTS服务的指定端点进行TTS合成，按块产出解码后的音频数据
+        :param endpoint: API端点路径
+        :param payload: 请求载荷
+        :return: 音频数据块的异步迭代器
+        """
+        body = await run_io(_encode_request_body, payload)
+        # 流式响应在读取完毕前一直占用连接，因此整个读取过程都占用并发名额
+        async with self._semaphore:
+            async with self.client.stream(
+                "POST",
+                f"{self.base_url}{endpoint}",
+                content=body,
+                headers=_SYNTHESIZE_HEADERS,
+            ) as response:
+                if response.status_code == 429:
+                    logger.warning("IndexTTS service is busy, will retry later")
+                    raise IndexTtsBusyError(
+                        f"IndexTTS service busy: {response.status_code}",
+                        retry_after=_parse_retry_after(
+                            response.headers.get("Retry-After")
+                        ),
+                    )
+                if response.is_error:
+                    raise RuntimeError(
+                        f"IndexTTS service error: {response.status_code}"
+                    )
+                if _is_binary_audio(response):
+                    async for chunk in response.aiter_bytes():
+                        yield chunk
+                    return
+                decoder = _Base64StringDecoder()
+                async for chunk in response.aiter_bytes():
+                    data = decoder.feed(chunk)
+                    if data:
+                        yield data
+                decoder.close()
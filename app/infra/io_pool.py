@@ -0,0 +1,65 @@
+"""
+文件级注释：
+本模块提供执行阻塞文件操作的专用线程池，属于基础设施层（Infrastructure Layer）。
+
+背景说明：
+- 读取参考音频、stat 输出文件、删除上传文件等操作是同步的，不能直接在事件循环中执行。
+- 这些操作统一提交到固定大小的专用线程池，线程按需创建后常驻复用，
+  与数据库写操作（run_db）的专用写线程相互隔离，避免彼此排队。
+
+架构说明：
+- run_io 在专用线程池中执行同步函数并等待结果。
+- 线程池在首次使用时创建，应用关闭时由 shutdown_io_executor 回收；
+  回收后再次使用会重新创建，便于测试中多次启动应用。
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.config import IO_MAX_WORKERS
+
+T = TypeVar("T")
+
+_io_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """
+    获取专用 IO 线程池，不存在时创建
+    """
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = ThreadPoolExecutor(
+            max_workers=IO_MAX_WORKERS, thread_name_prefix="tts-io"
+        )
+    return _io_executor
+
+
+async def run_io(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    在专用 IO 线程池中执行同步文件操作
+
+    Args:
+        func: 同步函数
+        *args: 位置参数
+        **kwargs: 关键字参数
+
+    Returns:
+        func 的返回值
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_io_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+def shutdown_io_executor():
+    """
+    关闭专用 IO 线程池，等待已提交的操作完成
+    """
+    global _io_executor
+    if _io_executor is not None:
+        _io_executor.shutdown(wait=True)
+        _io_executor = None
@@ -6,24 +6,54 @@
 
 架构说明：
 - 队列采用内存队列（asyncio.Queue）实现，便于开发测试，后续可替换为分布式队列。
-- 任务状态存储于内存字典，生产环境建议持久化。
+- 队列有界（默认 QUEUE_MAXSIZE），阻塞入队在队列满时等待，非阻塞入队抛出 QueueFullError，
+  避免突发流量下内存无限增长。
+- 任务状态的持久化副本在数据库中，内存中的状态表只是缓存：条目为带 __slots__ 的 JobState，
+  按最近更新时间排序，超过 MAX_TRACKED_STATUSES 时淘汰最久未更新的已结束（成功/失败）任务；
+  排队中、运行中以及已取消但尚未处理完的任务不会被淘汰；工作器处理完已取消的任务
+  （出队跳过或运行中被中断）后移除其条目，取消不在本进程队列中的任务时不记录条目，
+  因此不可淘汰的条目不超过队列长度与并发数之和。
+- 运行中的任务登记其执行句柄（asyncio.Task），取消运行中的任务时直接取消该句柄，
+  不必等待合成完成；工作器据此不再回写成功/失败状态，保留已持久化的取消状态。
 - 遵循高内聚低耦合，队列与业务处理解耦，便于扩展和测试。
 - 纯技术实现，不包含业务逻辑，业务逻辑由应用层处理。
 
 依赖说明：
-- 仅依赖 Python 标准库 asyncio、uuid、typing
+- 仅依赖 Python 标准库 asyncio、typing，任务 ID 由 app.util.ids 生成
 - 不依赖业务模型和业务逻辑
 """
 
 import asyncio
-import uuid
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any, Dict, Optional, Callable
+from app.config import QUEUE_MAXSIZE
 from app.models import oc8r
+from app.util.ids import new_id
 
 logger = logging.getLogger(__name__)
 
 
+# 内存中最多保留的任务状态条目数
+MAX_TRACKED_STATUSES = 10_000
+
+# 可以从状态表中淘汰的状态：任务已结束，状态已持久化
+_EVICTABLE_STATUSES = (oc8r.JobStatus.succeeded, oc8r.JobStatus.failed)
+
+
+class QueueFullError(Exception):
+    """队列已满，无法立即入队"""
+
+
+@dataclass(slots=True)
+class JobState:
+    """内存中的任务状态"""
+
+    status: oc8r.JobStatus
+    result: Optional[Any] = None
+
+
 class QueueManager:
     """
     队列管理器 - 纯技术实现
@@ -31,16 +61,23 @@ class QueueManager:
     负责任务入队、状态查询，支持后续扩展多种队列后端。
     """
 
-    def __init__(self):
+    def __init__(
+        self, maxsize: int = QUEUE_MAXSIZE, max_tracked: int = MAX_TRACKED_STATUSES
+    ):
         """
-        初始化内存队列和任务状态字典。
+        初始化内存队列和任务状态表。
+        :param maxsize: 队列最大长度，0 表示不限制
+        :param max_tracked: 状态表最多保留的条目数
         """
-        self.queue = asyncio.Queue()
-        self.status_map: Dict[str, Dict[str, Any]] = {}
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.max_tracked = max_tracked
+        # 任务ID -> 状态，按最近更新时间排序
+        self.status_map: "OrderedDict[str, JobState]" = OrderedDict()
         self.status_callback: Optional[
             Callable[[str, oc8r.JobStatus, Optional[Any]], Any]
         ] = None
-        self.current_task_id: Optional[str] = None
+        # 正在运行的任务ID -> 执行句柄（按开始时间排序），多个工作器并发时可能有多个
+        self.running_task_ids: Dict[str, Optional[asyncio.Future]] = {}
 
     def set_callback(
         self, status_callback: Callable[[str, oc8r.JobStatus, Optional[Any]], Any]
@@ -51,17 +88,28 @@ class QueueManager:
         """
         self.status_callback = status_callback
 
-    async def enqueue(self, payload: Any) -> str:
+    async def enqueue(
+        self, payload: Any, task_id: Optional[str] = None, block: bool = True
+    ) -> str:
         """
         入队一个任务，返回任务ID。
         :param payload: 任务数据
+        :param task_id: 任务ID，未提供时自动生成
+        :param block: 队列满时是否等待；为 False 时立即抛出 QueueFullError
         :return: 任务ID
         """
-        task_id = str(uuid.uuid4())
+        if task_id is None:
+            task_id = new_id()
         task = {"id": task_id, "payload": payload}
-        await self.queue.put(task)
-        self.status_map[task_id] = {}
-        await self.set_status(task_id, oc8r.JobStatus.queued)
+        # 队列未满时同步入队，不创建 put 协程；只有阻塞入队且队列已满时才等待
+        try:
+            self.queue.put_nowait(task)
+        except asyncio.QueueFull as e:
+            if not block:
+                raise QueueFullError("Task queue is full") from e
+            await self.queue.put(task)
+        # 入队方已按 queued 状态落库，这里只记录内存状态，不触发状态回调
+        self._track(task_id, oc8r.JobStatus.queued, None)
         return task_id
 
     def status(self, task_id: str) -> Dict[str, Any]:
@@ -70,31 +118,80 @@ class QueueManager:
         :param task_id: 任务ID
         :return: 状态字典
         """
-        return self.status_map.get(task_id, {"status": "not_found", "result": None})
+        state = self.status_map.get(task_id)
+        if state is None:
+            return {"status": "not_found", "result": None}
+        return {"status": state.status, "result": state.result}
+
+    def is_cancelled(self, task_id: str) -> bool:
+        """
+        判断任务是否已被取消。
+        :param task_id: 任务ID
+        """
+        state = self.status_map.get(task_id)
+        return state is not None and state.status is oc8r.JobStatus.cancelled
+
+    def forget(self, task_id: str):
+        """
+        移除任务的内存状态（任务已出队且不会再更新时调用）。
+        :param task_id: 任务ID
+        """
+        self.status_map.pop(task_id, None)
+
+    def _track(self, task_id: str, status: oc8r.JobStatus, result: Optional[Any]):
+        """
+        记录任务状态并移到表尾，超出上限时淘汰最久未更新的已结束任务。
+        """
+        state = self.status_map.get(task_id)
+        if state is None:
+            self.status_map[task_id] = JobState(status, result)
+        else:
+            state.status = status
+            state.result = result
+            self.status_map.move_to_end(task_id)
+        if len(self.status_map) > self.max_tracked:
+            # 未结束的条目不超过队列长度与并发数之和，扫描范围有限
+            for key, old in self.status_map.items():
+                if old.status in _EVICTABLE_STATUSES:
+                    del self.status_map[key]
+                    break
 
     async def set_status(
-        self, task_id: str, status: oc8r.JobStatus, result: Optional[Any] = None
+        self,
+        task_id: str,
+        status: oc8r.JobStatus,
+        result: Optional[Any] = None,
+        notify: bool = True,
     ):
         """
         更新任务状态。
         :param task_id: 任务ID
         :param status: 状态
         :param result: 结果数据
+        :param notify: 是否触发状态回调（调用方已持久化状态时传 False）
         """
-        self.status_map[task_id]["status"] = status
-        self.status_map[task_id]["result"] = result
-        if self.status_callback is not None:
+        self._track(task_id, status, result)
+        if notify and self.status_callback is not None:
             await self.status_callback(task_id, status, result)
 
-    async def cancel(self, task_id: str):
+    async def cancel(self, task_id: str, notify: bool = True):
         """
-        取消任务。
+        取消任务：排队中的任务在出队时被跳过，运行中的任务立即中断。
         :param task_id: 任务ID
-        """
-        # 确保任务ID在状态映射中存在
-        if task_id not in self.status_map:
-            self.status_map[task_id] = {}
-        await self.set_status(task_id, oc8r.JobStatus.cancelled)
+        :param notify: 是否触发状态回调（调用方已持久化取消状态时传 False）
+        """
+        state = self.status_map.get(task_id)
+        if task_id in self.running_task_ids or (
+            state is not None and state.status is oc8r.JobStatus.queued
+        ):
+            # 只有排队中或运行中的任务需要保留取消标记，由工作器处理完后移除；
+            # 不在本进程队列中的任务（如上次运行遗留的记录）不记录内存状态
+            self._track(task_id, oc8r.JobStatus.cancelled, None)
+        if notify and self.status_callback is not None:
+            await self.status_callback(task_id, oc8r.JobStatus.cancelled, None)
+        job = self.running_task_ids.get(task_id)
+        if job is not None:
+            job.cancel()
 
     async def retry(self, task_id: str, payload: Any):
         """
@@ -105,12 +202,27 @@ class QueueManager:
         await self.queue.put(task)
         await self.set_status(task_id, oc8r.JobStatus.queued)
 
+    def mark_running(self, task_id: str, job: Optional[asyncio.Future] = None):
+        """
+        记录任务开始运行。
+        :param task_id: 任务ID
+        :param job: 任务的执行句柄，取消任务时用于中断执行
+        """
+        self.running_task_ids[task_id] = job
+
+    def mark_finished(self, task_id: str):
+        """
+        记录任务运行结束。
+        :param task_id: 任务ID
+        """
+        self.running_task_ids.pop(task_id, None)
+
     def running_job_id(self) -> Optional[str]:
         """
-        获取正在运行的任务ID。
+        获取正在运行的任务ID（多个时返回最早开始的一个）。
         :return: 正在运行的任务ID
         """
-        return self.current_task_id
+        return next(iter(self.running_task_ids), None)
 
     def queue_length(self) -> int:
         """
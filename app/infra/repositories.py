@@ -9,7 +9,14 @@
 - 每个 Repository 只负责单一领域对象的持久化，保持高内聚低耦合。
 - 通过依赖注入方式传递数据库连接，便于测试与扩展。
 - 所有 SQL 语句均采用参数化，防止 SQL 注入。
+- 仓库的 conn 属性默认返回注入的连接；通过 run_db_read 执行的查询改用只读连接池中的连接，
+  读操作不再与写操作争用同一个连接。
 - 不直接暴露 sqlite3 细节，接口以领域模型为主。
+- TtsJob 的 request/result/error 以 JSON 文本存储，写入用 model_dump_json、读取用
+  model_validate_json 一步完成，不经过中间 dict 与 json 模块；部分更新直接生成
+  COALESCE UPDATE，不先读取整行。
+- 多行查询直接迭代游标逐行转换，不先用 fetchall 生成完整的元组列表；查询仍在
+  run_db/run_db_read 的线程内完成并返回列表，连接归还后不再被访问。
 
 依赖说明：
 - 依赖 app.models.oc8r.Upload, app.models.oc8r.Voice 作为数据模型。
@@ -21,13 +28,78 @@
 """
 
 import sqlite3
-import json
-from typing import Optional, List
+from typing import Any, Dict, Iterable, Optional, List, Set, Tuple, Type, TypeVar
+from pydantic import BaseModel
 from app.models.oc8r import Upload, Voice
 from app.models import oc8r
+from app.db_conn import current_read_conn
+
+M = TypeVar("M", bound=BaseModel)
+
+# TtsJob 查询返回的列，顺序与 TtsJobRepository._row_to_job 一致
+_JOB_COLUMNS = "id, type, status, createdAt, updatedAt, request, result, error"
+
+# 枚举与列值的双向映射，读写时查表，不再逐次 hasattr 探测或调用枚举构造
+_STATUS_TO_STR = {status: status.value for status in oc8r.JobStatus}
+_TYPE_TO_STR = {job_type: job_type.value for job_type in oc8r.Type}
+_STR_TO_STATUS = {value: status for status, value in _STATUS_TO_STR.items()}
+_STR_TO_TYPE = {value: job_type for job_type, value in _TYPE_TO_STR.items()}
+
+# TtsJob 的固定 SQL 在导入时拼好：每次调用不再重新格式化字符串，
+# 文本不变也保证命中连接的预编译语句缓存
+_SQL_INSERT_JOB = (
+    f"INSERT INTO tts_jobs ({_JOB_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_GET_JOB = f"SELECT {_JOB_COLUMNS} FROM tts_jobs WHERE id = ?"
+_SQL_CANCEL_JOB = (
+    "UPDATE tts_jobs SET status = ?, updatedAt = ? "
+    f"WHERE id = ? AND status IN (?, ?) RETURNING {_JOB_COLUMNS}"
+)
+_SQL_LIST_JOBS = (
+    f"SELECT {_JOB_COLUMNS} FROM tts_jobs {{where}}"
+    "ORDER BY createdAt DESC, id DESC LIMIT ? OFFSET ?"
+)
+_SQL_LIST_JOBS_BY_STATUS = (
+    f"SELECT {_JOB_COLUMNS} FROM tts_jobs WHERE status = ? ORDER BY createdAt, id"
+)
+_SQL_UPDATE_JOB = (
+    "UPDATE tts_jobs SET status = COALESCE(?, status), "
+    "result = COALESCE(?, result), error = COALESCE(?, error), "
+    "updatedAt = COALESCE(?, updatedAt) WHERE id = ? AND status != ?"
+)
+
+
+def _dump_json(model: Optional[BaseModel]) -> Optional[str]:
+    """
+    序列化模型为 JSON 文本，None 原样返回
+    """
+    return model.model_dump_json() if model is not None else None
+
+
+def _load_json(model_cls: Type[M], raw: Optional[str]) -> Optional[M]:
+    """
+    从 JSON 文本解析模型，空值或 JSON null 返回 None
+    """
+    if not raw or raw == "null":
+        return None
+    return model_cls.model_validate_json(raw)
+
+
+class _SqliteRepository:
+    """
+    仓库基类，提供 conn 属性
 
+    在 run_db_read 借出的只读连接上下文中返回该只读连接，否则返回构造时注入的连接。
+    """
+
+    _conn: sqlite3.Connection
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        return current_read_conn() or self._conn
 
-class UploadRepository:
+
+class UploadRepository(_SqliteRepository):
     """
     UploadRepository
     ----------------
@@ -39,7 +111,7 @@ class UploadRepository:
         """
         初始化仓库，传入 sqlite3.Connection
         """
-        self.conn = conn
+        self._conn = conn
         self._ensure_table()
 
     def _ensure_table(self):
@@ -79,6 +151,28 @@ class UploadRepository:
         )
         self.conn.commit()
 
+    def add_many(self, uploads: List[Upload]):
+        """
+        在同一事务中批量新增 Upload 记录
+        """
+        self.conn.executemany(
+            "INSERT INTO uploads (id, fileName, contentType, sizeBytes, "
+            "durationSeconds, createdAt) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    upload.id,
+                    upload.fileName,
+                    upload.contentType,
+                    upload.sizeBytes,
+                    upload.durationSeconds,
+                    upload.createdAt,
+                )
+                for upload in uploads
+            ],
+        )
+        self.conn.commit()
+
     def get(self, upload_id: str) -> Optional[Upload]:
         """
         根据 id 查询 Upload
@@ -100,6 +194,19 @@ class UploadRepository:
             )
         return None
 
+    def existing_ids(self, upload_ids: Iterable[str]) -> Set[str]:
+        """
+        批量查询存在的 Upload id，单条 IN (...) 查询
+        """
+        ids = list(upload_ids)
+        if not ids:
+            return set()
+        placeholders = ",".join("?" * len(ids))
+        cur = self.conn.execute(
+            f"SELECT id FROM uploads WHERE id IN ({placeholders})", ids
+        )
+        return {row[0] for row in cur}
+
     def list(self, limit: int = 100, offset: int = 0) -> List[Upload]:
         """
         列表查询 Upload，支持分页
@@ -118,7 +225,7 @@ class UploadRepository:
                 durationSeconds=row[4],
                 createdAt=row[5],
             )
-            for row in cur.fetchall()
+            for row in cur
         ]
 
     def delete(self, upload_id: str):
@@ -129,7 +236,7 @@ class UploadRepository:
         self.conn.commit()
 
 
-class VoiceRepository:
+class VoiceRepository(_SqliteRepository):
     """
     VoiceRepository
     ---------------
@@ -141,7 +248,7 @@ class VoiceRepository:
         """
         初始化仓库，传入 sqlite3.Connection
         """
-        self.conn = conn
+        self._conn = conn
         self._ensure_table()
 
     def _ensure_table(self):
@@ -152,7 +259,7 @@ class VoiceRepository:
             """
         CREATE TABLE IF NOT EXISTS voices (
             id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
+            name TEXT NOT NULL UNIQUE,
             description TEXT,
             uploadId TEXT NOT NULL,
             createdAt TEXT NOT NULL,
@@ -160,26 +267,172 @@ class VoiceRepository:
         )
         """
         )
+        # 键集分页使用的排序索引
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_voices_created_id "
+            "ON voices(createdAt DESC, id DESC)"
+        )
         self.conn.commit()
 
     def add(self, voice: Voice):
         """
         新增 Voice 记录
+
+        名称唯一性由 voices.name 上的 UNIQUE 约束保证。
+
+        Raises:
+            ValueError: 音色名称已存在
+        """
+        try:
+            self.conn.execute(
+                "INSERT INTO voices (id, name, description, uploadId, "
+                "createdAt, updatedAt) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    voice.id,
+                    voice.name,
+                    voice.description,
+                    voice.uploadId,
+                    voice.createdAt,
+                    voice.updatedAt,
+                ),
+            )
+        except sqlite3.IntegrityError as e:
+            self.conn.rollback()
+            if "voices.name" in str(e):
+                raise ValueError("Voice name already exists") from e
+            raise
+        self.conn.commit()
+
+    def insert_if_valid(self, voice: Voice) -> int:
         """
-        self.conn.execute(
-            "INSERT INTO voices (id, name, description, uploadId, "
-            "createdAt, updatedAt) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (
-                voice.id,
-                voice.name,
-                voice.description,
-                voice.uploadId,
-                voice.createdAt,
-                voice.updatedAt,
-            ),
-        )
+        仅当 uploadId 对应的上传记录存在且名称未被占用时新增 Voice
+
+        校验与写入在同一条 INSERT ... SELECT 语句中完成，单条语句天然原子。
+
+        Returns:
+            int: 写入的行数，0 表示上传记录不存在或名称已存在
+
+        Raises:
+            ValueError: 音色名称已存在（并发写入触发唯一约束）
+        """
+        try:
+            cur = self.conn.execute(
+                "INSERT INTO voices (id, name, description, uploadId, "
+                "createdAt, updatedAt) "
+                "SELECT ?, ?, ?, ?, ?, ? "
+                "WHERE EXISTS (SELECT 1 FROM uploads WHERE id = ?) "
+                "AND NOT EXISTS (SELECT 1 FROM voices WHERE name = ?)",
+                (
+                    voice.id,
+                    voice.name,
+                    voice.description,
+                    voice.uploadId,
+                    voice.createdAt,
+                    voice.updatedAt,
+                    voice.uploadId,
+                    voice.name,
+                ),
+            )
+        except sqlite3.IntegrityError as e:
+            self.conn.rollback()
+            if "voices.name" in str(e):
+                raise ValueError("Voice name already exists") from e
+            raise
         self.conn.commit()
+        return cur.rowcount
+
+    def add_many(self, voices: List[Voice]):
+        """
+        在同一事务中批量新增 Voice 记录
+
+        Raises:
+            ValueError: 音色名称已存在（整批回滚）
+        """
+        try:
+            self.conn.executemany(
+                "INSERT INTO voices (id, name, description, uploadId, "
+                "createdAt, updatedAt) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        voice.id,
+                        voice.name,
+                        voice.description,
+                        voice.uploadId,
+                        voice.createdAt,
+                        voice.updatedAt,
+                    )
+                    for voice in voices
+                ],
+            )
+        except sqlite3.IntegrityError as e:
+            self.conn.rollback()
+            if "voices.name" in str(e):
+                raise ValueError("Voice name already exists") from e
+            raise
+        self.conn.commit()
+
+    def existing_names(self, names: Iterable[str]) -> Set[str]:
+        """
+        批量查询已被占用的音色名称，单条 IN (...) 查询
+        """
+        values = list(names)
+        if not values:
+            return set()
+        placeholders = ",".join("?" * len(values))
+        cur = self.conn.execute(
+            f"SELECT name FROM voices WHERE name IN ({placeholders})", values
+        )
+        return {row[0] for row in cur}
+
+    def upload_files(
+        self, voice_ids: Iterable[str]
+    ) -> Dict[str, Tuple[str, Optional[str]]]:
+        """
+        批量查询音色关联的上传记录，单条 JOIN + IN (...) 查询
+
+        Returns:
+            音色ID -> (uploadId, 上传文件名)；不存在的音色不出现在结果中，
+            上传记录不存在时文件名为 None
+        """
+        values = list(voice_ids)
+        if not values:
+            return {}
+        placeholders = ",".join("?" * len(values))
+        cur = self.conn.execute(
+            "SELECT v.id, v.uploadId, u.fileName FROM voices v "
+            f"LEFT JOIN uploads u ON u.id = v.uploadId WHERE v.id IN ({placeholders})",
+            values,
+        )
+        return {row[0]: (row[1], row[2]) for row in cur}
+
+    def get_voice_upload(self, voice_id: str) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        单条 JOIN 查询音色关联的上传记录
+
+        Returns:
+            (uploadId, 上传文件名)，音色不存在时返回 None；
+            上传记录不存在时文件名为 None
+        """
+        cur = self.conn.execute(
+            "SELECT v.uploadId, u.fileName FROM voices v "
+            "LEFT JOIN uploads u ON u.id = v.uploadId WHERE v.id = ?",
+            (voice_id,),
+        )
+        row = cur.fetchone()
+        if row:
+            return row[0], row[1]
+        return None
+
+    def name_exists(self, name: str) -> bool:
+        """
+        判断音色名称是否已存在
+        """
+        cur = self.conn.execute(
+            "SELECT EXISTS (SELECT 1 FROM voices WHERE name = ?)", (name,)
+        )
+        return bool(cur.fetchone()[0])
 
     def get(self, voice_id: str) -> Optional[Voice]:
         """
@@ -202,15 +455,31 @@ class VoiceRepository:
             )
         return None
 
-    def list(self, limit: int = 100, offset: int = 0) -> List[Voice]:
+    def list(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[Tuple[str, str]] = None,
+    ) -> List[Voice]:
         """
         列表查询 Voice，支持分页
+
+        传入 cursor=(createdAt, id) 时使用键集分页，返回排在该记录之后的数据，忽略 offset。
         """
-        cur = self.conn.execute(
-            "SELECT id, name, description, uploadId, createdAt, "
-            "updatedAt FROM voices ORDER BY createdAt DESC LIMIT ? OFFSET ?",
-            (limit, offset),
-        )
+        if cursor is not None:
+            cur = self.conn.execute(
+                "SELECT id, name, description, uploadId, createdAt, "
+                "updatedAt FROM voices WHERE (createdAt, id) < (?, ?) "
+                "ORDER BY createdAt DESC, id DESC LIMIT ?",
+                (cursor[0], cursor[1], limit),
+            )
+        else:
+            cur = self.conn.execute(
+                "SELECT id, name, description, uploadId, createdAt, "
+                "updatedAt FROM voices ORDER BY createdAt DESC, id DESC "
+                "LIMIT ? OFFSET ?",
+                (limit, offset),
+            )
         return [
             Voice(
                 id=row[0],
@@ -220,7 +489,7 @@ class VoiceRepository:
                 createdAt=row[4],
                 updatedAt=row[5],
             )
-            for row in cur.fetchall()
+            for row in cur
         ]
 
     def delete(self, voice_id: str):
@@ -230,8 +499,17 @@ class VoiceRepository:
         self.conn.execute("DELETE FROM voices WHERE id = ?", (voice_id,))
         self.conn.commit()
 
+    def delete_many(self, voice_ids: List[str]):
+        """
+        在同一事务中批量删除 Voice 记录
+        """
+        self.conn.executemany(
+            "DELETE FROM voices WHERE id = ?", [(voice_id,) for voice_id in voice_ids]
+        )
+        self.conn.commit()
+
 
-class TtsJobRepository:
+class TtsJobRepository(_SqliteRepository):
     """
     TtsJobRepository
     ---------------
@@ -243,7 +521,7 @@ class TtsJobRepository:
         """
         初始化仓库，传入 sqlite3.Connection
         """
-        self.conn = conn
+        self._conn = conn
         self._ensure_table()
 
     def _ensure_table(self):
@@ -264,49 +542,34 @@ class TtsJobRepository:
         )
         """
         )
+        # 键集分页使用的排序索引
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_tts_jobs_created_id "
+            "ON tts_jobs(createdAt DESC, id DESC)"
+        )
+        # 按状态过滤时使用的复合索引，命中后结果已按时间有序
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_tts_jobs_status_created "
+            "ON tts_jobs(status, createdAt DESC, id DESC)"
+        )
         self.conn.commit()
 
     def add(self, tts_job: oc8r.TtsJob):
         """
         新增 TtsJob 记录
         """
-        # 序列化复杂对象为JSON字符串，处理枚举类型和AnyUrl类型
-        request_data = None
-        if tts_job.request:
-            request_data = tts_job.request.model_dump(mode="json")
-        request_json = json.dumps(request_data)
-
-        result_data = None
-        if tts_job.result:
-            result_data = tts_job.result.model_dump(mode="json")
-        result_json = json.dumps(result_data)
-
-        error_json = json.dumps(
-            tts_job.error.model_dump(mode="json") if tts_job.error else None
-        )
-
-        # 处理枚举类型
-        type_str = (
-            tts_job.type.value if hasattr(tts_job.type, "value") else str(tts_job.type)
-        )
-        status_str = (
-            tts_job.status.value
-            if hasattr(tts_job.status, "value")
-            else str(tts_job.status)
-        )
-
+        # request 列不允许为空，缺失时与旧数据一致写入 JSON null
         self.conn.execute(
-            "INSERT INTO tts_jobs (id, type, status, createdAt, "
-            "updatedAt, request, result, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            _SQL_INSERT_JOB,
             (
                 tts_job.id,
-                type_str,
-                status_str,
+                _TYPE_TO_STR[tts_job.type],
+                _STATUS_TO_STR[tts_job.status],
                 tts_job.createdAt,
                 tts_job.updatedAt,
-                request_json,
-                result_json,
-                error_json,
+                _dump_json(tts_job.request) or "null",
+                _dump_json(tts_job.result),
+                _dump_json(tts_job.error),
             ),
         )
         self.conn.commit()
@@ -315,98 +578,113 @@ class TtsJobRepository:
         """
         根据 id 查询 TtsJob
         """
-        cur = self.conn.execute(
-            "SELECT id, type, status, createdAt, updatedAt, "
-            "request, result, error FROM tts_jobs WHERE id = ?",
-            (tts_job_id,),
-        )
+        cur = self.conn.execute(_SQL_GET_JOB, (tts_job_id,))
         row = cur.fetchone()
         if row:
-            # 反序列化JSON字段
-            request = None
-            if row[5]:
-                req_data = json.loads(row[5])
-                if req_data:  # 确保不是None
-                    request = oc8r.CreateTtsJobRequest(**req_data)
-
-            result = None
-            if row[6]:
-                res_data = json.loads(row[6])
-                if res_data:  # 确保不是None
-                    result = oc8r.Result(**res_data)
-
-            error = None
-            if row[7]:
-                err_data = json.loads(row[7])
-                if err_data:  # 确保不是None
-                    error = oc8r.ErrorResponse(**err_data)
-
-            return oc8r.TtsJob(
-                id=row[0],
-                type=oc8r.Type(row[1]),
-                status=oc8r.JobStatus(row[2]),
-                createdAt=row[3],
-                updatedAt=row[4],
-                request=request,
-                result=result,
-                error=error,
-            )
+            return self._row_to_job(row)
         return None
 
+    def exists(self, tts_job_id: str) -> bool:
+        """
+        判断指定 id 的 TtsJob 是否存在
+        """
+        cur = self.conn.execute(
+            "SELECT EXISTS(SELECT 1 FROM tts_jobs WHERE id = ?)", (tts_job_id,)
+        )
+        return bool(cur.fetchone()[0])
+
+    def cancel_atomic(self, tts_job_id: str, updated_at: str) -> Optional[oc8r.TtsJob]:
+        """
+        原子地取消 TtsJob：仅当状态为 queued/running 时更新为 cancelled
+
+        条件检查与更新在同一条 UPDATE ... RETURNING 中完成，避免与工作线程之间的
+        读-改-写竞争。任务不存在或状态不允许取消时返回 None。
+        """
+        cur = self.conn.execute(
+            _SQL_CANCEL_JOB,
+            (
+                oc8r.JobStatus.cancelled.value,
+                updated_at,
+                tts_job_id,
+                oc8r.JobStatus.queued.value,
+                oc8r.JobStatus.running.value,
+            ),
+        )
+        row = cur.fetchone()
+        self.conn.commit()
+        return self._row_to_job(row) if row else None
+
     def list(
-        self, status: Optional[str] = None, limit: int = 100, offset: int = 0
+        self,
+        status: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[Tuple[str, str]] = None,
     ) -> List[oc8r.TtsJob]:
         """
         列表查询 TtsJob，支持分页和状态过滤
+
+        传入 cursor=(createdAt, id) 时使用键集分页，返回排在该记录之后的数据，忽略 offset。
         """
+        conditions = []
+        params: list = []
         if status:
-            cur = self.conn.execute(
-                "SELECT id, type, status, createdAt, updatedAt, "
-                "request, result, error FROM tts_jobs WHERE status = ? "
-                "ORDER BY createdAt DESC LIMIT ? OFFSET ?",
-                (status, limit, offset),
-            )
-        else:
-            cur = self.conn.execute(
-                "SELECT id, type, status, createdAt, updatedAt, "
-                "request, result, error FROM tts_jobs "
-                "ORDER BY createdAt DESC LIMIT ? OFFSET ?",
-                (limit, offset),
-            )
-        items: List[oc8r.TtsJob] = []
-        for row in cur.fetchall():
-            # 反序列化JSON字段
-            request = None
-            if row[5]:
-                req_data = json.loads(row[5])
-                if req_data:  # 确保不是None
-                    request = oc8r.CreateTtsJobRequest(**req_data)
-
-            result = None
-            if row[6]:
-                res_data = json.loads(row[6])
-                if res_data:  # 确保不是None
-                    result = oc8r.Result(**res_data)
-
-            error = None
-            if row[7]:
-                err_data = json.loads(row[7])
-                if err_data:  # 确保不是None
-                    error = oc8r.ErrorResponse(**err_data)
-
-            items.append(
-                oc8r.TtsJob(
-                    id=row[0],
-                    type=oc8r.Type(row[1]),
-                    status=oc8r.JobStatus(row[2]),
-                    createdAt=row[3],
-                    updatedAt=row[4],
-                    request=request,
-                    result=result,
-                    error=error,
-                )
-            )
-        return items
+            conditions.append("status = ?")
+            params.append(status)
+        if cursor is not None:
+            conditions.append("(createdAt, id) < (?, ?)")
+            params.extend(cursor)
+            offset = 0
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        cur = self.conn.execute(
+            _SQL_LIST_JOBS.format(where=where),
+            (*params, limit, offset),
+        )
+        return [self._row_to_job(row) for row in cur]
+
+    @staticmethod
+    def _row_to_job(row: tuple) -> oc8r.TtsJob:
+        """
+        将 (id, type, status, createdAt, updatedAt, request, result, error) 行转换为 TtsJob
+        """
+        return oc8r.TtsJob(
+            id=row[0],
+            type=_STR_TO_TYPE[row[1]],
+            status=_STR_TO_STATUS[row[2]],
+            createdAt=row[3],
+            updatedAt=row[4],
+            request=_load_json(oc8r.CreateTtsJobRequest, row[5]),
+            result=_load_json(oc8r.Result, row[6]),
+            error=_load_json(oc8r.ErrorResponse, row[7]),
+        )
+
+    def list_queued(self) -> List[oc8r.TtsJob]:
+        """
+        查询全部排队中的 TtsJob，按创建时间升序
+        """
+        cur = self.conn.execute(
+            _SQL_LIST_JOBS_BY_STATUS,
+            (oc8r.JobStatus.queued.value,),
+        )
+        return [self._row_to_job(row) for row in cur]
+
+    def fail_running(self, error: oc8r.ErrorResponse, updated_at: str) -> int:
+        """
+        将全部运行中的 TtsJob 标记为失败
+
+        :return: 更新的任务数量
+        """
+        cur = self.conn.execute(
+            "UPDATE tts_jobs SET status = ?, error = ?, updatedAt = ? WHERE status = ?",
+            (
+                oc8r.JobStatus.failed.value,
+                _dump_json(error),
+                updated_at,
+                oc8r.JobStatus.running.value,
+            ),
+        )
+        self.conn.commit()
+        return cur.rowcount
 
     def delete(self, tts_job_id: str):
         """
@@ -426,30 +704,55 @@ class TtsJobRepository:
     ) -> None:
         """
         部分更新 TtsJob 的字段（status/result/error/updatedAt）。
-        未提供的字段保持不变。
-        """
-        # 先读取当前记录
-        current = self.get(tts_job_id)
-        if current is None:
-            return
-        new_status = status or current.status
-        new_result = result if result is not None else current.result
-        new_error = error if error is not None else current.error
-        new_updated_at = updatedAt or current.updatedAt
-
-        status_str = (
-            new_status.value if hasattr(new_status, "value") else str(new_status)
-        )
-        result_json = json.dumps(
-            new_result.model_dump(mode="json") if new_result is not None else None
-        )
-        error_json = json.dumps(
-            new_error.model_dump(mode="json") if new_error is not None else None
+        未提供的字段保持不变，任务不存在时不做任何修改。
+        """
+        self.update_many(
+            [
+                (
+                    tts_job_id,
+                    {
+                        "status": status,
+                        "result": result,
+                        "error": error,
+                        "updatedAt": updatedAt,
+                    },
+                )
+            ]
         )
 
-        self.conn.execute(
-            "UPDATE tts_jobs SET status = ?, result = ?, error = ?, "
-            "updatedAt = ? WHERE id = ?",
-            (status_str, result_json, error_json, new_updated_at, tts_job_id),
-        )
+    def update_many(self, updates: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        在一个事务中批量部分更新 TtsJob。
+
+        每项为 (id, fields)，fields 可包含 status/result/error/updatedAt，
+        未提供（或为 None）的字段保持不变。已取消的任务为终态，不会被覆盖
+        （工作器的状态变更可能在取消落库之后才批量刷写）。
+        任一条写入失败时整批回滚并抛出 sqlite3.Error。
+        """
+        params = []
+        for tts_job_id, fields in updates:
+            status = fields.get("status")
+            result = fields.get("result")
+            error = fields.get("error")
+            params.append(
+                (
+                    _STATUS_TO_STR.get(status, status),
+                    _dump_json(result),
+                    _dump_json(error),
+                    fields.get("updatedAt"),
+                    tts_job_id,
+                    oc8r.JobStatus.cancelled.value,
+                )
+            )
+        if not params:
+            return
+        try:
+            self.conn.executemany(
+                _SQL_UPDATE_JOB,
+                params,
+            )
+        except sqlite3.Error:
+            # 回滚已执行的部分，避免未提交的半批被下一次无关写入一并提交
+            self.conn.rollback()
+            raise
         self.conn.commit()
@@ -0,0 +1,88 @@
+"""
+文件级注释：
+本模块提供音频文件的 HTTP 响应实现，属于基础设施层（Infrastructure Layer）。
+
+架构说明：
+- AudioFileResponse 继承 Starlette 的 FileResponse。
+- 当 ASGI 服务器声明支持 http.response.zerocopysend 扩展时，直接把文件描述符交给服务器，
+  由内核 sendfile(2) 将页缓存中的数据拷贝到 socket，避免用户态读缓冲与 bytes 分配。
+- 服务器不支持该扩展（或请求带 Range 头）时，回退到 FileResponse 的默认逻辑：
+  由父类处理 Range/If-Range，返回 206 Partial Content 或 416，
+  使播放器拖动进度时无需重新下载整个文件。
+
+依赖说明：
+- 依赖 Starlette 的 FileResponse 与专用 IO 线程池（app.infra.io_pool）。
+"""
+
+import os
+import stat
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.types import Receive, Scope, Send
+
+from app.infra.io_pool import run_io
+
+# ASGI 零拷贝发送扩展名称
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+
+class AudioFileResponse(FileResponse):
+    """
+    音频文件响应
+
+    优先使用 ASGI zerocopysend 扩展发送整个文件，否则回退到 FileResponse。
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self._can_zerocopy(scope):
+            await self._send_zerocopy(scope, send)
+            if self.background is not None:
+                await self.background()
+            return
+        await super().__call__(scope, receive, send)
+
+    def _can_zerocopy(self, scope: Scope) -> bool:
+        """判断当前请求能否走零拷贝路径（仅整文件 200 响应）"""
+        if scope["type"] != "http" or self.status_code != 200:
+            return False
+        if ZEROCOPY_EXTENSION not in scope.get("extensions", {}):
+            return False
+        # Range 请求交给父类处理
+        return Headers(scope=scope).get("range") is None
+
+    async def _send_zerocopy(self, scope: Scope, send: Send) -> None:
+        """打开文件并发送响应头，再把文件描述符交给服务器执行 sendfile"""
+        stat_result = self.stat_result
+        if stat_result is None:
+            try:
+                stat_result = await run_io(os.stat, self.path)
+            except FileNotFoundError:
+                raise RuntimeError(f"File at path {self.path} does not exist.")
+            if not stat.S_ISREG(stat_result.st_mode):
+                raise RuntimeError(f"File at path {self.path} is not a file.")
+            self.set_stat_headers(stat_result)
+
+        start_message = {
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        }
+        if scope["method"].upper() == "HEAD":
+            await send(start_message)
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        # 先打开文件再发送响应头：文件在 stat 之后被删除时在发出 200 之前报错
+        fd = await run_io(os.open, self.path, os.O_RDONLY)
+        try:
+            await send(start_message)
+            await send(
+                {
+                    "type": ZEROCOPY_EXTENSION,
+                    "file": fd,
+                    "more_body": False,
+                }
+            )
+        finally:
+            os.close(fd)
@@ -4,22 +4,32 @@
 
 架构说明：
 - LocalFileStorage 类负责本地文件存储，支持音频文件（wav、mp3、m4a）。
-- 所有上传文件统一存储于 data/uploads 目录，文件名采用 uuid4 生成，确保唯一性。
-- 提供 save_upload 方法，校验文件类型与大小，超限返回 413 状态码。
+- 所有上传文件统一存储于 data/uploads 目录，文件ID与任务、音色一致采用 UUIDv7（app.util.ids.new_id），
+  确保唯一且按时间有序，uploads 主键索引按追加顺序写入。
+- 提供 save_upload 方法，校验文件类型与大小，分块流式写盘，超限返回 413 状态码；
+  与 save_audio_stream 一致先写 .part 临时文件，完成后原子重命名。
+  请求体在进入处理函数前已由 Starlette 缓存到 SpooledTemporaryFile，复制在一次 IO 线程池
+  调用中以 1MB 分块完成，不再每块各切换一次线程读取、一次线程写入。
+- 上传文件名为 {id}.{扩展名}，upload_path 可直接由上传记录推导路径，无需扫描目录；
+  只有文件ID时按允许的扩展名逐个尝试，同样不扫描目录。
+- 提供 save_audio_stream 方法，将合成音频按块写入临时文件后原子重命名。
 
 依赖说明：
 - 依赖 FastAPI 的 UploadFile 类型。
-- 依赖 uuid4 生成唯一文件名。
-- 依赖 os、shutil 进行文件操作。
+- 依赖 app.util.ids.new_id 生成唯一文件ID。
+- 依赖 os、anyio 进行文件操作。
 """
 
 import os
-import uuid
 import logging
+import anyio
 from fastapi import UploadFile, HTTPException
-from typing import Tuple, Optional
+from typing import AsyncIterable, BinaryIO, List, Tuple, Optional
+from app.infra.io_pool import run_io
+from app.util.ids import new_id
 from app.config import (
     UPLOAD_DIR,
+    OUTPUT_DIR,
     MAX_UPLOAD_BYTES,
     ALLOWED_EXTENSIONS,
     ALLOWED_MIME_TYPES,
@@ -27,6 +37,9 @@ from app.config import (
 
 logger = logging.getLogger(__name__)
 
+# 上传文件流式读写的分块大小
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class LocalFileStorage:
     """
@@ -34,62 +47,99 @@ class LocalFileStorage:
     负责校验并保存上传的音频文件，生成唯一文件ID和落盘路径。
     """
 
-    def __init__(self, upload_dir: str = UPLOAD_DIR):
+    def __init__(self, upload_dir: str = UPLOAD_DIR, output_dir: str = OUTPUT_DIR):
         """
         初始化存储目录，若不存在则自动创建。
         """
         self.upload_dir = upload_dir
+        self.output_dir = output_dir
+        # 输出目录的真实路径前缀，用于校验音频文件路径不越界
+        self._output_root = os.path.realpath(output_dir) + os.sep
         os.makedirs(self.upload_dir, exist_ok=True)
 
-    def save_upload(self, file: UploadFile) -> Tuple[str, str, str, int]:
+    async def save_upload(self, file: UploadFile) -> Tuple[str, str, str, int]:
         """
         保存上传文件到本地磁盘，返回 (id, file_path, content_type, size_bytes)。
         校验扩展名/MIME 类型，仅允许 wav/mp3/m4a，大小不超过 20MB。
+        请求给出 UploadFile.size 且超限时直接拒绝，不写盘；否则在一次 run_io 调用中
+        分块复制到 .part 临时文件并累计大小，超限时中止并删除临时文件，
+        完成后用 os.replace 原子重命名为目标文件。
         超限抛出 HTTP 413 异常。
 
         :param file: FastAPI UploadFile 对象
         :return: (文件ID, 文件路径, Content-Type, 文件字节数)
         """
+        # content_type 每次访问都要查找请求头，只读取一次
+        filename = file.filename
+        content_type = file.content_type
+
         # 校验扩展名
-        if file.filename is None:
+        if filename is None:
             raise HTTPException(status_code=400, detail="Missing filename")
-        ext = self._get_extension(file.filename)
-        if not self._is_allowed_extension(ext):
+        ext = self._get_extension(filename)
+        if ext not in ALLOWED_EXTENSIONS:
             raise HTTPException(status_code=415, detail="Unsupported file extension")
 
         # 校验 MIME 类型
-        if file.content_type is None:
+        if content_type is None:
             raise HTTPException(status_code=400, detail="Missing content type")
-        if not self._is_allowed_mime(file.content_type):
+        if content_type not in ALLOWED_MIME_TYPES:
             raise HTTPException(status_code=415, detail="Unsupported content type")
 
+        # 请求已给出文件大小时直接拒绝超限文件，不写盘
+        if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="File too large (max 20MB)")
+
         # 生成唯一文件ID
-        file_id = str(uuid.uuid4())
+        file_id = new_id()
         file_name = f"{file_id}.{ext}"
         file_path = os.path.join(self.upload_dir, file_name)
+        tmp_path = f"{file_path}.part"
+
+        # 整个复制过程在一次 IO 线程池调用中完成，同时校验大小；
+        # 先写临时文件，写完后原子重命名，最终路径上不会出现写了一半的文件
+        try:
+            size_bytes = await run_io(self._copy_upload, file.file, tmp_path, file_path)
+        except BaseException:
+            # 读取中断（如客户端断开）时同样清理已写入的部分文件
+            await self._remove_partial(tmp_path)
+            raise
 
-        # 读取并写入文件，同时校验大小
+        if size_bytes is None:
+            await self._remove_partial(tmp_path)
+            raise HTTPException(status_code=413, detail="File too large (max 20MB)")
+
+        return file_id, file_path, content_type, size_bytes
+
+    @staticmethod
+    def _copy_upload(src: BinaryIO, tmp_path: str, file_path: str) -> Optional[int]:
+        """
+        按 UPLOAD_CHUNK_SIZE 分块把上传内容复制到临时文件，完成后重命名为目标文件
+        （同步，在线程池中执行）
+
+        :return: 写入的字节数，超过 MAX_UPLOAD_BYTES 时中止并返回 None（临时文件由调用方删除）
+        """
         size_bytes = 0
-        with open(file_path, "wb") as out_file:
-            while True:
-                chunk = file.file.read(1024 * 1024)  # 1MB
-                if not chunk:
-                    break
+        with open(tmp_path, "wb") as out_file:
+            while chunk := src.read(UPLOAD_CHUNK_SIZE):
                 size_bytes += len(chunk)
                 if size_bytes > MAX_UPLOAD_BYTES:
-                    out_file.close()
-                    os.remove(file_path)
-                    raise HTTPException(
-                        status_code=413, detail="File too large (max 20MB)"
-                    )
+                    return None
                 out_file.write(chunk)
+        os.replace(tmp_path, file_path)
+        return size_bytes
 
-        return (
-            file_id,
-            file_path,
-            file.content_type or "application/octet-stream",
-            size_bytes,
-        )
+    @staticmethod
+    async def _remove_partial(file_path: str):
+        """
+        在IO线程池中删除未写完的临时文件，删除失败只记录日志
+        """
+        try:
+            await run_io(os.remove, file_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error("Failed to remove partial file %s: %s", file_path, str(e))
 
     def _get_extension(self, filename: str) -> str:
         """
@@ -97,36 +147,33 @@ class LocalFileStorage:
         """
         return os.path.splitext(filename)[-1].lower().lstrip(".")
 
-    def _is_allowed_extension(self, ext: str) -> bool:
-        """
-        判断扩展名是否允许。
+    def delete_file(self, file_id: str, file_name: Optional[str] = None) -> bool:
         """
-        return ext in ALLOWED_EXTENSIONS
-
-    def _is_allowed_mime(self, mime: str) -> bool:
-        """
-        判断 MIME 类型是否允许。
+        删除指定ID的文件
+        :param file_id: 文件ID
+        :param file_name: 上传时的原始文件名，提供时直接推导路径
+        :return: 是否删除成功
         """
-        return mime in ALLOWED_MIME_TYPES
+        for file_path in self._candidate_paths(file_id, file_name):
+            try:
+                os.remove(file_path)
+                return True
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.error("Failed to delete file %s: %s", file_id, str(e))
+                return False
+        return False
 
-    def delete_file(self, file_id: str) -> bool:
+    def upload_path(self, file_id: str, file_name: str) -> str:
         """
-        删除指定ID的文件
+        根据文件ID与原始文件名推导上传文件路径，无需扫描上传目录
         :param file_id: 文件ID
-        :return: 是否删除成功
+        :param file_name: 上传时的原始文件名（决定扩展名）
+        :return: 文件路径
         """
-        try:
-            # 查找文件（通过文件ID匹配文件名）
-            for filename in os.listdir(self.upload_dir):
-                if filename.startswith(file_id):
-                    file_path = os.path.join(self.upload_dir, filename)
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
-                        return True
-            return False
-        except OSError as e:
-            logger.error("Failed to delete file %s: %s", file_id, str(e))
-            return False
+        ext = self._get_extension(file_name)
+        return os.path.join(self.upload_dir, f"{file_id}.{ext}")
 
     def get_file_path(self, file_id: str) -> Optional[str]:
         """
@@ -134,40 +181,50 @@ class LocalFileStorage:
         :param file_id: 文件ID
         :return: 文件路径，如果不存在返回None
         """
-        try:
-            for filename in os.listdir(self.upload_dir):
-                if filename.startswith(file_id):
-                    file_path = os.path.join(self.upload_dir, filename)
-                    if os.path.exists(file_path):
-                        return file_path
-            return None
-        except OSError as e:
-            logger.error("Failed to get file path for %s: %s", file_id, str(e))
-            return None
+        for file_path in self._candidate_paths(file_id):
+            if os.path.isfile(file_path):
+                return file_path
+        return None
+
+    def _candidate_paths(
+        self, file_id: str, file_name: Optional[str] = None
+    ) -> List[str]:
+        """
+        上传文件可能的路径：已知原始文件名时只有一个，否则逐个尝试允许的扩展名，
+        不扫描上传目录
+        """
+        if file_name:
+            return [self.upload_path(file_id, file_name)]
+        return [
+            os.path.join(self.upload_dir, f"{file_id}.{ext}")
+            for ext in sorted(ALLOWED_EXTENSIONS)
+        ]
 
-    async def save_audio_file(self, audio_data: bytes, filename: str) -> str:
+    async def save_audio_stream(
+        self, chunks: AsyncIterable[bytes], filename: str
+    ) -> str:
         """
-        保存音频文件到输出目录
-        :param audio_data: 音频数据
+        将音频数据块流式写入输出目录
+
+        先写入同目录下的临时文件，写完后原子重命名，读取方不会看到写了一半的文件；
+        写入失败时删除临时文件。
+        :param chunks: 音频数据块的异步迭代器
         :param filename: 文件名
         :return: 文件路径
         """
+        # 目录创建、重命名与清理都交给IO线程池，不阻塞事件循环
+        await run_io(os.makedirs, self.output_dir, exist_ok=True)
+        file_path = os.path.join(self.output_dir, filename)
+        tmp_path = f"{file_path}.part"
         try:
-            # 确保输出目录存在
-            output_dir = "data/outputs"
-            os.makedirs(output_dir, exist_ok=True)
-
-            # 构建完整文件路径
-            file_path = os.path.join(output_dir, filename)
-
-            # 写入文件
-            with open(file_path, "wb") as f:
-                f.write(audio_data)
-
-            return file_path
-        except OSError as e:
-            logger.error("Failed to save audio file %s: %s", filename, str(e))
+            async with await anyio.open_file(tmp_path, "wb") as out_file:
+                async for chunk in chunks:
+                    await out_file.write(chunk)
+            await run_io(os.replace, tmp_path, file_path)
+        except BaseException:
+            await self._remove_partial(tmp_path)
             raise
+        return file_path
 
     async def get_audio_file_path(self, filename: str) -> Optional[str]:
         """
@@ -176,10 +233,14 @@ class LocalFileStorage:
         :return: 文件路径，如果不存在返回None
         """
         try:
-            output_dir = "data/outputs"
-            file_path = os.path.join(output_dir, filename)
+            file_path = os.path.join(self.output_dir, filename)
 
-            if os.path.exists(file_path):
+            # 在线程池中解析并检查文件，避免 stat 阻塞事件循环；
+            # 解析符号链接后必须仍位于输出目录内
+            resolved = await anyio.Path(file_path).resolve()
+            if not str(resolved).startswith(self._output_root):
+                return None
+            if await resolved.is_file():
                 return file_path
             return None
         except OSError as e:
@@ -193,8 +254,7 @@ class LocalFileStorage:
         :return: 是否删除成功
         """
         try:
-            output_dir = "data/outputs"
-            file_path = os.path.join(output_dir, filename)
+            file_path = os.path.join(self.output_dir, filename)
 
             if os.path.exists(file_path):
                 os.remove(file_path)
@@ -13,8 +13,9 @@
 - 应用服务通过ApplicationContainer统一管理，确保依赖注入的一致性。
 """
 
-from fastapi import FastAPI, HTTPException
-from fastapi.exceptions import RequestValidationError
+import asyncio
+
+from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from app.api import health
 from app.api import uploads
@@ -22,12 +23,9 @@ from app.api import queue
 from app.api import voices
 from app.api import jobs
 from app.api import audio
-from app.db_conn import startup, shutdown
-from app.middleware import (
-    http_exception_handler,
-    validation_exception_handler,
-    general_exception_handler,
-)
+from app.db_conn import get_db_conn, startup, shutdown
+from app.infra.io_pool import shutdown_io_executor
+from app.middleware import EXCEPTION_HANDLERS
 from app.container import app_container
 import logging
 
@@ -39,35 +37,47 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     """应用生命周期管理"""
-    # 启动时执行
-    await startup()
-
-    # 初始化应用服务容器
+    # 启动时执行：数据库初始化与不依赖数据库的服务预加载并行进行
     logger.info("Initializing application services...")
+    await asyncio.gather(startup(), app_container.preload())
+
     # 预初始化所有服务，确保依赖关系正确
-    app_container.get_all_services()
+    await app_container.warm_up()
     logger.info("Application services initialized successfully")
 
+    # 启动任务状态的批量写入
+    tts_service = app_container.get_tts_service()
+    tts_service.start_status_writer()
+
     # 获取队列应用服务并启动队列处理
     queue_service = app_container.get_queue_service()
     await queue_service.start_processing()
     logger.info("Queue processing started")
 
+    # 恢复上次运行遗留的任务：重新投递排队中的任务（工作器已启动，队列满时可被消费），
+    # 中断的运行中任务标记为失败
+    recovered, interrupted = await tts_service.recover_jobs()
+    if recovered:
+        logger.info("Re-enqueued %d queued jobs", recovered)
+    if interrupted:
+        logger.info("Marked %d interrupted jobs as failed", interrupted)
+
     yield
 
     # 关闭时执行
     await queue_service.stop_processing()
     logger.info("Queue processing stopped")
+    # 工作器已停止，关闭共享的 IndexTTS 连接池
+    await app_container.get_indextts_client().close()
+    # 刷写剩余的状态变更后再关闭数据库连接
+    await tts_service.stop_status_writer()
+    app_container.release_connection(get_db_conn())
     await shutdown()
+    shutdown_io_executor()
 
 
-# 创建 FastAPI 应用并挂载路由
-app = FastAPI(lifespan=lifespan)
-
-# 注册错误处理中间件
-app.add_exception_handler(HTTPException, http_exception_handler)
-app.add_exception_handler(RequestValidationError, validation_exception_handler)
-app.add_exception_handler(Exception, general_exception_handler)
+# 创建 FastAPI 应用，构造时一并注册错误处理中间件，随后挂载路由
+app = FastAPI(lifespan=lifespan, exception_handlers=EXCEPTION_HANDLERS)
 
 # 注册路由
 app.include_router(health.router, prefix="/api/v1")
@@ -8,71 +8,106 @@
 - 统一转换为ErrorResponse格式
 - 记录错误日志便于调试
 - 支持不同HTTP状态码的错误处理
+- 错误响应体用 model_dump_json 直接序列化，与各接口的成功响应一致；
+  内容固定的 500 响应体在导入时预先序列化
+- EXCEPTION_HANDLERS 汇总全部处理器，应用与测试应用在构造时一次性注册
 
 依赖说明：
 - 依赖FastAPI的异常处理机制
 - 依赖app.models.oc8r.ErrorResponse模型
 """
 
+from typing import Mapping, Optional
+
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from fastapi.exceptions import RequestValidationError
-from app.models import oc8r
+from app.models.oc8r import ErrorResponse
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-async def http_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+# 内容固定的 500 错误响应体，导入时预先序列化为 bytes，响应时无需再编码
+_INTERNAL_ERROR_BODY = (
+    ErrorResponse(code="500", message="Internal Server Error")
+    .model_dump_json()
+    .encode()
+)
+_UNEXPECTED_ERROR_BODY = (
+    ErrorResponse(code="INTERNAL_SERVER_ERROR", message="An unexpected error occurred")
+    .model_dump_json()
+    .encode()
+)
+
+
+def _static_error_response(body: bytes) -> Response:
+    """返回预先序列化的 500 错误响应"""
+    return Response(content=body, status_code=500, media_type="application/json")
+
+
+def _error_response(
+    status_code: int,
+    error_response: ErrorResponse,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """
+    用 model_dump_json 一步序列化错误响应，不经过中间 dict 与 json.dumps
+    """
+    return Response(
+        content=error_response.model_dump_json(),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+async def http_exception_handler(request: Request, exc: Exception) -> Response:
     """
     处理HTTPException异常
     """
     if isinstance(exc, HTTPException):
-        error_response = oc8r.ErrorResponse(
-            code=str(exc.status_code), message=exc.detail
-        )
-        logger.warning(f"HTTP Exception: {exc.status_code} - {exc.detail}")
-        return JSONResponse(
-            status_code=exc.status_code, content=error_response.model_dump()
-        )
+        error_response = ErrorResponse(code=str(exc.status_code), message=exc.detail)
+        logger.warning("HTTP Exception: %s - %s", exc.status_code, exc.detail)
+        return _error_response(exc.status_code, error_response, exc.headers)
     else:
         # 如果不是 HTTPException，返回通用错误
-        error_response = oc8r.ErrorResponse(code="500", message="Internal Server Error")
-        return JSONResponse(status_code=500, content=error_response.model_dump())
+        return _static_error_response(_INTERNAL_ERROR_BODY)
 
 
-async def validation_exception_handler(
-    request: Request, exc: Exception
-) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: Exception) -> Response:
     """
     处理请求验证异常
     """
     if isinstance(exc, RequestValidationError):
-        error_details = []
-        for error in exc.errors():
-            field = " -> ".join(str(loc) for loc in error["loc"])
-            message = error["msg"]
-            error_details.append(f"{field}: {message}")
-
-        error_message = "; ".join(error_details)
-        error_response = oc8r.ErrorResponse(
+        error_message = "; ".join(
+            [
+                f"{' -> '.join(map(str, error['loc']))}: {error['msg']}"
+                for error in exc.errors()
+            ]
+        )
+        error_response = ErrorResponse(
             code="VALIDATION_ERROR",
             message=f"Request validation failed: {error_message}",
         )
-        logger.warning(f"Validation Error: {error_message}")
-        return JSONResponse(status_code=422, content=error_response.model_dump())
+        logger.warning("Validation Error: %s", error_message)
+        return _error_response(422, error_response)
     else:
         # 如果不是 RequestValidationError，返回通用错误
-        error_response = oc8r.ErrorResponse(code="500", message="Internal Server Error")
-        return JSONResponse(status_code=500, content=error_response.model_dump())
+        return _static_error_response(_INTERNAL_ERROR_BODY)
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """
     处理通用异常
     """
-    error_response = oc8r.ErrorResponse(
-        code="INTERNAL_SERVER_ERROR", message="An unexpected error occurred"
-    )
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(status_code=500, content=error_response.model_dump())
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return _static_error_response(_UNEXPECTED_ERROR_BODY)
+
+
+# 全部异常处理器，创建应用时一次性传入 FastAPI(exception_handlers=...)
+EXCEPTION_HANDLERS = {
+    HTTPException: http_exception_handler,
+    RequestValidationError: validation_exception_handler,
+    Exception: general_exception_handler,
+}
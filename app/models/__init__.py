@@ -1,52 +1,82 @@
 """
 模型模块初始化文件
 导出所有模型类供其他模块使用
+
+导出的类在首次访问时才导入所在子模块（PEP 562 模块级 __getattr__）：
+业务代码只使用 app.models.oc8r，导入它时不再顺带构建 indextts2 的全部 pydantic 模型。
 """
 
-# 导入 oc8r 模型（主要业务模型）
-from .oc8r import (
-    CreateTtsJobRequest,
-    TtsJob,
-    TtsJobResponse,
-    TtsJobListResponse,
-    Upload,
-    UploadResponse,
-    Voice,
-    VoiceResponse,
-    VoiceListResponse,
-    QueueStatus,
-    QueueStatusResponse,
-    HealthResponse,
-    JobStatus,
-    TtsMode,
-    OutputFormat,
-    Type,
-    Result,
-    Pagination,
-    PendingResponse,
-    UploadAudioRequest,
-    CreateVoiceRequest,
+import importlib
+from typing import Any, Dict, Tuple
+
+# 导出名 -> (子模块, 子模块中的类名)
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    # oc8r 模型（主要业务模型）
+    **{
+        name: ("oc8r", name)
+        for name in (
+            "CreateTtsJobRequest",
+            "TtsJob",
+            "TtsJobResponse",
+            "TtsJobListResponse",
+            "Upload",
+            "UploadResponse",
+            "Voice",
+            "VoiceResponse",
+            "VoiceListResponse",
+            "QueueStatus",
+            "QueueStatusResponse",
+            "HealthResponse",
+            "JobStatus",
+            "TtsMode",
+            "OutputFormat",
+            "Type",
+            "Result",
+            "Pagination",
+            "PendingResponse",
+            "UploadAudioRequest",
+            "CreateVoiceRequest",
+        )
+    },
     # 重命名冲突的类
-    GenerationArgs as Oc8rGenerationArgs,
-    EmotionFactors as Oc8rEmotionFactors,
-    ErrorResponse as Oc8rErrorResponse,
-)
-
-# 导入 indextts2 模型（API 客户端模型）
-from .indextts2 import (
-    Base,
-    Speaker,
-    ReferenceAudio,
-    Vectors,
-    TextPrompt,
-    AudioWav,
+    "Oc8rGenerationArgs": ("oc8r", "GenerationArgs"),
+    "Oc8rEmotionFactors": ("oc8r", "EmotionFactors"),
+    "Oc8rErrorResponse": ("oc8r", "ErrorResponse"),
+    # 为了向后兼容，保留不带前缀的别名
+    "GenerationArgs": ("oc8r", "GenerationArgs"),
+    "EmotionFactors": ("oc8r", "EmotionFactors"),
+    "ErrorResponse": ("oc8r", "ErrorResponse"),
+    # indextts2 模型（API 客户端模型）
+    **{
+        name: ("indextts2", name)
+        for name in (
+            "Base",
+            "Speaker",
+            "ReferenceAudio",
+            "Vectors",
+            "TextPrompt",
+            "AudioWav",
+        )
+    },
     # 重命名冲突的类
-    GenerationArgs as IndexTtsGenerationArgs,
-    EmotionFactors as IndexTtsEmotionFactors,
-    ErrorResponse as IndexTtsErrorResponse,
-)
-
-# 为了向后兼容，创建别名
-GenerationArgs = Oc8rGenerationArgs
-EmotionFactors = Oc8rEmotionFactors
-ErrorResponse = Oc8rErrorResponse
+    "IndexTtsGenerationArgs": ("indextts2", "GenerationArgs"),
+    "IndexTtsEmotionFactors": ("indextts2", "EmotionFactors"),
+    "IndexTtsErrorResponse": ("indextts2", "ErrorResponse"),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """按需导入导出的模型类，并缓存到模块命名空间"""
+    try:
+        module_name, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -6,20 +6,29 @@ from __future__ import annotations
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import AnyUrl, BaseModel, Field
+from pydantic import AnyUrl, BaseModel, ConfigDict, Field
 
 
 class ErrorResponse(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     code: str = Field(..., description="错误码")
     message: str = Field(..., description="错误信息")
 
 
 class PendingResponse(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     code: int = Field(..., examples=[202])
     message: str = Field(..., examples=["Preview is generating"])
 
 
 class Pagination(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     page: int
     pageSize: int
     total: int
@@ -41,6 +50,9 @@ class TtsMode(Enum):
 
 
 class GenerationArgs(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     doSample: Optional[bool] = True
     topP: Optional[float] = 0.8
     topK: Optional[int] = 30
@@ -52,6 +64,9 @@ class GenerationArgs(BaseModel):
 
 
 class EmotionFactors(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     happy: float
     angry: float
     sad: float
@@ -67,6 +82,9 @@ class OutputFormat(Enum):
 
 
 class CreateTtsJobRequest(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     text: str
     mode: TtsMode
     voiceId: str = Field(..., description="既有克隆音色ID")
@@ -87,12 +105,18 @@ class Type(Enum):
 
 
 class Result(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     audioUrl: Optional[AnyUrl] = None
     durationSeconds: Optional[float] = None
     format: Optional[OutputFormat] = None
 
 
 class TtsJob(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     id: str
     type: Type
     status: JobStatus
@@ -110,24 +134,39 @@ class TtsJob(BaseModel):
 
 
 class TtsJobResponse(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     code: Optional[int] = Field(None, examples=[200])
     message: Optional[str] = Field(None, examples=["OK"])
     job: TtsJob
 
 
 class TtsJobListResponse(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     code: Optional[int] = Field(None, examples=[200])
     message: Optional[str] = Field(None, examples=["OK"])
     jobs: List[TtsJob]
     pagination: Optional[Pagination] = None
+    nextCursor: Optional[str] = Field(
+        None, description="下一页游标，为空表示没有更多数据"
+    )
 
 
 class UploadAudioRequest(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     file: bytes
     filename: Optional[str] = Field(None, description="客户端建议的文件名")
 
 
 class Upload(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     id: str
     fileName: str
     contentType: str
@@ -139,18 +178,27 @@ class Upload(BaseModel):
 
 
 class UploadResponse(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     code: Optional[int] = Field(None, examples=[200])
     message: Optional[str] = Field(None, examples=["OK"])
     upload: Upload
 
 
 class CreateVoiceRequest(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     name: str = Field(..., description="音色显示名称，需在用户空间内唯一")
     description: Optional[str] = None
     uploadId: str = Field(..., description="关联的上传音频ID")
 
 
 class Voice(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     id: str
     name: str
     description: Optional[str] = None
@@ -164,19 +212,31 @@ class Voice(BaseModel):
 
 
 class VoiceResponse(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     code: Optional[int] = Field(None, examples=[200])
     message: Optional[str] = Field(None, examples=["OK"])
     voice: Voice
 
 
 class VoiceListResponse(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     code: Optional[int] = Field(None, examples=[200])
     message: Optional[str] = Field(None, examples=["OK"])
     voices: List[Voice]
     pagination: Optional[Pagination] = None
+    nextCursor: Optional[str] = Field(
+        None, description="下一页游标，为空表示没有更多数据"
+    )
 
 
 class QueueStatus(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     maxConcurrency: int = Field(..., examples=[1])
     runningJobId: Optional[str] = None
     queueLength: int = Field(..., examples=[5])
@@ -184,11 +244,17 @@ class QueueStatus(BaseModel):
 
 
 class QueueStatusResponse(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     code: int = Field(..., examples=[200])
     message: str = Field(..., examples=["OK"])
     status: QueueStatus
 
 
 class HealthResponse(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+    )
     code: Optional[int] = Field(None, examples=[200])
     message: Optional[str] = Field(None, examples=["OK"])
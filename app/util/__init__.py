@@ -0,0 +1,3 @@
+"""
+通用工具包初始化文件
+"""
@@ -0,0 +1,52 @@
+"""
+文件级注释：
+本模块提供键集分页（keyset pagination）游标的编码与解码。
+
+背景说明：
+- 列表接口按 (createdAt, id) 倒序排列，游标记录上一页最后一条记录的排序键。
+- 游标对客户端不透明，使用 URL 安全的 base64 编码 "createdAt|id"。
+"""
+
+import base64
+import binascii
+from typing import Tuple
+
+_SEPARATOR = "|"
+
+
+def encode_cursor(created_at: str, item_id: str) -> str:
+    """
+    将排序键编码为不透明游标
+
+    Args:
+        created_at: 记录创建时间
+        item_id: 记录ID
+
+    Returns:
+        str: URL 安全的 base64 游标
+    """
+    raw = f"{created_at}{_SEPARATOR}{item_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    解码游标为排序键
+
+    Args:
+        cursor: encode_cursor 生成的游标
+
+    Returns:
+        Tuple[str, str]: (createdAt, id)
+
+    Raises:
+        ValueError: 游标格式无效
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    created_at, sep, item_id = raw.partition(_SEPARATOR)
+    if not sep or not created_at or not item_id:
+        raise ValueError("Invalid cursor")
+    return created_at, item_id
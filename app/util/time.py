@@ -0,0 +1,31 @@
+"""
+文件级注释：
+本模块提供时间戳格式化工具。
+
+背景说明：
+- 任务、音色、上传记录的 createdAt/updatedAt 均为本地时间 ISO 格式字符串。
+- datetime.now().isoformat() 每次都要构造 datetime 并在 Python 中格式化；
+  now_iso 按秒缓存 "YYYY-MM-DDTHH:MM:SS" 前缀，只拼接微秒部分。
+"""
+
+import time
+from typing import Tuple
+
+# (秒级时间戳, 对应的格式化前缀)
+_CACHE: Tuple[int, str] = (-1, "")
+
+
+def now_iso() -> str:
+    """
+    获取当前本地时间的 ISO 格式字符串（微秒精度）
+
+    Returns:
+        str: 形如 "2024-01-01T12:00:00.123456" 的时间字符串
+    """
+    global _CACHE
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _CACHE
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds))
+        _CACHE = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
@@ -20,23 +20,18 @@ from app.infra.repositories import TtsJobRepository, VoiceRepository, UploadRepo
 from app.infra.storage import LocalFileStorage
 from app.infra.indextts_client import IndexTtsClient
 from app.models import oc8r
-from app.container import ApplicationContainer
+from app.container import ApplicationContainer, app_container
 from app.application.tts_service import TtsService
 from app.application.voice_service import VoiceService
 from app.application.upload_service import UploadService
 from app.application.queue_service import QueueService
 from app.application.audio_service import AudioService
 from app.application.tts_processor import TtsTaskProcessor
+from app.application.tts_strategies import TtsStrategyFactory
 from app.application.file_service import FileService
 import uuid
 from datetime import datetime
-from app.middleware import (
-    http_exception_handler,
-    validation_exception_handler,
-    general_exception_handler,
-)
-from fastapi.exceptions import RequestValidationError
-from fastapi import HTTPException
+from app.middleware import EXCEPTION_HANDLERS
 from app.api import health, uploads, queue, voices, jobs, audio
 
 
@@ -108,7 +103,8 @@ def test_db():
 
     yield conn
 
-    # 清理
+    # 清理：移除全局容器中绑定到该连接的服务
+    app_container.release_connection(conn)
     conn.close()
     os.unlink(test_db_path)
 
@@ -117,12 +113,8 @@ def test_db():
 def test_app():
     """创建测试专用的FastAPI应用实例"""
     # 创建测试应用，不包含队列相关的启动/关闭钩子
-    test_app = FastAPI()
-
-    # 注册错误处理中间件
-    test_app.add_exception_handler(HTTPException, http_exception_handler)
-    test_app.add_exception_handler(RequestValidationError, validation_exception_handler)
-    test_app.add_exception_handler(Exception, general_exception_handler)
+    # 创建时一并注册错误处理中间件
+    test_app = FastAPI(exception_handlers=EXCEPTION_HANDLERS)
 
     # 注册路由
     test_app.include_router(health.router, prefix="/api/v1")
@@ -150,12 +142,9 @@ def test_client(test_app, test_db):
 @pytest.fixture(scope="function")
 def test_container(test_db):
     """创建测试应用服务容器"""
-    # 创建测试容器实例
+    # 创建独立的测试容器实例
     container = ApplicationContainer()
 
-    # 清理现有服务
-    container.clear_services()
-
     yield container
 
     # 测试后清理
@@ -177,7 +166,7 @@ def mock_queue_manager():
 def mock_storage():
     """创建模拟文件存储"""
     mock_storage = Mock(spec=LocalFileStorage)
-    mock_storage.save_upload = Mock(
+    mock_storage.save_upload = AsyncMock(
         return_value=("test-file-id", "/test/path", "audio/wav", 1024)
     )
     mock_storage.get_file_path = Mock(return_value="/test/path")
@@ -233,9 +222,10 @@ def tts_processor_fixture(test_db, mock_storage, mock_indextts_client):
     voice_repo = VoiceRepository(test_db)
     upload_repo = UploadRepository(test_db)
     file_service = FileService(mock_storage)
-    return TtsTaskProcessor(
-        voice_repo, upload_repo, mock_storage, mock_indextts_client, file_service
+    strategy_factory = TtsStrategyFactory(
+        mock_indextts_client, voice_repo, upload_repo, mock_storage, file_service
     )
+    return TtsTaskProcessor(strategy_factory)
 
 
 @pytest.fixture(scope="function")
@@ -3,10 +3,13 @@
 测试 /audio/{filename} 端点的功能
 """
 
+import asyncio
 import os
 import pytest
 from fastapi import status
 
+from app.infra.responses import AudioFileResponse, ZEROCOPY_EXTENSION
+
 
 class TestAudioEndpoint:
     """音频文件服务端点测试类"""
@@ -41,6 +44,89 @@ class TestAudioEndpoint:
             if os.path.exists(test_file_path):
                 os.remove(test_file_path)
 
+    def test_get_audio_file_range_request(self):
+        """测试 Range 请求返回 206 部分内容"""
+        test_filename = "range_test.wav"
+        test_file_path = os.path.join(self.output_dir, test_filename)
+        test_content = bytes(range(256)) * 4
+        with open(test_file_path, "wb") as f:
+            f.write(test_content)
+
+        try:
+            response = self.client.get(
+                f"/api/v1/audio/{test_filename}", headers={"Range": "bytes=100-199"}
+            )
+
+            assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+            assert (
+                response.headers["content-range"]
+                == f"bytes 100-199/{len(test_content)}"
+            )
+            assert response.headers["accept-ranges"] == "bytes"
+            assert response.content == test_content[100:200]
+
+            response = self.client.get(
+                f"/api/v1/audio/{test_filename}", headers={"Range": "bytes=5000-"}
+            )
+            assert (
+                response.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+            )
+            assert response.headers["content-range"] == f"bytes */{len(test_content)}"
+
+            response = self.client.get(f"/api/v1/audio/{test_filename}")
+            assert response.headers["accept-ranges"] == "bytes"
+            etag = response.headers["etag"]
+
+            # If-Range 与当前 ETag 一致时返回区间，不一致（文件已替换）时返回整个文件
+            response = self.client.get(
+                f"/api/v1/audio/{test_filename}",
+                headers={"Range": "bytes=100-199", "If-Range": etag},
+            )
+            assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+            assert response.content == test_content[100:200]
+            response = self.client.get(
+                f"/api/v1/audio/{test_filename}",
+                headers={"Range": "bytes=100-199", "If-Range": '"stale"'},
+            )
+            assert response.status_code == status.HTTP_200_OK
+            assert response.content == test_content
+        finally:
+            if os.path.exists(test_file_path):
+                os.remove(test_file_path)
+
+    def test_get_audio_file_conditional_request(self):
+        """测试 ETag/Last-Modified 条件请求返回 304"""
+        test_filename = "etag_test.wav"
+        test_file_path = os.path.join(self.output_dir, test_filename)
+        with open(test_file_path, "wb") as f:
+            f.write(b"fake wav file content")
+
+        try:
+            response = self.client.get(f"/api/v1/audio/{test_filename}")
+            assert response.status_code == status.HTTP_200_OK
+            etag = response.headers["etag"]
+            last_modified = response.headers["last-modified"]
+
+            response = self.client.get(
+                f"/api/v1/audio/{test_filename}", headers={"If-None-Match": etag}
+            )
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+            assert response.content == b""
+
+            response = self.client.get(
+                f"/api/v1/audio/{test_filename}",
+                headers={"If-Modified-Since": last_modified},
+            )
+            assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+            response = self.client.get(
+                f"/api/v1/audio/{test_filename}", headers={"If-None-Match": '"other"'}
+            )
+            assert response.status_code == status.HTTP_200_OK
+        finally:
+            if os.path.exists(test_file_path):
+                os.remove(test_file_path)
+
     def test_get_audio_file_not_found(self):
         """测试获取不存在的音频文件"""
         response = self.client.get("/api/v1/audio/non_existent.wav")
@@ -57,6 +143,26 @@ class TestAudioEndpoint:
         data = response.json()
         assert "Only WAV files are supported" in data["message"]
 
+    def test_get_audio_file_invalid_filename(self):
+        """测试文件名包含非法字符时直接拒绝"""
+        response = self.client.get("/api/v1/audio/bad%20name.wav")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Invalid filename" in response.json()["message"]
+
+    def test_get_audio_file_symlink_outside_output_dir(self, tmp_path):
+        """测试指向输出目录之外的符号链接不会被返回"""
+        secret = tmp_path / "secret.wav"
+        secret.write_bytes(b"secret")
+        link_path = os.path.join(self.output_dir, "escape_link.wav")
+        os.symlink(secret, link_path)
+
+        try:
+            response = self.client.get("/api/v1/audio/escape_link.wav")
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+        finally:
+            os.remove(link_path)
+
     def test_get_audio_file_with_special_characters(self):
         """测试文件名包含特殊字符的情况"""
         # 创建包含特殊字符的文件名
@@ -109,3 +215,70 @@ class TestAudioEndpoint:
         finally:
             if os.path.exists(test_file_path):
                 os.remove(test_file_path)
+
+    def test_audio_response_uses_zerocopysend_when_supported(self):
+        """测试服务器声明 zerocopysend 扩展时直接发送文件描述符"""
+        test_filename = "zerocopy_test.wav"
+        test_file_path = os.path.join(self.output_dir, test_filename)
+        test_content = b"fake wav file content"
+        with open(test_file_path, "wb") as f:
+            f.write(test_content)
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "headers": [],
+            "extensions": {ZEROCOPY_EXTENSION: {}},
+        }
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            if message["type"] == ZEROCOPY_EXTENSION:
+                # 在描述符关闭前读取内容
+                message = dict(message, body=os.pread(message["file"], 1024, 0))
+            messages.append(message)
+
+        try:
+            response = AudioFileResponse(test_file_path, media_type="audio/wav")
+            asyncio.run(response(scope, receive, send))
+        finally:
+            os.remove(test_file_path)
+
+        assert messages[0]["type"] == "http.response.start"
+        headers = dict(messages[0]["headers"])
+        assert headers[b"content-length"] == str(len(test_content)).encode()
+        assert messages[1]["type"] == ZEROCOPY_EXTENSION
+        assert messages[1]["body"] == test_content
+
+    def test_zerocopy_missing_file_fails_before_headers(self):
+        """测试 stat 之后文件被删除时在发送响应头之前报错，不会返回无响应体的 200"""
+        test_file_path = os.path.join(self.output_dir, "zerocopy_deleted.wav")
+        with open(test_file_path, "wb") as f:
+            f.write(b"fake wav file content")
+        # 模拟元数据缓存命中后文件被删除
+        st = os.stat(test_file_path)
+        os.remove(test_file_path)
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "headers": [],
+            "extensions": {ZEROCOPY_EXTENSION: {}},
+        }
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        response = AudioFileResponse(
+            test_file_path, media_type="audio/wav", stat_result=st
+        )
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(response(scope, receive, send))
+        assert messages == []
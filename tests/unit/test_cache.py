@@ -0,0 +1,70 @@
+"""
+参考音频缓存单元测试
+"""
+
+import asyncio
+
+from app.infra.cache import AudioBlobCache
+
+
+class TestAudioBlobCache:
+    """AudioBlobCache 测试类"""
+
+    def test_hit_does_not_reload(self):
+        """测试命中缓存时不再调用加载函数"""
+        calls = []
+
+        async def load():
+            calls.append(1)
+            return b"voice-audio"
+
+        async def scenario():
+            cache = AudioBlobCache(max_bytes=1024)
+            first = await cache.get_or_load("upload-1", load)
+            second = await cache.get_or_load("upload-1", load)
+            return first, second
+
+        assert asyncio.run(scenario()) == (b"voice-audio", b"voice-audio")
+        assert len(calls) == 1
+
+    def test_concurrent_misses_share_one_load(self):
+        """测试同一键的并发未命中只加载一次"""
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return b"voice-audio"
+
+        async def scenario():
+            cache = AudioBlobCache(max_bytes=1024)
+            return await asyncio.gather(
+                *(cache.get_or_load("upload-1", load) for _ in range(5))
+            )
+
+        assert asyncio.run(scenario()) == [b"voice-audio"] * 5
+        assert len(calls) == 1
+
+    def test_evicts_least_recently_used_over_budget(self):
+        """测试超出字节预算时淘汰最久未使用的条目"""
+
+        def loader(data):
+            async def load():
+                return data
+
+            return load
+
+        async def scenario():
+            cache = AudioBlobCache(max_bytes=10)
+            await cache.get_or_load("a", loader(b"aaaa"))
+            await cache.get_or_load("b", loader(b"bbbb"))
+            # 访问 a，使 b 成为最久未使用
+            await cache.get_or_load("a", loader(b"xxxx"))
+            await cache.get_or_load("c", loader(b"cccc"))
+            # 超过预算的单个条目不缓存
+            await cache.get_or_load("big", loader(b"z" * 11))
+            return cache
+
+        cache = asyncio.run(scenario())
+        assert cache.size == 8
+        assert list(cache._entries) == ["a", "c"]
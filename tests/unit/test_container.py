@@ -0,0 +1,117 @@
+"""
+应用服务容器测试
+"""
+
+import asyncio
+import sqlite3
+import threading
+
+from app.infra.storage import LocalFileStorage
+from app.models.oc8r import TtsMode
+
+
+class TestApplicationContainer:
+    """ApplicationContainer 缓存策略测试类"""
+
+    def test_connection_bound_services_cached_per_connection(
+        self, test_container, test_db
+    ):
+        """测试同一连接复用服务实例，不同连接各自创建"""
+        other_db = sqlite3.connect(":memory:", check_same_thread=False)
+        try:
+            voice_service = test_container.get_voice_service(test_db)
+            assert test_container.get_voice_service(test_db) is voice_service
+            assert test_container.get_voice_service(other_db) is not voice_service
+        finally:
+            other_db.close()
+
+    def test_repositories_shared_between_services(self, test_container, test_db):
+        """测试同一连接上的服务共享仓储实例"""
+        voice_service = test_container.get_voice_service(test_db)
+        processor = test_container.get_tts_processor(test_db)
+        tts_service = test_container.get_tts_service(test_db)
+
+        strategy = processor.strategy_factory.create_strategy(TtsMode.speaker)
+
+        assert strategy.voice_repo is voice_service.voice_repo
+        assert tts_service.voice_repo is voice_service.voice_repo
+        assert strategy.upload_repo is voice_service.upload_repo
+
+    def test_release_connection_drops_bound_services(self, test_container, test_db):
+        """测试释放连接后移除其服务实例，其他连接不受影响"""
+        other_db = sqlite3.connect(":memory:", check_same_thread=False)
+        try:
+            voice_service = test_container.get_voice_service(test_db)
+            other_service = test_container.get_voice_service(other_db)
+
+            test_container.release_connection(test_db)
+
+            assert test_container.get_voice_service(test_db) is not voice_service
+            assert test_container.get_voice_service(other_db) is other_service
+        finally:
+            other_db.close()
+
+    def test_stateless_components_are_singletons(self, test_container, test_db):
+        """测试文件存储、IndexTTS客户端等无状态组件在服务之间共享"""
+        processor = test_container.get_tts_processor(test_db)
+        voice_service = test_container.get_voice_service(test_db)
+
+        strategy = processor.strategy_factory.create_strategy(TtsMode.speaker)
+
+        assert strategy.client is test_container.get_indextts_client()
+        assert strategy.storage is voice_service.storage
+        assert strategy.file_service is test_container.get_file_service()
+        assert (
+            test_container.get_audio_service().file_service
+            is test_container.get_file_service()
+        )
+
+    def test_clear_services_resets_singletons(self, test_container):
+        """测试清理服务后重新创建单例组件"""
+        storage = test_container.get_storage()
+        test_container.clear_services()
+        assert test_container.get_storage() is not storage
+
+    def test_concurrent_first_access_creates_one_instance(
+        self, test_container, test_db, monkeypatch
+    ):
+        """测试多线程同时首次获取服务时只创建一个实例"""
+        created = []
+        original_init = LocalFileStorage.__init__
+
+        def counting_init(self, *args, **kwargs):
+            created.append(self)
+            original_init(self, *args, **kwargs)
+
+        monkeypatch.setattr(LocalFileStorage, "__init__", counting_init)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(test_container.get_voice_service(test_db))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(created) == 1
+        assert all(service is results[0] for service in results)
+
+    def test_warm_up_builds_services_off_loop(self, test_container, test_db):
+        """测试预热创建的服务与之后获取的实例一致"""
+        services = asyncio.run(test_container.warm_up(test_db))
+
+        assert services["voice_service"] is test_container.get_voice_service(test_db)
+        assert services["tts_processor"] is test_container.get_tts_processor(test_db)
+        assert services["audio_service"] is test_container.get_audio_service()
+
+    def test_preload_creates_db_independent_singletons(self, test_container):
+        """测试预加载不需要数据库连接，只创建与数据库无关的单例"""
+        asyncio.run(test_container.preload())
+
+        assert test_container._indextts_client is not None
+        assert test_container._audio_service is not None
+        assert test_container._services == {}
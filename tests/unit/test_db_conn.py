@@ -0,0 +1,152 @@
+"""
+数据库连接与只读连接池测试
+"""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime
+
+import pytest
+
+import app.db_conn as db_conn_module
+from app.db_conn import ReadConnectionPool, current_read_conn, run_db, run_db_read
+from app.infra.repositories import UploadRepository
+from app.models import oc8r
+
+
+class _ProbeUploadRepository(UploadRepository):
+    """额外返回执行查询时所用只读连接的仓储"""
+
+    def get_with_read_conn(self, upload_id):
+        return self.get(upload_id), current_read_conn()
+
+
+@pytest.fixture
+def pooled_db():
+    """以临时文件数据库作为全局连接，并启用只读连接池"""
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    original = (db_conn_module.db_conn, db_conn_module.read_pool)
+    db_conn_module.db_conn = conn
+    db_conn_module.read_pool = ReadConnectionPool(path, 2)
+    yield conn
+    db_conn_module.read_pool.close()
+    db_conn_module.db_conn, db_conn_module.read_pool = original
+    conn.close()
+    os.unlink(path)
+
+
+class TestReadConnectionPool:
+    """只读连接池测试类"""
+
+    def test_reads_use_pooled_connection(self, pooled_db):
+        """测试只读查询在只读连接上执行，并能读到写连接已提交的数据"""
+        repo = _ProbeUploadRepository(pooled_db)
+        upload = oc8r.Upload(
+            id="upload-1",
+            fileName="a.wav",
+            contentType="audio/wav",
+            sizeBytes=1,
+            createdAt=datetime.now().isoformat(),
+        )
+
+        async def scenario():
+            await run_db(repo.add, upload)
+            return await run_db_read(repo.get_with_read_conn, "upload-1")
+
+        found, reader = asyncio.run(scenario())
+        assert found == upload
+        assert reader is not None and reader is not pooled_db
+        assert current_read_conn() is None
+
+    def test_pooled_connections_are_read_only(self, pooled_db):
+        """测试只读连接拒绝写入"""
+        repo = UploadRepository(pooled_db)
+        upload = oc8r.Upload(
+            id="upload-2",
+            fileName="b.wav",
+            contentType="audio/wav",
+            sizeBytes=1,
+            createdAt=datetime.now().isoformat(),
+        )
+
+        with pytest.raises(sqlite3.OperationalError):
+            asyncio.run(run_db_read(repo.add, upload))
+
+
+class TestRunDb:
+    """写操作执行器测试类"""
+
+    def test_writes_run_on_single_writer_thread(self, pooled_db):
+        """测试并发提交的写操作都在同一个专用写线程中执行"""
+
+        def write(i):
+            pooled_db.execute("CREATE TABLE IF NOT EXISTS t (v INTEGER)")
+            pooled_db.execute("INSERT INTO t (v) VALUES (?)", (i,))
+            pooled_db.commit()
+            return threading.current_thread().name
+
+        async def scenario():
+            return await asyncio.gather(*(run_db(write, i) for i in range(8)))
+
+        names = set(asyncio.run(scenario()))
+        assert len(names) == 1
+        assert names.pop().startswith("tts-db-writer")
+        assert pooled_db.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 8
+
+
+class TestInitDatabase:
+    """表结构初始化测试类"""
+
+    def test_schema_created_once_and_versioned(self, monkeypatch):
+        """测试建表脚本写入 user_version，版本已是最新时跳过"""
+        conn = sqlite3.connect(":memory:")
+        monkeypatch.setattr(db_conn_module, "db_conn", conn)
+        try:
+            db_conn_module._init_database()
+            tables = {
+                row[0]
+                for row in conn.execute("SELECT name FROM sqlite_master")
+                if not row[0].startswith("sqlite_")
+            }
+            assert {"uploads", "voices", "tts_jobs"} <= tables
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            assert version == db_conn_module.SCHEMA_VERSION
+
+            conn.execute("DROP TABLE uploads")
+            db_conn_module._init_database()
+            assert not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'uploads'"
+            ).fetchone()
+        finally:
+            conn.close()
+
+    def test_startup_applies_connection_pragmas(self, monkeypatch, tmp_path):
+        """测试启动时写连接启用 WAL 并应用调优 PRAGMA"""
+        monkeypatch.setattr(db_conn_module, "DB_PATH", str(tmp_path / "tts.db"))
+        monkeypatch.setattr(db_conn_module, "db_conn", None)
+        monkeypatch.setattr(db_conn_module, "read_pool", None)
+
+        async def scenario():
+            await db_conn_module.startup()
+            conn = db_conn_module.db_conn
+            try:
+                return (
+                    conn.execute("PRAGMA journal_mode").fetchone()[0],
+                    conn.execute("PRAGMA synchronous").fetchone()[0],
+                    conn.execute("PRAGMA journal_size_limit").fetchone()[0],
+                    db_conn_module.read_pool is not None,
+                )
+            finally:
+                await db_conn_module.shutdown()
+
+        journal_mode, synchronous, size_limit, has_pool = asyncio.run(scenario())
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert size_limit == 64 * 1024 * 1024
+        assert has_pool
@@ -0,0 +1,33 @@
+"""
+ID 生成工具单元测试
+"""
+
+import time
+import uuid
+
+from app.util.ids import new_id
+
+
+class TestNewId:
+    """new_id 测试类"""
+
+    def test_new_id_is_uuid7(self):
+        """测试生成的 ID 为合法的 UUIDv7"""
+        value = uuid.UUID(new_id())
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_new_id_canonical_format(self):
+        """测试生成的 ID 与 uuid 标准字符串格式一致"""
+        value = new_id()
+        assert value == str(uuid.UUID(value))
+
+    def test_new_id_is_time_ordered(self):
+        """测试不同毫秒生成的 ID 按时间递增"""
+        ids = []
+        for _ in range(3):
+            ids.append(new_id())
+            # 等待进入下一毫秒
+            time.sleep(0.002)
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
@@ -0,0 +1,24 @@
+"""
+专用 IO 线程池测试
+"""
+
+import asyncio
+import threading
+
+from app.infra import io_pool
+
+
+class TestIoPool:
+    """run_io 与线程池生命周期测试类"""
+
+    def test_run_io_uses_dedicated_threads(self):
+        """测试阻塞操作在专用线程池中执行"""
+        name = asyncio.run(io_pool.run_io(lambda: threading.current_thread().name))
+        assert name.startswith("tts-io")
+
+    def test_executor_recreated_after_shutdown(self):
+        """测试关闭后再次使用会重新创建线程池"""
+        first = io_pool.get_io_executor()
+        io_pool.shutdown_io_executor()
+        assert asyncio.run(io_pool.run_io(sum, [1, 2, 3])) == 6
+        assert io_pool.get_io_executor() is not first
@@ -3,13 +3,28 @@ TTS任务端点测试
 测试 /tts/jobs 端点的功能
 """
 
+import asyncio
+import base64
+import json
+import os
+import sqlite3
+import httpx
 import pytest
 from fastapi import status
+from pydantic import BaseModel, ValidationError
 from app.models import oc8r
 from app.infra.repositories import TtsJobRepository, VoiceRepository, UploadRepository
 import uuid
 from datetime import datetime
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
+from app.infra.queue import QueueFullError, QueueManager
+from app.infra.indextts_client import IndexTtsBusyError, IndexTtsClient
+from app.infra import storage as storage_module
+from app.infra.storage import LocalFileStorage
+from app.infra.batched_repo import BatchedJobRepo
+from app.application.file_service import FileService
+from app.application.tts_processor import BUSY_RETRY_CAP_SECONDS
+from app.application.tts_service import TtsService
 
 
 class TestTtsJobEndpoint:
@@ -176,6 +191,28 @@ class TestTtsJobEndpoint:
         assert "job" in data
         assert data["job"]["status"] == "cancelled"
 
+    def test_cancel_tts_job_writes_status_once(self, test_db, sample_tts_job):
+        """测试取消任务只由条件 UPDATE 写库，不再经状态回调重复写入"""
+        job_repo = TtsJobRepository(test_db)
+        job_repo.add(sample_tts_job)
+        queue_manager = QueueManager()
+        service = TtsService(job_repo, VoiceRepository(test_db), queue_manager)
+        service.status_writer.update_async = AsyncMock()
+
+        async def scenario():
+            # 任务在队列中排队时取消，队列保留取消标记供工作器跳过
+            await queue_manager.enqueue({}, task_id=sample_tts_job.id)
+            return await service.cancel_job(sample_tts_job.id)
+
+        job = asyncio.run(scenario())
+
+        assert job.status == oc8r.JobStatus.cancelled
+        assert job_repo.get(sample_tts_job.id).status == oc8r.JobStatus.cancelled
+        assert queue_manager.status(sample_tts_job.id)["status"] == (
+            oc8r.JobStatus.cancelled
+        )
+        service.status_writer.update_async.assert_not_awaited()
+
     def test_cancel_tts_job_not_found(self, test_client):
         """测试取消不存在的TTS任务"""
         response = test_client.post("/api/v1/tts/jobs/non-existent-id/cancel")
@@ -243,3 +280,449 @@ class TestTtsJobEndpoint:
 
         response = test_client.post(f"/api/v1/tts/jobs/{sample_tts_job.id}/retry")
         assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_recover_jobs_on_startup(
+        self, tts_service_fixture, test_db, sample_tts_job, mock_queue_manager
+    ):
+        """测试启动时重新投递全部排队中的任务，并将中断的运行中任务标记为失败"""
+        job_repo = TtsJobRepository(test_db)
+        job_repo.add(sample_tts_job)
+        running = sample_tts_job.model_copy(
+            update={"id": str(uuid.uuid4()), "status": oc8r.JobStatus.running}
+        )
+        job_repo.add(running)
+
+        recovered, interrupted = asyncio.run(tts_service_fixture.recover_jobs())
+
+        assert (recovered, interrupted) == (1, 1)
+        mock_queue_manager.enqueue.assert_awaited_once()
+        assert mock_queue_manager.enqueue.await_args.kwargs["task_id"] == (
+            sample_tts_job.id
+        )
+        failed = job_repo.get(running.id)
+        assert failed.status == oc8r.JobStatus.failed
+        assert failed.error.code == "INTERRUPTED"
+
+    def test_job_repository_round_trip_and_partial_update(
+        self, test_db, sample_tts_job
+    ):
+        """测试任务 JSON 字段往返一致，部分更新不覆盖未提供的字段"""
+        job_repo = TtsJobRepository(test_db)
+        job_repo.add(sample_tts_job)
+        assert job_repo.get(sample_tts_job.id) == sample_tts_job
+
+        result = oc8r.Result(audioUrl="http://example.com/a.wav", durationSeconds=1.5)
+        job_repo.update(
+            sample_tts_job.id, status=oc8r.JobStatus.succeeded, result=result
+        )
+        job_repo.update(sample_tts_job.id, updatedAt="2030-01-01T00:00:00")
+
+        job = job_repo.get(sample_tts_job.id)
+        assert job.status == oc8r.JobStatus.succeeded
+        assert job.result == result
+        assert job.error is None
+        assert job.request == sample_tts_job.request
+        assert job.updatedAt == "2030-01-01T00:00:00"
+        # 不存在的任务不做任何修改
+        job_repo.update("non-existent-id", status=oc8r.JobStatus.failed)
+        assert not job_repo.exists("non-existent-id")
+
+    def test_job_repository_keeps_cancelled_status(self, test_db, sample_tts_job):
+        """测试取消落库后才刷写的状态变更不会覆盖取消状态"""
+        job_repo = TtsJobRepository(test_db)
+        job_repo.add(sample_tts_job)
+        assert job_repo.cancel_atomic(sample_tts_job.id, "2030-01-01T00:00:00")
+
+        job_repo.update_many([(sample_tts_job.id, {"status": oc8r.JobStatus.running})])
+
+        assert job_repo.get(sample_tts_job.id).status == oc8r.JobStatus.cancelled
+
+    def test_create_tts_job_queue_full_discards_job(
+        self,
+        tts_service_fixture,
+        test_db,
+        sample_upload,
+        sample_voice,
+        mock_queue_manager,
+    ):
+        """测试队列已满时新任务不会保留在数据库中"""
+        UploadRepository(test_db).add(sample_upload)
+        VoiceRepository(test_db).add(sample_voice)
+        mock_queue_manager.enqueue.side_effect = QueueFullError("Task queue is full")
+
+        request = oc8r.CreateTtsJobRequest(
+            text="Hello world", mode=oc8r.TtsMode.speaker, voiceId=sample_voice.id
+        )
+        with pytest.raises(QueueFullError):
+            asyncio.run(tts_service_fixture.create_job(request))
+
+        assert TtsJobRepository(test_db).list() == []
+
+    def test_create_tts_job_queue_full_returns_503(self, test_client):
+        """测试队列已满时返回 503 并携带 Retry-After"""
+        with patch(
+            "app.container.app_container.get_tts_service"
+        ) as mock_get_tts_service:
+            mock_tts_service = MagicMock()
+            mock_tts_service.create_job = AsyncMock(
+                side_effect=QueueFullError("Task queue is full")
+            )
+            mock_get_tts_service.return_value = mock_tts_service
+
+            job_data = {
+                "text": "Hello world",
+                "mode": "speaker",
+                "voiceId": "test-voice-id",
+            }
+            response = test_client.post("/api/v1/tts/jobs", json=job_data)
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert "retry-after" in response.headers
+
+
+class TestTtsTaskProcessorRetry:
+    """TTS任务处理器繁忙重试测试类"""
+
+    def test_strategy_instances_are_reused(self, tts_processor_fixture):
+        """测试同一模式的策略实例在任务间复用"""
+        factory = tts_processor_fixture.strategy_factory
+        for mode in oc8r.TtsMode:
+            assert factory.create_strategy(mode) is factory.create_strategy(mode)
+        with pytest.raises(ValueError):
+            factory.create_strategy("unknown")
+
+    def test_process_uses_request_object_from_payload(self, tts_processor_fixture):
+        """测试队列载荷中的请求对象直接传给策略，不重新构造"""
+        strategy = MagicMock()
+        strategy.validate_request = AsyncMock()
+        strategy.synthesize = AsyncMock(return_value={"audioUrl": "ok"})
+        tts_processor_fixture.strategy_factory = MagicMock()
+        tts_processor_fixture.strategy_factory.create_strategy.return_value = strategy
+        request = oc8r.CreateTtsJobRequest(
+            text="Hello world", mode=oc8r.TtsMode.speaker, voiceId="test-voice-id"
+        )
+
+        result = asyncio.run(
+            tts_processor_fixture.process_tts_task({"request": request})
+        )
+
+        assert result == {"audioUrl": "ok"}
+        assert strategy.validate_request.await_args.args[0] is request
+
+    def test_busy_retry_delay_is_capped_and_honors_retry_after(
+        self, tts_processor_fixture
+    ):
+        """测试退避时间不超过上限，且不少于服务端建议的间隔"""
+        for retry_count in range(1, 10):
+            delay = tts_processor_fixture._busy_retry_delay(retry_count, None)
+            assert 0 <= delay <= BUSY_RETRY_CAP_SECONDS
+
+        assert tts_processor_fixture._busy_retry_delay(1, 30.0) >= 30.0
+
+    def test_synthesize_retries_after_busy(self, tts_processor_fixture):
+        """测试服务繁忙后重试成功"""
+        strategy = MagicMock()
+        strategy.synthesize = AsyncMock(
+            side_effect=[IndexTtsBusyError("busy"), {"audioUrl": "ok"}]
+        )
+        request = oc8r.CreateTtsJobRequest(
+            text="Hello world", mode=oc8r.TtsMode.speaker, voiceId="test-voice-id"
+        )
+
+        with patch("app.application.tts_processor.random.uniform", return_value=0):
+            result = asyncio.run(
+                tts_processor_fixture._synthesize_with_retry(strategy, request)
+            )
+
+        assert result == {"audioUrl": "ok"}
+        assert strategy.synthesize.await_count == 2
+
+
+class TestStreamingSynthesis:
+    """流式合成与保存测试类"""
+
+    def test_http_client_recreated_after_close(self):
+        """测试关闭后再次使用客户端会重建连接池，重复关闭无副作用"""
+        client = IndexTtsClient(base_url="http://indextts.test")
+        first = client.client
+        assert client.client is first
+
+        asyncio.run(client.close())
+        asyncio.run(client.close())
+
+        assert client.client is not first
+
+    @staticmethod
+    def _client(handler) -> IndexTtsClient:
+        client = IndexTtsClient(base_url="http://indextts.test")
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    def test_stream_synthesis_saved_to_disk(self, tmp_path):
+        """测试流式解码的音频数据完整写入输出目录"""
+        audio = bytes(range(256)) * 50
+        requests = []
+
+        def handler(request):
+            requests.append(json.loads(request.content))
+            return httpx.Response(
+                200, content=json.dumps(base64.b64encode(audio).decode()).encode()
+            )
+
+        client = self._client(handler)
+        file_service = FileService(LocalFileStorage(output_dir=str(tmp_path)))
+
+        chunks = client.stream_synthesize_speaker(
+            text="Hello world", prompt_audio=b"prompt"
+        )
+        result = asyncio.run(
+            file_service.save_audio_result_stream(chunks, job_id="job-1")
+        )
+
+        assert result["audioUrl"].endswith("/api/v1/audio/job-1.wav")
+        assert (tmp_path / "job-1.wav").read_bytes() == audio
+        assert requests[0]["text"] == "Hello world"
+        assert base64.b64decode(requests[0]["prompt_audio"]) == b"prompt"
+        assert requests[0]["generation_args"] == oc8r.GenerationArgs().model_dump()
+        assert requests[0]["max_text_tokens_per_segment"] == 120
+
+    def test_binary_audio_response_used_directly(self, tmp_path):
+        """测试后端返回二进制音频时直接使用响应字节"""
+        audio = bytes(range(256)) * 50
+        accepts = []
+
+        def handler(request):
+            accepts.append(request.headers["Accept"])
+            return httpx.Response(
+                200, content=audio, headers={"Content-Type": "audio/wav"}
+            )
+
+        client = self._client(handler)
+        file_service = FileService(LocalFileStorage(output_dir=str(tmp_path)))
+
+        assert (
+            asyncio.run(client.synthesize_speaker(text="Hi", prompt_audio=b"p"))
+            == audio
+        )
+        chunks = client.stream_synthesize_speaker(text="Hi", prompt_audio=b"p")
+        asyncio.run(file_service.save_audio_result_stream(chunks, job_id="job-3"))
+
+        assert (tmp_path / "job-3.wav").read_bytes() == audio
+        assert all(accept.startswith("audio/wav") for accept in accepts)
+
+    def test_in_flight_requests_capped(self):
+        """测试同时发往后端的合成请求数不超过并发上限"""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(
+                200, content=b"RIFF", headers={"Content-Type": "audio/wav"}
+            )
+
+        client = IndexTtsClient(base_url="http://indextts.test", max_concurrency=2)
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        async def scenario():
+            return await asyncio.gather(
+                *(
+                    client.synthesize_speaker(text="Hi", prompt_audio=b"p")
+                    for _ in range(6)
+                )
+            )
+
+        assert asyncio.run(scenario()) == [b"RIFF"] * 6
+        assert peak == 2
+
+    def test_stream_synthesis_busy_leaves_no_file(self, tmp_path):
+        """测试服务繁忙时抛出带 Retry-After 的异常且不留下文件"""
+
+        def handler(request):
+            return httpx.Response(429, headers={"Retry-After": "7"})
+
+        client = self._client(handler)
+        file_service = FileService(LocalFileStorage(output_dir=str(tmp_path)))
+
+        chunks = client.stream_synthesize_speaker(
+            text="Hello world", prompt_audio=b"prompt"
+        )
+        with pytest.raises(IndexTtsBusyError) as exc_info:
+            asyncio.run(file_service.save_audio_result_stream(chunks, job_id="job-2"))
+
+        assert exc_info.value.retry_after == 7.0
+        assert list(tmp_path.iterdir()) == []
+
+    def test_save_audio_stream_file_ops_off_loop(self, tmp_path, monkeypatch):
+        """测试流式保存的目录创建与重命名经由IO线程池执行"""
+        called = []
+        run_io = storage_module.run_io
+
+        async def spy(func, *args, **kwargs):
+            called.append(func)
+            return await run_io(func, *args, **kwargs)
+
+        monkeypatch.setattr(storage_module, "run_io", spy)
+        storage = LocalFileStorage(output_dir=str(tmp_path / "out"))
+
+        async def chunks():
+            yield b"RIFF"
+            yield b"data"
+
+        path = asyncio.run(storage.save_audio_stream(chunks(), "job-4.wav"))
+
+        assert (tmp_path / "out" / "job-4.wav").read_bytes() == b"RIFFdata"
+        assert path.endswith("job-4.wav")
+        assert os.makedirs in called and os.replace in called
+
+
+class TestBatchedJobRepo:
+    """任务状态批量写入测试类"""
+
+    def test_updates_merged_into_one_write(self, test_db, sample_tts_job):
+        """测试同一窗口内的多次状态变更合并为一次写入"""
+        job_repo = TtsJobRepository(test_db)
+        job_repo.add(sample_tts_job)
+        writes = []
+        update_many = job_repo.update_many
+
+        def spy(updates):
+            writes.append(updates)
+            update_many(updates)
+
+        job_repo.update_many = spy
+        writer = BatchedJobRepo(job_repo, flush_interval=1.0)
+
+        async def scenario():
+            writer.start()
+            await writer.update_async(
+                sample_tts_job.id, status=oc8r.JobStatus.running, updatedAt="t1"
+            )
+            await writer.update_async(
+                sample_tts_job.id,
+                status=oc8r.JobStatus.succeeded,
+                result=oc8r.Result(audioUrl="http://example.com/audio.wav"),
+                updatedAt="t2",
+            )
+            await writer.stop()
+
+        asyncio.run(scenario())
+
+        assert len(writes) == 1
+        job = job_repo.get(sample_tts_job.id)
+        assert job.status == oc8r.JobStatus.succeeded
+        assert str(job.result.audioUrl) == "http://example.com/audio.wav"
+        assert job.updatedAt == "t2"
+
+    def test_failed_batch_rolled_back(self, test_db, sample_tts_job):
+        """测试批量更新中途失败时整批回滚，不会被之后的写入一并提交"""
+        job_repo = TtsJobRepository(test_db)
+        job_repo.add(sample_tts_job)
+        other = sample_tts_job.model_copy(update={"id": str(uuid.uuid4())})
+        job_repo.add(other)
+
+        with pytest.raises(sqlite3.Error):
+            job_repo.update_many(
+                [
+                    (sample_tts_job.id, {"status": oc8r.JobStatus.running}),
+                    # 无法绑定的参数使第二条语句失败
+                    (other.id, {"updatedAt": object()}),
+                ]
+            )
+        # 之后的无关写入提交时不应带上失败批次中已执行的部分
+        job_repo.add(sample_tts_job.model_copy(update={"id": str(uuid.uuid4())}))
+
+        assert job_repo.get(sample_tts_job.id).status == oc8r.JobStatus.queued
+
+    def test_terminal_update_flushed_before_return(self, test_db, sample_tts_job):
+        """测试终态更新不等待时间窗口，返回前已与排队中的更新一起落库"""
+        job_repo = TtsJobRepository(test_db)
+        job_repo.add(sample_tts_job)
+        writer = BatchedJobRepo(job_repo, flush_interval=10.0)
+
+        async def scenario():
+            writer.start()
+            await writer.update_async(
+                sample_tts_job.id, status=oc8r.JobStatus.running, updatedAt="t1"
+            )
+            await asyncio.wait_for(
+                writer.update_async(
+                    sample_tts_job.id,
+                    status=oc8r.JobStatus.failed,
+                    updatedAt="t2",
+                ),
+                timeout=1.0,
+            )
+            job = job_repo.get(sample_tts_job.id)
+            await writer.stop()
+            return job
+
+        job = asyncio.run(scenario())
+
+        assert job.status == oc8r.JobStatus.failed
+        assert job.updatedAt == "t2"
+
+    def test_terminal_update_raises_when_flush_fails(self, test_db, sample_tts_job):
+        """测试终态更新所在批次写入失败时 update_async 抛出异常，写入器继续工作"""
+        job_repo = TtsJobRepository(test_db)
+        job_repo.add(sample_tts_job)
+        update_many = job_repo.update_many
+        calls = []
+
+        def flaky(updates):
+            calls.append(updates)
+            if len(calls) == 1:
+                raise sqlite3.OperationalError("database is locked")
+            update_many(updates)
+
+        job_repo.update_many = flaky
+        writer = BatchedJobRepo(job_repo, flush_interval=10.0)
+
+        async def scenario():
+            writer.start()
+            with pytest.raises(sqlite3.OperationalError):
+                await asyncio.wait_for(
+                    writer.update_async(
+                        sample_tts_job.id,
+                        status=oc8r.JobStatus.succeeded,
+                        updatedAt="t1",
+                    ),
+                    timeout=1.0,
+                )
+            await asyncio.wait_for(
+                writer.update_async(
+                    sample_tts_job.id, status=oc8r.JobStatus.failed, updatedAt="t2"
+                ),
+                timeout=1.0,
+            )
+            await writer.stop()
+
+        asyncio.run(scenario())
+
+        assert job_repo.get(sample_tts_job.id).status == oc8r.JobStatus.failed
+
+
+class TestGeneratedModels:
+    """生成模型测试类"""
+
+    def test_oc8r_models_frozen(self):
+        """测试 oc8r 生成的模型全部为不可变（由 make gen 的 --enable-faux-immutability 生成）"""
+        models = [
+            obj
+            for obj in vars(oc8r).values()
+            if isinstance(obj, type)
+            and issubclass(obj, BaseModel)
+            and obj.__module__ == oc8r.__name__
+        ]
+        assert models
+        for model in models:
+            assert model.model_config.get("frozen") is True, model.__name__
+
+    def test_frozen_job_rejects_assignment(self, sample_tts_job):
+        """测试对任务对象赋值会抛出 ValidationError"""
+        with pytest.raises(ValidationError):
+            sample_tts_job.status = oc8r.JobStatus.running
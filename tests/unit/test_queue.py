@@ -3,8 +3,12 @@
 测试 /queue/status 端点的功能
 """
 
+import asyncio
 from fastapi import status
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
+from app.application.queue_service import QueueService
+from app.infra.queue import QueueFullError, QueueManager
+from app.models.oc8r import JobStatus
 
 
 class TestQueueEndpoint:
@@ -106,3 +110,253 @@ class TestQueueEndpoint:
 
         assert response.status_code == status.HTTP_200_OK
         assert response.headers["content-type"] == "application/json"
+
+    def test_worker_pool_processes_tasks_concurrently(self):
+        """测试多个工作器并发消费同一队列"""
+
+        async def scenario():
+            queue_manager = QueueManager(maxsize=4)
+            started = []
+            release = asyncio.Event()
+
+            async def process_tts_task(payload):
+                started.append(payload)
+                await release.wait()
+                return {"audioUrl": "http://example.com/audio.wav"}
+
+            processor = MagicMock()
+            processor.process_tts_task = process_tts_task
+            queue_service = QueueService(queue_manager, processor, concurrency=2)
+
+            await queue_service.start_processing()
+            await queue_manager.enqueue("a", task_id="task-a")
+            await queue_manager.enqueue("b", task_id="task-b")
+            # 让出事件循环，使两个工作器都取到任务
+            for _ in range(10):
+                await asyncio.sleep(0)
+            running = set(queue_manager.running_task_ids)
+            status_obj = await queue_service.get_status()
+
+            release.set()
+            await queue_manager.queue.join()
+            await queue_service.stop_processing()
+            return started, running, status_obj
+
+        started, running, status_obj = asyncio.run(scenario())
+        assert sorted(started) == ["a", "b"]
+        assert running == {"task-a", "task-b"}
+        assert status_obj.maxConcurrency == 2
+
+    def test_is_processing_tracks_worker_lifecycle(self):
+        """测试 is_processing 随工作器启动、异常退出与停止变化"""
+
+        async def scenario():
+            queue_service = QueueService(QueueManager(maxsize=4), MagicMock())
+            before = queue_service.is_processing()
+            await queue_service.start_processing()
+            started = queue_service.is_processing()
+            # 工作器意外退出后不再视为处理中
+            queue_service._worker_tasks[0].cancel()
+            await asyncio.gather(*queue_service._worker_tasks, return_exceptions=True)
+            crashed = queue_service.is_processing()
+            await queue_service.stop_processing()
+            return before, started, crashed, queue_service.is_processing()
+
+        assert asyncio.run(scenario()) == (False, True, False, False)
+
+    def test_worker_skips_cancelled_tasks_without_status_writes(self):
+        """测试入队与跳过已取消任务都不触发状态回调，只有实际执行的任务回写状态"""
+
+        async def scenario():
+            queue_manager = QueueManager(maxsize=8)
+            callback = AsyncMock()
+            queue_manager.set_callback(callback)
+            processor = MagicMock()
+            processor.process_tts_task = AsyncMock(return_value={"audioUrl": "ok"})
+            queue_service = QueueService(queue_manager, processor)
+
+            for task_id in ("c1", "c2", "run"):
+                await queue_manager.enqueue(task_id, task_id=task_id)
+            enqueue_calls = callback.await_count
+            await queue_manager.cancel("c1", notify=False)
+            await queue_manager.cancel("c2", notify=False)
+
+            await queue_service.start_processing()
+            await queue_manager.queue.join()
+            await queue_service.stop_processing()
+            return enqueue_calls, processor.process_tts_task, callback, queue_manager
+
+        enqueue_calls, handler, callback, queue_manager = asyncio.run(scenario())
+        assert enqueue_calls == 0
+        # 跳过的已取消任务已出队，其内存状态被移除
+        assert queue_manager.status("c1")["status"] == "not_found"
+        assert queue_manager.status("run")["status"] == JobStatus.succeeded
+        handler.assert_awaited_once_with("run")
+        assert [c.args[:2] for c in callback.await_args_list] == [
+            ("run", JobStatus.running),
+            ("run", JobStatus.succeeded),
+        ]
+
+    def test_status_map_evicts_only_finished_tasks(self):
+        """测试状态表超出上限时只淘汰最久未更新的已结束任务"""
+
+        async def scenario():
+            queue_manager = QueueManager(maxsize=8, max_tracked=3)
+            await queue_manager.enqueue("queued", task_id="queued")
+            await queue_manager.enqueue("cancelled", task_id="cancelled")
+            await queue_manager.cancel("cancelled", notify=False)
+            for task_id in ("done-1", "done-2"):
+                await queue_manager.set_status(
+                    task_id, JobStatus.succeeded, notify=False
+                )
+            return queue_manager
+
+        queue_manager = asyncio.run(scenario())
+        assert list(queue_manager.status_map) == ["queued", "cancelled", "done-2"]
+        assert queue_manager.is_cancelled("cancelled")
+        assert queue_manager.status("done-1")["status"] == "not_found"
+
+    def test_cancel_unknown_task_not_tracked(self):
+        """测试取消不在本进程队列中的任务时不留下不可淘汰的内存条目，仍触发状态回调"""
+
+        async def scenario():
+            queue_manager = QueueManager(maxsize=8)
+            callback = AsyncMock()
+            queue_manager.set_callback(callback)
+            await queue_manager.cancel("ghost")
+            return queue_manager, callback
+
+        queue_manager, callback = asyncio.run(scenario())
+        assert queue_manager.status_map == {}
+        callback.assert_awaited_once_with("ghost", JobStatus.cancelled, None)
+
+    def test_cancel_interrupts_running_task(self):
+        """测试取消运行中的任务立即中断执行，且不回写成功状态"""
+
+        async def scenario():
+            queue_manager = QueueManager(maxsize=8)
+            callback = AsyncMock()
+            queue_manager.set_callback(callback)
+            started = asyncio.Event()
+            interrupted = asyncio.Event()
+
+            async def slow_task(payload):
+                started.set()
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    interrupted.set()
+                    raise
+
+            processor = MagicMock()
+            processor.process_tts_task = slow_task
+            queue_service = QueueService(queue_manager, processor)
+
+            await queue_manager.enqueue("slow", task_id="slow")
+            await queue_service.start_processing()
+            await started.wait()
+            await queue_manager.cancel("slow", notify=False)
+            await asyncio.wait_for(queue_manager.queue.join(), timeout=5)
+            still_processing = queue_service.is_processing()
+            await queue_service.stop_processing()
+            return callback, interrupted.is_set(), still_processing, queue_manager
+
+        callback, interrupted, still_processing, queue_manager = asyncio.run(scenario())
+        assert interrupted
+        assert still_processing
+        assert [c.args[:2] for c in callback.await_args_list] == [
+            ("slow", JobStatus.running)
+        ]
+        assert queue_manager.running_job_id() is None
+        # 被中断的任务处理完毕后不再保留内存状态
+        assert queue_manager.status_map == {}
+
+    def test_enqueue_when_full(self):
+        """测试队列满时非阻塞入队抛出 QueueFullError，阻塞入队等待出队后完成"""
+
+        async def scenario():
+            queue_manager = QueueManager(maxsize=1)
+            await queue_manager.enqueue("first", task_id="first")
+            try:
+                await queue_manager.enqueue("second", task_id="second", block=False)
+                raised = False
+            except QueueFullError:
+                raised = True
+            pending = asyncio.ensure_future(
+                queue_manager.enqueue("third", task_id="third")
+            )
+            await asyncio.sleep(0)
+            waited = not pending.done()
+            queue_manager.queue.get_nowait()
+            await asyncio.wait_for(pending, timeout=1)
+            return raised, waited, queue_manager
+
+        raised, waited, queue_manager = asyncio.run(scenario())
+        assert raised
+        assert waited
+        assert queue_manager.queue.get_nowait()["id"] == "third"
+        assert queue_manager.status("second")["status"] == "not_found"
+
+    def test_cancel_during_completion_forgets_task(self):
+        """测试合成完成前被取消（未中断）的任务不回写成功状态，且移除内存状态"""
+
+        async def scenario():
+            queue_manager = QueueManager(maxsize=8)
+            callback = AsyncMock()
+            queue_manager.set_callback(callback)
+
+            async def cancelling_task(payload):
+                # 模拟合成结束前收到取消：只标记状态，不中断执行句柄
+                queue_manager._track("late", JobStatus.cancelled, None)
+                return "done"
+
+            processor = MagicMock()
+            processor.process_tts_task = cancelling_task
+            queue_service = QueueService(queue_manager, processor)
+
+            await queue_manager.enqueue("late", task_id="late")
+            await queue_service.start_processing()
+            await asyncio.wait_for(queue_manager.queue.join(), timeout=5)
+            await queue_service.stop_processing()
+            return callback, queue_manager
+
+        callback, queue_manager = asyncio.run(scenario())
+        assert [c.args[:2] for c in callback.await_args_list] == [
+            ("late", JobStatus.running)
+        ]
+        assert queue_manager.status_map == {}
+
+    def test_worker_survives_status_write_failure(self):
+        """测试终态写库失败时工作器不退出，继续处理后续任务"""
+
+        async def scenario():
+            queue_manager = QueueManager(maxsize=8)
+            callback = AsyncMock()
+
+            async def failing_terminal(task_id, status, result):
+                await callback(task_id, status, result)
+                if task_id == "first" and status is not JobStatus.running:
+                    raise RuntimeError("database is locked")
+
+            queue_manager.set_callback(failing_terminal)
+            processor = MagicMock()
+            processor.process_tts_task = AsyncMock(return_value={"audioUrl": "ok"})
+            queue_service = QueueService(queue_manager, processor)
+
+            await queue_manager.enqueue("first", task_id="first")
+            await queue_manager.enqueue("second", task_id="second")
+            await queue_service.start_processing()
+            await asyncio.wait_for(queue_manager.queue.join(), timeout=5)
+            alive = queue_service.is_processing()
+            await queue_service.stop_processing()
+            return alive, callback
+
+        alive, callback = asyncio.run(scenario())
+        assert alive
+        assert [c.args[:2] for c in callback.await_args_list] == [
+            ("first", JobStatus.running),
+            ("first", JobStatus.succeeded),
+            ("first", JobStatus.failed),
+            ("second", JobStatus.running),
+            ("second", JobStatus.succeeded),
+        ]
@@ -0,0 +1,50 @@
+"""
+路由注册测试
+校验应用只注册了一份接口路由，避免重复的 router 被同时挂载，
+以及异常处理器在创建应用时注册
+"""
+
+import asyncio
+import json
+from collections import Counter
+from fastapi import HTTPException
+from fastapi.routing import APIRoute
+from app.main import app
+from app.middleware import EXCEPTION_HANDLERS
+
+
+class TestRouteRegistration:
+    """路由注册测试类"""
+
+    def test_no_duplicate_routes(self):
+        """测试同一路径与方法只注册一次"""
+        counter = Counter(
+            (route.path, method)
+            for route in app.routes
+            if isinstance(route, APIRoute)
+            for method in route.methods
+        )
+        duplicates = [key for key, count in counter.items() if count > 1]
+
+        assert duplicates == []
+
+    def test_error_handlers_return_error_response_json(self):
+        """测试异常处理器返回 ErrorResponse 格式的 JSON 响应体"""
+
+        async def scenario():
+            http = await EXCEPTION_HANDLERS[HTTPException](
+                None, HTTPException(status_code=404, detail="Voice not found")
+            )
+            unexpected = await EXCEPTION_HANDLERS[Exception](None, RuntimeError("boom"))
+            return http, unexpected
+
+        http, unexpected = asyncio.run(scenario())
+
+        assert (
+            app.exception_handlers[HTTPException] is EXCEPTION_HANDLERS[HTTPException]
+        )
+        assert http.status_code == 404
+        assert http.media_type == "application/json"
+        assert json.loads(http.body)["message"] == "Voice not found"
+        assert unexpected.status_code == 500
+        assert json.loads(unexpected.body)["code"] == "INTERNAL_SERVER_ERROR"
@@ -3,12 +3,20 @@
 测试 /uploads 端点的功能
 """
 
+import asyncio
+from io import BytesIO
+
 import pytest
-from fastapi import status
+from fastapi import HTTPException, UploadFile, status
 from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
 import tempfile
 import os
+from starlette.datastructures import Headers
+
+from app.application.upload_service import UploadService
+from app.infra.repositories import UploadRepository
+from app.infra.storage import LocalFileStorage
 
 
 class TestUploadEndpoint:
@@ -119,3 +127,100 @@ class TestUploadEndpoint:
         data = response.json()
         assert data["upload"]["fileName"] == "test.mp3"
         assert data["upload"]["contentType"] == "audio/mpeg"
+
+
+class TestUploadServiceBatch:
+    """批量上传服务测试类"""
+
+    @staticmethod
+    def _upload_file(name, content_type, content=b"audio"):
+        return UploadFile(
+            filename=name,
+            file=BytesIO(content),
+            headers=Headers({"content-type": content_type}),
+        )
+
+    def test_upload_files_persists_all_records(self, test_db, tmp_path):
+        """测试批量上传在一个事务中写入全部记录"""
+
+        repo = UploadRepository(test_db)
+        service = UploadService(LocalFileStorage(str(tmp_path), str(tmp_path)), repo)
+        files = [
+            self._upload_file("a.wav", "audio/wav"),
+            self._upload_file("b.mp3", "audio/mpeg"),
+        ]
+
+        uploads = asyncio.run(service.upload_files(files))
+
+        assert [u.fileName for u in uploads] == ["a.wav", "b.mp3"]
+        assert repo.existing_ids(u.id for u in uploads) == {u.id for u in uploads}
+
+    def test_upload_files_rejects_whole_batch(self, test_db, tmp_path):
+        """测试任一文件被拒绝时删除已保存文件且不写入记录"""
+
+        repo = UploadRepository(test_db)
+        service = UploadService(LocalFileStorage(str(tmp_path), str(tmp_path)), repo)
+        files = [
+            self._upload_file("a.wav", "audio/wav"),
+            self._upload_file("b.txt", "text/plain"),
+        ]
+
+        with pytest.raises(HTTPException):
+            asyncio.run(service.upload_files(files))
+
+        assert os.listdir(tmp_path) == []
+        assert repo.list() == []
+
+    def test_save_upload_removes_partial_file_on_read_error(self, tmp_path):
+        """测试读取上传内容中断时删除已写入的部分文件"""
+
+        class BrokenFile(BytesIO):
+            def read(self, size=-1):
+                if self.tell() > 0:
+                    raise OSError("client disconnected")
+                return super().read(4)
+
+        storage = LocalFileStorage(str(tmp_path), str(tmp_path))
+        upload = UploadFile(
+            filename="a.wav",
+            file=BrokenFile(b"audio-data"),
+            headers=Headers({"content-type": "audio/wav"}),
+        )
+
+        with pytest.raises(OSError):
+            asyncio.run(storage.save_upload(upload))
+
+        assert os.listdir(tmp_path) == []
+
+    def test_storage_resolves_upload_path_without_scanning(self, tmp_path):
+        """测试按文件ID定位与删除上传文件：文件名前缀相同的其它文件不受影响"""
+        storage = LocalFileStorage(str(tmp_path), str(tmp_path))
+        (tmp_path / "abc.wav").write_bytes(b"a")
+        (tmp_path / "abc-other.wav").write_bytes(b"b")
+        (tmp_path / "def.mp3").write_bytes(b"c")
+
+        assert storage.get_file_path("abc") == str(tmp_path / "abc.wav")
+        assert storage.get_file_path("missing") is None
+        assert storage.delete_file("def", "song.mp3") is True
+        assert storage.delete_file("abc") is True
+        assert storage.delete_file("abc") is False
+        assert sorted(os.listdir(tmp_path)) == ["abc-other.wav"]
+
+    def test_save_upload_oversize_leaves_no_file(self, tmp_path, monkeypatch):
+        """测试未声明大小的超限上传不在上传目录留下任何文件（含临时文件）"""
+        monkeypatch.setattr("app.infra.storage.MAX_UPLOAD_BYTES", 8)
+        monkeypatch.setattr("app.infra.storage.UPLOAD_CHUNK_SIZE", 4)
+        storage = LocalFileStorage(str(tmp_path), str(tmp_path))
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(
+                storage.save_upload(self._upload_file("a.wav", "audio/wav", b"x" * 16))
+            )
+
+        assert exc_info.value.status_code == 413
+        assert os.listdir(tmp_path) == []
+        file_id, file_path, _, size = asyncio.run(
+            storage.save_upload(self._upload_file("b.wav", "audio/wav", b"x" * 8))
+        )
+        assert size == 8
+        assert os.listdir(tmp_path) == [f"{file_id}.wav"]
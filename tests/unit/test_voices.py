@@ -3,8 +3,13 @@
 测试 /voices 端点的功能
 """
 
+import asyncio
+from unittest.mock import MagicMock
+
 import pytest
 from fastapi import status
+from app.application.voice_service import VoiceService
+from app.infra.cache import TtlCache
 from app.models import oc8r
 from app.infra.repositories import UploadRepository, VoiceRepository
 import uuid
@@ -85,6 +90,59 @@ class TestVoiceEndpoint:
         response = test_client.post("/api/v1/voices", json=voice_data)
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
 
+    def test_create_voices_batch_success(self, test_client, test_db, sample_upload):
+        """测试批量创建音色成功"""
+        upload_repo = UploadRepository(test_db)
+        upload_repo.add(sample_upload)
+
+        voices_data = [
+            {"name": f"Batch Voice {i}", "uploadId": sample_upload.id} for i in range(3)
+        ]
+        response = test_client.post("/api/v1/voices:batch", json=voices_data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert [v["name"] for v in data["voices"]] == [
+            "Batch Voice 0",
+            "Batch Voice 1",
+            "Batch Voice 2",
+        ]
+        assert len(VoiceRepository(test_db).list()) == 3
+
+    def test_create_voices_batch_rejects_whole_batch(
+        self, test_client, test_db, sample_upload, sample_voice
+    ):
+        """测试批量创建时任一校验失败则整批不写入"""
+        upload_repo = UploadRepository(test_db)
+        upload_repo.add(sample_upload)
+        VoiceRepository(test_db).add(sample_voice)
+
+        # 名称与已有音色重复
+        voices_data = [
+            {"name": "New Voice", "uploadId": sample_upload.id},
+            {"name": sample_voice.name, "uploadId": sample_upload.id},
+        ]
+        response = test_client.post("/api/v1/voices:batch", json=voices_data)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        # uploadId 不存在
+        voices_data = [
+            {"name": "New Voice", "uploadId": sample_upload.id},
+            {"name": "Other Voice", "uploadId": "invalid-upload-id"},
+        ]
+        response = test_client.post("/api/v1/voices:batch", json=voices_data)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        # 批内名称重复
+        voices_data = [
+            {"name": "New Voice", "uploadId": sample_upload.id},
+            {"name": "New Voice", "uploadId": sample_upload.id},
+        ]
+        response = test_client.post("/api/v1/voices:batch", json=voices_data)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        assert len(VoiceRepository(test_db).list()) == 1
+
     def test_list_voices_success(
         self, test_client, test_db, sample_upload, sample_voice
     ):
@@ -127,6 +185,42 @@ class TestVoiceEndpoint:
         data = response.json()
         assert len(data["voices"]) == 2
 
+    def test_list_voices_cursor_pagination(self, test_client, test_db, sample_upload):
+        """测试音色列表游标分页"""
+        upload_repo = UploadRepository(test_db)
+        voice_repo = VoiceRepository(test_db)
+        upload_repo.add(sample_upload)
+
+        for i in range(5):
+            voice_repo.add(
+                oc8r.Voice(
+                    id=str(uuid.uuid4()),
+                    name=f"Voice {i}",
+                    uploadId=sample_upload.id,
+                    createdAt=f"2024-01-01T00:00:0{i}",
+                    updatedAt=f"2024-01-01T00:00:0{i}",
+                )
+            )
+
+        names = []
+        cursor = None
+        while True:
+            url = "/api/v1/voices?limit=2"
+            if cursor:
+                url += f"&cursor={cursor}"
+            response = test_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            names.extend(v["name"] for v in data["voices"])
+            cursor = data["nextCursor"]
+            if not cursor:
+                break
+
+        assert names == [f"Voice {i}" for i in range(4, -1, -1)]
+
+        response = test_client.get("/api/v1/voices?cursor=not-a-cursor")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_get_voice_success(self, test_client, test_db, sample_upload, sample_voice):
         """测试获取单个音色成功"""
         # 先创建记录
@@ -143,6 +237,25 @@ class TestVoiceEndpoint:
         assert data["voice"]["id"] == sample_voice.id
         assert data["voice"]["name"] == sample_voice.name
 
+    def test_get_voice_upload_joins_upload(self, test_db, sample_upload, sample_voice):
+        """测试单条 JOIN 查询音色关联的上传记录"""
+        upload_repo = UploadRepository(test_db)
+        voice_repo = VoiceRepository(test_db)
+        upload_repo.add(sample_upload)
+        voice_repo.add(sample_voice)
+
+        assert voice_repo.get_voice_upload(sample_voice.id) == (
+            sample_upload.id,
+            sample_upload.fileName,
+        )
+        assert voice_repo.get_voice_upload("non-existent-id") is None
+
+        upload_repo.delete(sample_upload.id)
+        assert voice_repo.get_voice_upload(sample_voice.id) == (
+            sample_upload.id,
+            None,
+        )
+
     def test_get_voice_not_found(self, test_client):
         """测试获取不存在的音色"""
         response = test_client.get("/api/v1/voices/non-existent-id")
@@ -171,3 +284,80 @@ class TestVoiceEndpoint:
         """测试删除不存在的音色"""
         response = test_client.delete("/api/v1/voices/non-existent-id")
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestVoiceServiceCache:
+    """音色查询结果缓存测试类"""
+
+    def test_ttl_cache_expires_and_evicts(self, monkeypatch):
+        """测试缓存条目过期与按 LRU 淘汰"""
+        now = [100.0]
+        monkeypatch.setattr("app.infra.cache.time.monotonic", lambda: now[0])
+        cache = TtlCache(max_entries=2, ttl=30)
+
+        cache.put("a", 1, cache.generation)
+        cache.put("b", 2, cache.generation)
+        assert cache.get("a") == 1
+        cache.put("c", 3, cache.generation)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+        now[0] += 30
+        assert cache.get("a") is None
+
+        # 查询期间发生失效，旧结果不写入
+        generation = cache.generation
+        cache.clear()
+        cache.put("d", 4, generation)
+        assert cache.get("d") is None
+
+    def test_get_and_list_cached_until_delete(self, test_db, sample_upload):
+        """测试详情与列表命中缓存，删除音色后失效"""
+        UploadRepository(test_db).add(sample_upload)
+        service = VoiceService(
+            VoiceRepository(test_db), MagicMock(), UploadRepository(test_db)
+        )
+        request = oc8r.CreateVoiceRequest(name="Cached", uploadId=sample_upload.id)
+
+        async def scenario():
+            voice = await service.create_voice(request)
+            assert await service.get_voice(voice.id) == voice
+            assert [v.id for v in await service.list_voices()] == [voice.id]
+
+            # 绕过服务直接修改数据库，缓存未失效时仍返回旧结果
+            test_db.execute("DELETE FROM voices WHERE id = ?", (voice.id,))
+            test_db.commit()
+            assert await service.get_voice(voice.id) == voice
+            assert len(await service.list_voices()) == 1
+
+            VoiceRepository(test_db).add(voice)
+            assert await service.delete_voice(voice.id) is True
+            assert await service.get_voice(voice.id) is None
+            assert await service.list_voices() == []
+
+        asyncio.run(scenario())
+
+    def test_delete_voices_batch(self, test_db, sample_upload):
+        """测试批量删除音色：忽略不存在的ID并删除关联文件"""
+        UploadRepository(test_db).add(sample_upload)
+        storage = MagicMock()
+        service = VoiceService(
+            VoiceRepository(test_db), storage, UploadRepository(test_db)
+        )
+
+        async def scenario():
+            first, second = await service.create_voices_bulk(
+                [
+                    oc8r.CreateVoiceRequest(name="A", uploadId=sample_upload.id),
+                    oc8r.CreateVoiceRequest(name="B", uploadId=sample_upload.id),
+                ]
+            )
+            deleted = await service.delete_voices(
+                [second.id, "non-existent-id", first.id, second.id]
+            )
+            assert deleted == [second.id, first.id]
+            assert await service.list_voices() == []
+            assert await service.delete_voices(["non-existent-id"]) == []
+
+        asyncio.run(scenario())
+        assert storage.delete_file.call_count == 2
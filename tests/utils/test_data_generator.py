@@ -32,6 +32,7 @@ from app.application.tts_strategies import (
     ReferenceStrategy,
     VectorStrategy,
     TextStrategy,
+    TtsStrategyFactory,
 )
 from app.infra.repositories import TtsJobRepository, VoiceRepository, UploadRepository
 from app.infra.storage import LocalFileStorage
@@ -355,7 +356,10 @@ class TestDataGenerator:
         if file_service is None:
             file_service = Mock(spec=FileService)
 
-        return TtsTaskProcessor(voice_repo, upload_repo, storage, client, file_service)
+        strategy_factory = TtsStrategyFactory(
+            client, voice_repo, upload_repo, storage, file_service
+        )
+        return TtsTaskProcessor(strategy_factory)
 
     # ==================== 策略模式测试数据生成 ====================
 
@@ -458,6 +462,9 @@ class TestDataGenerator:
             voices = [TestDataGenerator.create_voice()]
 
         voice_repo.get.return_value = voices[0] if voices else None
+        voice_repo.get_voice_upload.return_value = (
+            (voices[0].uploadId, "audio.wav") if voices else None
+        )
         voice_repo.list.return_value = voices
         voice_repo.add.return_value = None
         voice_repo.delete.return_value = None
@@ -498,6 +505,7 @@ class TestDataGenerator:
             file_path = "/test/path/audio.wav"
 
         storage.get_file_path.return_value = file_path if file_exists else None
+        storage.upload_path.return_value = file_path
         storage.save_upload.return_value = (
             str(uuid.uuid4()),
             file_path,
@@ -540,7 +548,7 @@ class TestDataGenerator:
                 "format": "wav",
             }
 
-        file_service.save_audio_result.return_value = result
+        file_service.save_audio_result_stream.return_value = result
         file_service.get_audio_file_path.return_value = "/test/path/audio.wav"
         file_service.delete_audio_file.return_value = True
 